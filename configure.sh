@@ -18,3 +18,6 @@ else
   echo "..."
   echo "Done! To test run: python src/MPX/pysidex/src/demo.py"
 fi
+
+# Bundled icons as a compiled Qt resource, see QIconRegistry
+. venv/bin/activate && pyside6-rcc --binary src/MPX/icons.qrc -o src/MPX/icons.rcc
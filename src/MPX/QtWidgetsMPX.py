@@ -1,143 +1,2583 @@
 #!/usr/bin/env python3
+import bisect
+import collections
+import concurrent.futures
+import contextlib
+import inspect
+import itertools
+import json
 import logging
+import multiprocessing
 import os
+import re
 import sys
+import threading
 import time
+import traceback
+import warnings
 
+import shiboken6
 from PySide6 import QtCore, QtGui, QtWidgets
 
 SRC_DIR = os.path.dirname(os.path.abspath(__file__))
-sys.path.append(SRC_DIR)
-sys.path.append(os.path.join(SRC_DIR, 'pysidex/src/'))
 
-from PySideX import QtWidgetsX
+try:
+    from PySideX import QtWidgetsX
+except ImportError:
+    # Not installed, use the tree cloned by configure.sh
+    sys.path.append(os.path.join(SRC_DIR, 'pysidex', 'src'))
+    from PySideX import QtWidgetsX
 from __feature__ import snake_case
 
 
+class _QStyleSheetCompiler(object):
+    """Parses style sheets into rule tables and memoizes generated sheets
+
+    Rule tables are cached by the source sheet itself and generated
+    sheets by a caller supplied key, both in small LRU caches shared by
+    every window.
+    """
+
+    def __init__(self, cache_size: int = 32) -> None:
+        self.__cache_size = cache_size
+        self.__rules = collections.OrderedDict()
+        self.__sheets = collections.OrderedDict()
+
+    # Properties that the palette theming mode can draw without a sheet
+    palette_properties = (
+        'background', 'background-color', 'border', 'border-radius',
+        'border-top-left-radius', 'border-top-right-radius',
+        'border-bottom-right-radius', 'border-bottom-left-radius',
+        'margin', 'padding')
+
+    def apply(self, widget: QtWidgets.QWidget, style_sheet: str) -> bool:
+        """Set the sheet only if it differs from the current one
+
+        Returns True when the widget was re-polished.
+        """
+        if widget.style_sheet() == style_sheet:
+            return False
+        widget.set_style_sheet(style_sheet)
+        return True
+
+    @staticmethod
+    def color(value: str) -> QtGui.QColor:
+        """QColor of a sheet colour value, or None if it is not a plain colour
+
+        Supports 'rgb()', 'rgba()', hex values and colour names. As in Qt,
+        an rgba() alpha up to 1 is a fraction, and 0-255 above.
+        """
+        value = value.strip()
+        if value.startswith(('rgb(', 'rgba(')) and value.endswith(')'):
+            channels = [
+                x.strip() for x in value[value.find('(') + 1:-1].split(',')]
+            try:
+                rgb = [int(x) for x in channels[:3]]
+                alpha = 255
+                if len(channels) == 4:
+                    alpha = float(channels[3])
+                    alpha = round(min(
+                        alpha * 255 if alpha <= 1 else alpha, 255))
+            except ValueError:
+                return None
+            return QtGui.QColor(*rgb, alpha) if len(rgb) == 3 else None
+
+        color = QtGui.QColor(value)
+        return color if color.is_valid() else None
+
+    def compile(self, key: tuple, builder: callable) -> str:
+        """Return the memoized sheet for key, building it on a miss"""
+        if key in self.__sheets:
+            self.__sheets.move_to_end(key)
+            return self.__sheets[key]
+
+        style_sheet = builder()
+        self.__sheets[key] = style_sheet
+        if len(self.__sheets) > self.__cache_size:
+            self.__sheets.popitem(last=False)
+        return style_sheet
+
+    def declarations(self, style_sheet: str, selector: str) -> str:
+        """Declarations of the last rule whose selector contains selector"""
+        for rule_selector, declarations in reversed(self.rules(style_sheet)):
+            if selector in rule_selector:
+                return declarations
+        return ''
+
+    def diff(self, old_style_sheet: str, new_style_sheet: str) -> frozenset:
+        """Selectors whose rules were added, removed or changed"""
+        def table(style_sheet: str) -> dict:
+            rules = collections.defaultdict(list)
+            for selector, declarations in self.rules(style_sheet):
+                rules[selector].append(declarations)
+            return rules
+
+        old, new = table(old_style_sheet), table(new_style_sheet)
+        return frozenset(
+            x for x in old.keys() | new.keys() if old.get(x) != new.get(x))
+
+    @staticmethod
+    def matches(widget: QtWidgets.QWidget, selector: str) -> bool:
+        """Whether the rightmost part of the selector can select widget
+
+        Ancestors, pseudo-states and properties are not checked, so a
+        selector may match a few widgets too many, but never too few.
+        """
+        for part in selector.split(','):
+            words = part.replace('>', ' ').split()
+            if not words:
+                continue
+            target = words[-1].split('[')[0].split(':')[0]
+            class_name, _, object_name = target.partition('#')
+            if object_name and widget.object_name() != object_name:
+                continue
+            if class_name.startswith('.'):
+                if widget.meta_object().class_name() != class_name[1:]:
+                    continue
+            elif class_name not in ('', '*') and not widget.inherits(
+                    class_name):
+                continue
+            return True
+        return False
+
+    def palette_style(self, declarations: str) -> tuple:
+        """Palette form of a panel rule as (color, radii, margins)
+
+        Radii are ordered top-left, top-right, bottom-right, bottom-left and
+        margins left, top, right, bottom. Returns None when the rule uses
+        anything the palette theming mode cannot draw, so the caller falls
+        back to a style sheet.
+        """
+        properties = {}
+        for declaration in declarations.split(';'):
+            if ':' in declaration:
+                name, value = declaration.split(':', 1)
+                properties[name.strip()] = value.strip()
+
+        if any(x not in self.palette_properties for x in properties):
+            return None
+        if properties.get('border', '0px') not in ('0', '0px', 'none'):
+            return None
+
+        color = self.color(properties.get(
+            'background-color', properties.get('background', 'transparent')))
+        if color is None:
+            return None
+
+        def pixels(value: str) -> list:
+            try:
+                return [int(x.replace('px', '')) for x in value.split()]
+            except ValueError:
+                return None
+
+        radius = pixels(properties.get('border-radius', '0'))
+        if not radius:
+            return None
+        radii = []
+        for corner in ('top-left', 'top-right', 'bottom-right', 'bottom-left'):
+            value = pixels(properties.get(
+                f'border-{corner}-radius', str(radius[0])))
+            if not value:
+                return None
+            radii.append(value[0])
+
+        # Shorthand of 1 to 4 values: top, right, bottom, left
+        margin = pixels(properties.get('margin', '0'))
+        if not margin or len(margin) > 4:
+            return None
+        if len(margin) == 1:
+            margin *= 4
+        elif len(margin) == 2:
+            margin *= 2
+        elif len(margin) == 3:
+            margin.append(margin[1])
+        top, right, bottom, left = margin
+
+        return color, tuple(radii), (left, top, right, bottom)
+
+    def properties(self, style_sheet: str) -> dict:
+        """Names of the properties each selector of the sheet declares"""
+        properties = collections.defaultdict(set)
+        for selector, declarations in self.rules(style_sheet):
+            properties[selector].update(
+                x.split(':', 1)[0].strip()
+                for x in declarations.split(';') if ':' in x)
+        return properties
+
+    def rules(self, style_sheet: str) -> tuple:
+        """Rule table of the sheet as (selector, declarations) pairs"""
+        # Keyed by the sheet itself, a hash collision would return the
+        # rules of another sheet
+        key = style_sheet
+        if key in self.__rules:
+            self.__rules.move_to_end(key)
+            return self.__rules[key]
+
+        rules = []
+        style_sheet = re.sub(r'/\*.*?\*/', '', style_sheet, flags=re.DOTALL)
+        for block in style_sheet.split('}'):
+            if '{' not in block:
+                continue
+            selector, body = block.split('{', 1)
+            declarations = [x.strip() for x in body.split(';') if x.strip()]
+            rules.append((
+                selector.strip(),
+                ''.join(f'{x}; ' for x in declarations)))
+
+        self.__rules[key] = tuple(rules)
+        if len(self.__rules) > self.__cache_size:
+            self.__rules.popitem(last=False)
+        return self.__rules[key]
+
+    @staticmethod
+    def scope(selector: str, attribute: str) -> str:
+        """Selector narrowed by a '[name="value"]' attribute
+
+        The attribute is added to the rightmost part of each selector of
+        the list, before its pseudo-states and sub-controls.
+        """
+        parts = []
+        for part in selector.split(','):
+            words = part.strip().split(' ')
+            target = words[-1]
+            position = len(target)
+            depth = 0
+            for index, character in enumerate(target):
+                depth += {'[': 1, ']': -1}.get(character, 0)
+                if character == ':' and not depth:
+                    position = index
+                    break
+            words[-1] = target[:position] + attribute + target[position:]
+            parts.append(' '.join(words))
+        return ', '.join(parts)
+
+
+_style_sheet_compiler = _QStyleSheetCompiler()
+
+
+class _QPanelFrame(QtWidgets.QWidget):
+    """Panel container that can paint itself from the palette
+
+    In style sheet mode it draws its sheet like a plain QWidget. In palette
+    mode it fills a rounded rect with the palette window colour.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__radii = None
+        self.__margins = (0, 0, 0, 0)
+
+    def paint_event(self, event: QtGui.QPaintEvent) -> None:
+        painter = QtGui.QPainter(self)
+        if self.__radii is None:
+            option = QtWidgets.QStyleOption()
+            option.init_from(self)
+            self.style().draw_primitive(
+                QtWidgets.QStyle.PE_Widget, option, painter, self)
+            return
+
+        left, top, right, bottom = self.__margins
+        rect = QtCore.QRectF(self.rect()).adjusted(left, top, -right, -bottom)
+        top_left, top_right, bottom_right, bottom_left = self.__radii
+
+        path = QtGui.QPainterPath()
+        path.move_to(rect.left() + top_left, rect.top())
+        path.line_to(rect.right() - top_right, rect.top())
+        path.arc_to(rect.right() - top_right * 2, rect.top(),
+                    top_right * 2, top_right * 2, 90, -90)
+        path.line_to(rect.right(), rect.bottom() - bottom_right)
+        path.arc_to(rect.right() - bottom_right * 2,
+                    rect.bottom() - bottom_right * 2,
+                    bottom_right * 2, bottom_right * 2, 0, -90)
+        path.line_to(rect.left() + bottom_left, rect.bottom())
+        path.arc_to(rect.left(), rect.bottom() - bottom_left * 2,
+                    bottom_left * 2, bottom_left * 2, 270, -90)
+        path.line_to(rect.left(), rect.top() + top_left)
+        path.arc_to(rect.left(), rect.top(),
+                    top_left * 2, top_left * 2, 180, -90)
+
+        painter.set_render_hint(QtGui.QPainter.Antialiasing)
+        painter.set_pen(QtCore.Qt.NoPen)
+        painter.set_brush(self.palette().color(QtGui.QPalette.Window))
+        painter.draw_path(path)
+
+    def set_palette_style(self, style: tuple) -> None:
+        """Paint from (color, radii, margins), or from the sheet if None"""
+        if style is None:
+            if self.__radii is not None:
+                self.__radii = None
+                self.update()
+            return
+
+        color, self.__radii, self.__margins = style
+        _style_sheet_compiler.apply(self, '')
+        if self.palette().color(QtGui.QPalette.Window) != color:
+            palette = self.palette()
+            palette.set_color(QtGui.QPalette.Window, color)
+            self.set_palette(palette)
+        self.update()
+
+
+class _QShadowFrame(QtWidgets.QWidget):
+    """Paints a blurred shadow around one of its child widgets
+
+    The shadow is rendered once per (radius, colour, device pixel ratio)
+    into a nine-slice pixmap shared by every frame. Repaints only draw the
+    nine slices, instead of rendering and blurring the child offscreen as
+    QGraphicsDropShadowEffect does.
+    """
+    __shadow_cache = collections.OrderedDict()
+    __shadow_cache_size = 8
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__target = None
+        self.__blur_radius = 50
+        self.__color = QtGui.QColor(10, 10, 10, 100)
+
+    def blur_radius(self) -> int:
+        """Distance the shadow reaches outside the target"""
+        return self.__blur_radius
+
+    def event_filter(self, watched: QtCore.QObject, event: QtCore.QEvent
+                     ) -> bool:
+        if event.type() in (QtCore.QEvent.Move, QtCore.QEvent.Resize,
+                            QtCore.QEvent.Show, QtCore.QEvent.Hide):
+            self.update()
+        return False
+
+    def paint_event(self, event: QtGui.QPaintEvent) -> None:
+        painter = QtGui.QPainter(self)
+        option = QtWidgets.QStyleOption()
+        option.init_from(self)
+        self.style().draw_primitive(
+            QtWidgets.QStyle.PE_Widget, option, painter, self)
+
+        if self.__target is None or not self.__target.is_visible():
+            return
+
+        radius = self.__blur_radius
+        ratio = self.device_pixel_ratio_f()
+        pixmap = self.__shadow_pixmap(radius, self.__color, ratio)
+
+        # The pixmap is a (4r + 1) square: corners are 2r, edges and
+        # centre are the one pixel wide middle row and column
+        target = QtCore.QRectF(self.__target.geometry()).adjusted(
+            -radius, -radius, radius, radius)
+        corner = min(radius * 2, target.width() / 2, target.height() / 2)
+        xs = (target.left(), target.left() + corner,
+              target.right() - corner, target.right())
+        ys = (target.top(), target.top() + corner,
+              target.bottom() - corner, target.bottom())
+        source_corner = corner * ratio
+        source_end = (radius * 4 + 1) * ratio
+        source_xs = (0, source_corner,
+                     source_end - source_corner, source_end)
+
+        for row in range(3):
+            for column in range(3):
+                painter.draw_pixmap(
+                    QtCore.QRectF(
+                        xs[column], ys[row],
+                        xs[column + 1] - xs[column], ys[row + 1] - ys[row]),
+                    pixmap,
+                    QtCore.QRectF(
+                        source_xs[column], source_xs[row],
+                        source_xs[column + 1] - source_xs[column],
+                        source_xs[row + 1] - source_xs[row]))
+
+    def set_shadow_target(self, widget: QtWidgets.QWidget) -> None:
+        """Child widget that casts the shadow, or None for no shadow"""
+        if self.__target is not None:
+            self.__target.remove_event_filter(self)
+        self.__target = widget
+        if self.__target is not None:
+            self.__target.install_event_filter(self)
+        self.update()
+
+    def __shadow_pixmap(
+            self, radius: int, color: QtGui.QColor, ratio: float
+            ) -> QtGui.QPixmap:
+        key = (radius, color.rgba(), ratio)
+        if key in self.__shadow_cache:
+            self.__shadow_cache.move_to_end(key)
+            return self.__shadow_cache[key]
+
+        # Blur a (2r + 1) square in the middle of a (4r + 1) square once,
+        # the same way Qt blurs the effect
+        side = radius * 4 + 1
+        scene = QtWidgets.QGraphicsScene()
+        item = scene.add_rect(
+            QtCore.QRectF(radius, radius, radius * 2 + 1, radius * 2 + 1),
+            QtGui.QPen(QtCore.Qt.NoPen), QtGui.QBrush(color))
+        blur = QtWidgets.QGraphicsBlurEffect()
+        blur.set_blur_radius(radius)
+        blur.set_blur_hints(QtWidgets.QGraphicsBlurEffect.QualityHint)
+        item.set_graphics_effect(blur)
+
+        image = QtGui.QImage(
+            round(side * ratio), round(side * ratio),
+            QtGui.QImage.Format_ARGB32_Premultiplied)
+        image.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(image)
+        scene.render(
+            painter, QtCore.QRectF(image.rect()),
+            QtCore.QRectF(0, 0, side, side))
+        painter.end()
+
+        pixmap = QtGui.QPixmap.from_image(image)
+        self.__shadow_cache[key] = pixmap
+        if len(self.__shadow_cache) > self.__shadow_cache_size:
+            self.__shadow_cache.popitem(last=False)
+        return pixmap
+
+
+class _QSnapshotFrame(QtWidgets.QWidget):
+    """Paints a pixmap, and records when each frame was painted"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__pixmap = QtGui.QPixmap()
+        self.__frame_times = []
+
+    def frame_times(self) -> list:
+        """Milliseconds between consecutive paints since the last pixmap"""
+        return [(y - x) * 1000 for x, y in zip(
+            self.__frame_times, self.__frame_times[1:])]
+
+    def paint_event(self, event: QtGui.QPaintEvent) -> None:
+        self.__frame_times.append(time.perf_counter())
+        painter = QtGui.QPainter(self)
+        painter.draw_pixmap(0, 0, self.__pixmap)
+
+    def set_pixmap(self, pixmap: QtGui.QPixmap) -> None:
+        self.__pixmap = pixmap
+        self.__frame_times = []
+        self.resize(pixmap.device_independent_size().to_size())
+
+
+class _QInstrumentationHud(QtWidgets.QWidget):
+    """Debug overlay with the event timings of a QEventInstrumentation"""
+
+    def __init__(self, instrumentation, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__instrumentation = instrumentation
+        self.__lines = []
+        self.set_attribute(QtCore.Qt.WA_TransparentForMouseEvents)
+        self.set_font(QtGui.QFontDatabase.system_font(
+            QtGui.QFontDatabase.FixedFont))
+
+        self.__timer = QtCore.QTimer(self)
+        self.__timer.set_interval(500)
+        self.__timer.timeout.connect(self.refresh)
+
+    def hide_event(self, event: QtGui.QHideEvent) -> None:
+        self.__timer.stop()
+
+    def paint_event(self, event: QtGui.QPaintEvent) -> None:
+        painter = QtGui.QPainter(self)
+        painter.set_render_hint(QtGui.QPainter.Antialiasing)
+        painter.set_pen(QtCore.Qt.NoPen)
+        painter.set_brush(QtGui.QColor(0, 0, 0, 180))
+        painter.draw_rounded_rect(self.rect(), 6, 6)
+        painter.set_pen(QtGui.QColor(255, 255, 255))
+        painter.draw_text(
+            self.rect().adjusted(8, 6, -8, -6), QtCore.Qt.AlignLeft,
+            '\n'.join(self.__lines))
+
+    def refresh(self) -> None:
+        """Read the statistics again and move to the top right corner"""
+        self.__lines = [
+            'widget   event     count     p50     p90     p99     max']
+        for name, kinds in sorted(self.__instrumentation.stats().items()):
+            for kind, stats in sorted(kinds.items()):
+                self.__lines.append(
+                    f'{name:<9}{kind:<8}{stats["count"]:>7}'
+                    f'{stats["p50"]:>8.2f}{stats["p90"]:>8.2f}'
+                    f'{stats["p99"]:>8.2f}{stats["max"]:>8.2f}')
+
+        metrics = self.font_metrics()
+        self.resize(
+            max(metrics.horizontal_advance(x) for x in self.__lines) + 16,
+            metrics.line_spacing() * len(self.__lines) + 12)
+        if self.parent_widget() is not None:
+            self.move(max(
+                0, self.parent_widget().width() - self.width() - 8), 8)
+        self.raise_()
+        self.update()
+
+    def set_instrumentation(self, instrumentation) -> None:
+        self.__instrumentation = instrumentation
+
+    def show_event(self, event: QtGui.QShowEvent) -> None:
+        self.refresh()
+        self.__timer.start()
+
+
 class _QOverlaySidePanel(QtWidgets.QWidget):
-    """..."""
+    """Backdrop that floats the side panel over the window in adaptive mode
+
+    The panel widget is never reparented: it is taken out of its layout
+    and raised above this backdrop, which paints the panel background and
+    shadow and closes the panel when the rest of the window is clicked.
+    """
     panel_closed_signal = QtCore.Signal(object)
+    __instrumentation = None
+
+    def __init__(self, widget: QtWidgets.QWidget, *args, **kwargs) -> None:
+        super().__init__(widget.parent_widget(), *args, **kwargs)
+        # Param
+        self.__panel_widget = widget
+        self.__panel_widget_box = self.__panel_widget.parent().layout()
+        self.__panel_widget_index = 0
+        self.__panel_widget_stretch = 0
+        self.__toplevel = self.__panel_widget.window()
+
+        # Settings
+        self.hide()
+
+        # Main layout
+        self.__main_box = QtWidgets.QVBoxLayout()
+        self.__main_box.set_contents_margins(0, 0, 0, 0)
+        self.__main_box.set_spacing(0)
+        self.set_layout(self.__main_box)
+
+        self.__main_frame = _QShadowFrame()
+        self.__main_frame.set_contents_margins(0, 0, 0, 0)
+        self.__main_box.add_widget(self.__main_frame)
+
+        self.__horizontal_frame_box = QtWidgets.QHBoxLayout()
+        self.__horizontal_frame_box.set_contents_margins(0, 0, 0, 0)
+        self.__horizontal_frame_box.set_spacing(0)
+        self.__main_frame.set_layout(self.__horizontal_frame_box)
+
+        # Panel background
+        self.__panel_background = _QPanelFrame()
+        self.__horizontal_frame_box.add_widget(self.__panel_background)
+
+        # Panel shadow
+        self.__shadow_effect = None
+        self.set_cached_shadow_enabled(True)
+
+        class CloseArea(QtWidgets.QWidget):
+            def __init__(self, parent_win) -> None:
+                super().__init__()
+                self.__parent = parent_win
+
+            def mouse_press_event(self, ev: QtGui.QMouseEvent) -> None:
+                if ev.button() == QtCore.Qt.LeftButton and self.under_mouse():
+                    self.__parent.close_panel()
+
+        self.__close_area = CloseArea(self)
+        self.__horizontal_frame_box.add_widget(self.__close_area)
+        self.__close_shortcut = QtGui.QShortcut(
+            QtGui.QKeySequence(QtCore.Qt.Key_Escape), self)
+        self.__close_shortcut.activated.connect(self.close_panel)
+
+        # Slide animation, played on a snapshot so that the live panel is
+        # not laid out and painted on every frame
+        self.__snapshot = _QSnapshotFrame(self)
+        self.__snapshot.hide()
+        self.__is_opening = False
+        self.__animation = QtCore.QVariantAnimation(self)
+        self.__animation.set_duration(180)
+        self.__animation.set_easing_curve(QtCore.QEasingCurve.OutCubic)
+        self.__animation.valueChanged.connect(
+            lambda x: self.__snapshot.move(x, 0))
+        self.__animation.finished.connect(self.__on_animation_finished)
+
+    def animation_frame_times(self) -> list:
+        return self.__snapshot.frame_times()
+
+    def close_panel(self, animated: bool = True) -> None:
+        if not self.is_visible():
+            return
+
+        if self.__animation.state() == QtCore.QAbstractAnimation.Running:
+            if not self.__is_opening and animated:
+                return
+
+            # Jump to the end, which already closes a closing panel
+            self.__animation.stop()
+            self.__on_animation_finished()
+            if not self.__is_opening:
+                return
+
+        if animated and self.__animation.duration() > 0:
+            self.__play_animation(opening=False)
+        else:
+            self.__close()
+
+    def __close(self) -> None:
+        self.__panel_widget.hide()
+        self.__panel_widget_box.insert_widget(
+            self.__panel_widget_index, self.__panel_widget,
+            self.__panel_widget_stretch)
+        self.hide()
+        self.panel_closed_signal.emit('panel-closed-signal')
+
+    def context_menu_event(self, event):
+        # Looked up every time, the toplevel may have set another menu
+        context_menu = self.__toplevel.quick_context_menu()
+        if context_menu:
+            context_menu.exec(event.global_pos())
+
+    def event(self, event: QtCore.QEvent) -> bool:
+        if self.__instrumentation is None:
+            return super().event(event)
+        return self.__instrumentation.time_event(
+            'overlay', event, super().event)
+
+    def open_panel(self) -> None:
+        if self.is_visible():
+            return
+
+        # Out of the layout, but still a child of the same parent
+        self.__panel_widget_index = self.__panel_widget_box.index_of(
+            self.__panel_widget)
+        self.__panel_widget_stretch = self.__panel_widget_box.stretch(
+            self.__panel_widget_index)
+        self.__panel_widget_box.remove_widget(self.__panel_widget)
+
+        self.__toplevel.set_left_control_buttons_visible(False)
+        self.set_geometry(self.parent_widget().rect())
+        self.show()
+        self.raise_()
+        self.__panel_widget.show()
+        self.__panel_widget.raise_()
+        self.__update_panel_widget_geometry()
+
+        if self.__animation.duration() > 0:
+            self.__play_animation(opening=True)
+
+    def panel_background(self) -> QtWidgets.QWidget:
+        return self.__panel_background
+
+    def resize_event(self, event: QtGui.QResizeEvent) -> None:
+        if self.is_visible():
+            self.__update_panel_widget_geometry()
+
+    def set_animation_duration(self, msecs: int) -> None:
+        self.__animation.set_duration(max(0, msecs))
+
+    def set_animation_easing_curve(self, easing: QtCore.QEasingCurve) -> None:
+        self.__animation.set_easing_curve(easing)
+
+    def set_cached_shadow_enabled(self, enabled: bool) -> None:
+        # Nine-slice shadow, or the QGraphicsDropShadowEffect fallback
+        if enabled:
+            self.__panel_background.set_graphics_effect(None)
+            self.__shadow_effect = None
+            self.__main_frame.set_shadow_target(self.__panel_background)
+            return
+
+        self.__main_frame.set_shadow_target(None)
+        if self.__shadow_effect is None:
+            self.__shadow_effect = QtWidgets.QGraphicsDropShadowEffect(self)
+            self.__shadow_effect.set_blur_radius(50)
+            self.__shadow_effect.set_offset(QtCore.QPointF(0.0, 0.0))
+            self.__shadow_effect.set_color(QtGui.QColor(10, 10, 10, 100))
+            self.__panel_background.set_graphics_effect(self.__shadow_effect)
+
+    def set_fixed_width(self, width: int) -> None:
+        self.__panel_background.set_fixed_width(width)
+
+    def set_instrumentation(
+            self, instrumentation: 'QEventInstrumentation') -> None:
+        self.__instrumentation = instrumentation
+
+    def __on_animation_finished(self) -> None:
+        # Swap the live widgets back in
+        self.__snapshot.hide()
+        self.__main_frame.show()
+        if self.__is_opening:
+            self.__panel_widget.show()
+            self.__panel_widget.raise_()
+        else:
+            self.__close()
+
+    def __play_animation(self, opening: bool) -> None:
+        self.__is_opening = opening
+        self.layout().activate()
+        self.__panel_widget.layout().activate()
+        width = (self.__panel_background.width() +
+                 self.__main_frame.blur_radius())
+        ratio = self.device_pixel_ratio_f()
+
+        pixmap = QtGui.QPixmap(QtCore.QSize(width, self.height()) * ratio)
+        pixmap.set_device_pixel_ratio(ratio)
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        self.__main_frame.render(
+            painter, QtCore.QPoint(),
+            QtGui.QRegion(0, 0, width, self.height()),
+            QtWidgets.QWidget.DrawChildren)
+        self.__panel_widget.render(
+            painter, QtCore.QPoint(), QtGui.QRegion(),
+            QtWidgets.QWidget.DrawChildren)
+        painter.end()
+
+        self.__main_frame.hide()
+        self.__panel_widget.hide()
+        self.__snapshot.set_pixmap(pixmap)
+        self.__snapshot.move(-width if opening else 0, 0)
+        self.__snapshot.show()
+        self.__snapshot.raise_()
+
+        self.__animation.set_start_value(-width if opening else 0)
+        self.__animation.set_end_value(0 if opening else -width)
+        self.__animation.start()
+
+    def __update_panel_widget_geometry(self) -> None:
+        # Setting an unchanged geometry still posts events, skip it
+        geometry = QtCore.QRect(
+            self.x(), self.y(), self.__panel_widget.width(), self.height())
+        if self.__panel_widget.geometry() != geometry:
+            self.__panel_widget.set_geometry(geometry)
+
+    def __str__(self) -> str:
+        return '_QOverlaySidePanel()'
+
+    def __repr__(self) -> str:
+        return '_QOverlaySidePanel(QtWidgets.QWidget)'
+
+
+class _QTask(QtCore.QRunnable):
+    """Runs a function on a pool thread and reports back through a signal"""
+
+    def __init__(
+            self, task_id: int, function: callable, args: tuple,
+            kwargs: dict, done_signal: QtCore.SignalInstance) -> None:
+        super().__init__()
+        # Kept alive by the runner, so that it can still be taken back
+        self.set_auto_delete(False)
+        self.__task_id = task_id
+        self.__function = function
+        self.__args = args
+        self.__kwargs = kwargs
+        self.__done_signal = done_signal
+
+    def run(self) -> None:
+        try:
+            result = self.__function(*self.__args, **self.__kwargs)
+        except Exception as error:
+            self.__done_signal.emit(self.__task_id, None, error)
+        else:
+            self.__done_signal.emit(self.__task_id, result, None)
+
+
+class _QTaskSignals(QtCore.QObject):
+    """Lives in the GUI thread, so pool threads emit queued signals"""
+    done_signal = QtCore.Signal(object, object, object)
+
+
+def _read_image(path: str, size: QtCore.QSize, ratio: float) -> QtGui.QImage:
+    # Worker thread: decode at the displayed size rather than the stored
+    # one, which is much faster for JPEG and keeps the pixmap small
+    reader = QtGui.QImageReader(path)
+    reader.set_auto_transform(True)
+    source = reader.size()
+    if source.is_valid() and size is not None:
+        target = source.scaled(size * ratio, QtCore.Qt.KeepAspectRatio)
+        if target.width() < source.width():
+            reader.set_scaled_size(target)
+
+    image = reader.read()
+    if image.is_null():
+        raise OSError(f'{path}: {reader.error_string()}')
+    image.set_device_pixel_ratio(ratio)
+    return image
+
+
+class QBreakpoint(object):
+    """Layout state of a QSidePanelApplicationWindow from a minimum width"""
+    panel_modes = ('overlay', 'rail', 'docked')
+
+    def __init__(
+            self, name: str, minimum_width: int, panel_mode: str = 'docked',
+            panel_width: int = None) -> None:
+        """Class constructor
+
+        :param name: State name, like 'compact', 'medium' or 'wide'
+        :param minimum_width: Window width from which the state applies
+        :param panel_mode: 'overlay' hides the panel behind the open panel
+            button, 'rail' docks it collapsed with icon only navigation
+            entries and buttons, and 'docked' docks it
+        :param panel_width: Docked panel width. None uses the window panel
+            width, or 56 for a rail
+        """
+        if panel_mode not in self.panel_modes:
+            raise ValueError(f'Unknown panel mode: {panel_mode!r}')
+
+        if panel_width is None and panel_mode == 'rail':
+            panel_width = 56
+
+        self.name = name
+        self.minimum_width = minimum_width
+        self.panel_mode = panel_mode
+        self.panel_width = panel_width
+
+    def __str__(self) -> str:
+        return f'QBreakpoint({self.name})'
+
+    def __repr__(self) -> str:
+        return (f'QBreakpoint({self.name!r}, {self.minimum_width}, '
+                f'{self.panel_mode!r}, {self.panel_width})')
+
+
+class QEventInstrumentation(object):
+    """Counts and times the events of instrumented widgets
+
+    Durations are kept per widget name and event kind in a window of the
+    most recent samples, so the percentiles follow what the widget does
+    now rather than since it was created. 'frame' is the whole repaint of
+    a top-level window, children included, and 'layout' a layout pass.
+    """
+    event_kinds = {
+        QtCore.QEvent.Resize: 'resize',
+        QtCore.QEvent.Move: 'move',
+        QtCore.QEvent.Polish: 'polish',
+        QtCore.QEvent.PolishRequest: 'polish',
+        QtCore.QEvent.StyleChange: 'polish',
+        QtCore.QEvent.Paint: 'paint',
+        QtCore.QEvent.UpdateRequest: 'frame',
+        QtCore.QEvent.LayoutRequest: 'layout'}
+
+    def __init__(self, sample_size: int = 500) -> None:
+        """Class constructor
+
+        :param sample_size: Number of recent durations kept per widget and
+            event kind for the percentiles
+        """
+        self.__sample_size = sample_size
+        self.__counts = collections.Counter()
+        self.__samples = {}
+
+    def reset(self) -> None:
+        """Forget every count and duration"""
+        self.__counts.clear()
+        self.__samples.clear()
+
+    def stats(self) -> dict:
+        """Statistics per widget name and event kind
+
+        Each entry has the total 'count' and the 'p50', 'p90', 'p99' and
+        'max' durations, in milliseconds, of the recent samples.
+        """
+        stats = {}
+        for (name, kind), samples in self.__samples.items():
+            ordered = sorted(samples)
+            last = len(ordered) - 1
+            stats.setdefault(name, {})[kind] = {
+                'count': self.__counts[name, kind],
+                'p50': ordered[round(last * 0.50)],
+                'p90': ordered[round(last * 0.90)],
+                'p99': ordered[round(last * 0.99)],
+                'max': ordered[last]}
+        return stats
+
+    def time_event(self, name: str, event: QtCore.QEvent, handler) -> bool:
+        """Deliver the event to handler, timing it if it is of a known kind
+
+        :param name: Widget name the event is recorded under
+        :param event: Event being delivered
+        :param handler: Event handler, usually the base class event()
+        """
+        kind = self.event_kinds.get(event.type())
+        if kind is None:
+            return handler(event)
+
+        start = time.perf_counter()
+        result = handler(event)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        key = name, kind
+        self.__counts[key] += 1
+        samples = self.__samples.get(key)
+        if samples is None:
+            samples = collections.deque(maxlen=self.__sample_size)
+            self.__samples[key] = samples
+        samples.append(elapsed)
+        return result
+
+    def __str__(self) -> str:
+        return 'QEventInstrumentation()'
+
+    def __repr__(self) -> str:
+        return f'QEventInstrumentation({self.__sample_size})'
+
+
+def _positional_argument_count(function: callable) -> int:
+    # Positional arguments function accepts, None when unknown or unbounded
+    try:
+        parameters = inspect.signature(function).parameters.values()
+    except (TypeError, ValueError):
+        return None
+
+    if any(x.kind == x.VAR_POSITIONAL for x in parameters):
+        return None
+    return sum(x.kind in (x.POSITIONAL_ONLY, x.POSITIONAL_OR_KEYWORD)
+               for x in parameters)
+
+
+class QStallWatchdog(object):
+    """Detects event loop stalls of the GUI thread from a helper thread
+
+    A timer in the GUI thread beats while the event loop runs. When no beat
+    arrives for longer than the threshold, the helper thread captures the
+    Python stack of the GUI thread. Stalls are kept in a ring buffer, with
+    the signal or slot that was running when it is known, and logged once
+    the event loop is back.
+    """
+
+    def __init__(self, log_size: int = 50) -> None:
+        """Class constructor
+
+        :param log_size: Number of most recent stalls kept
+        """
+        self.__log = collections.deque(maxlen=log_size)
+        self.__lock = threading.Lock()
+        self.__activities = []
+        self.__threshold = 0.2
+        self.__last_beat = 0.0
+        self.__pending_stall = None
+        self.__gui_thread = None
+        self.__timer = None
+        self.__thread = None
+        self.__stop_event = None
+
+    def activity(self) -> str:
+        """Signal or slot currently running in the GUI thread, if known"""
+        with self.__lock:
+            return self.__current_activity()
+
+    def is_running(self) -> bool:
+        """..."""
+        return self.__thread is not None
+
+    @contextlib.contextmanager
+    def running(self, name: str):
+        """Context manager that names the work done inside the block
+
+        Stalls detected inside the block are recorded with this name.
+        """
+        with self.__lock:
+            self.__activities.append(name)
+        try:
+            yield
+        finally:
+            with self.__lock:
+                self.__activities.pop()
+
+    def stalls(self) -> list:
+        """Recorded stalls, oldest first
+
+        Each stall has the wall clock 'time' it was detected, its
+        'duration_ms' (None while it lasts), the 'activity' and the GUI
+        thread 'stack' when it was detected.
+        """
+        with self.__lock:
+            return [dict(x) for x in self.__log]
+
+    def start(self, threshold_ms: int = 200) -> None:
+        """Start watching, from the GUI thread
+
+        :param threshold_ms: Time without event loop iteration that counts
+            as a stall
+        """
+        self.stop()
+        self.__threshold = threshold_ms / 1000
+        interval = max(5, min(50, threshold_ms // 4))
+        self.__gui_thread = threading.get_ident()
+        self.__last_beat = time.monotonic()
+
+        self.__timer = QtCore.QTimer()
+        self.__timer.set_interval(interval)
+        self.__timer.timeout.connect(self.__beat)
+        self.__timer.start()
+
+        self.__stop_event = threading.Event()
+        self.__thread = threading.Thread(
+            target=self.__watch, args=(self.__stop_event, interval / 1000),
+            name='MPX stall watchdog', daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """..."""
+        if self.__thread is None:
+            return
+
+        self.__stop_event.set()
+        self.__thread.join()
+        self.__thread = None
+        self.__timer.stop()
+        self.__timer = None
+
+    def tracked(self, name: str, receiver: callable) -> callable:
+        """Wrap a slot so that stalls inside it are recorded with name
+
+        Only as many signal arguments as the slot accepts are passed on.
+        """
+        count = _positional_argument_count(receiver)
+
+        def slot(*args):
+            with self.running(name):
+                return receiver(*args[:count])
+        return slot
+
+    def __beat(self) -> None:
+        now = time.monotonic()
+        with self.__lock:
+            gap = now - self.__last_beat
+            self.__last_beat = now
+            stall, self.__pending_stall = self.__pending_stall, None
+            if stall is not None:
+                stall['duration_ms'] = gap * 1000
+
+        if stall is not None:
+            logging.warning(
+                'Event loop stalled for %.0fms in %s\n%s',
+                stall['duration_ms'], stall['activity'] or 'unknown slot',
+                stall['stack'])
+
+    def __current_activity(self) -> str:
+        # Callers hold the lock, the GUI thread pushes and pops under it
+        return self.__activities[-1] if self.__activities else None
+
+    def __watch(self, stop_event: threading.Event, interval: float) -> None:
+        # Helper thread: a stall is recorded once, when it is first seen
+        while not stop_event.wait(interval):
+            with self.__lock:
+                if (self.__pending_stall is not None or
+                        time.monotonic() - self.__last_beat <
+                        self.__threshold):
+                    continue
+
+                frame = sys._current_frames().get(self.__gui_thread)
+                self.__pending_stall = {
+                    'time': time.time(),
+                    'duration_ms': None,
+                    'activity': self.__current_activity(),
+                    'stack': ''.join(traceback.format_stack(frame))
+                    if frame is not None else ''}
+                self.__log.append(self.__pending_stall)
+
+    def __str__(self) -> str:
+        return 'QStallWatchdog()'
+
+    def __repr__(self) -> str:
+        return f'QStallWatchdog({self.__log.maxlen})'
+
+
+_stall_watchdog = QStallWatchdog()
+
+
+class QTaskRunner(QtCore.QObject):
+    """Runs callbacks off the GUI thread, one live task per key
+
+    Tasks run on a QThreadPool, or on a process pool for CPU bound work
+    that must not hold the GIL. Results come back to the GUI thread
+    through signals and callbacks. A new task for a key makes the previous
+    one stale: it is removed from the queue if it has not started, and
+    its result is dropped otherwise.
+    """
+    busy_signal = QtCore.Signal(object)
+    task_failed_signal = QtCore.Signal(object, object)
+    task_finished_signal = QtCore.Signal(object, object)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__thread_pool = QtCore.QThreadPool(self)
+        self.__process_pool = None
+        self.__task_ids = itertools.count()
+        self.__latest_tasks = {}
+        self.__tasks = {}
+        self.__callbacks = {}
+        self.__signals = _QTaskSignals(self)
+        self.__signals.done_signal.connect(self.__on_task_done)
+
+    def cancel(self, key: object) -> None:
+        """Cancel the task of key, or drop its result if it is running"""
+        if self.__drop_task(key) and not self.__latest_tasks:
+            self.busy_signal.emit(False)
+
+    def is_busy(self) -> bool:
+        """..."""
+        return bool(self.__latest_tasks)
+
+    def is_pending(self, key: object) -> bool:
+        """Whether a task of key is queued or running"""
+        return key in self.__latest_tasks
+
+    def pending_keys(self) -> list:
+        """Keys of the tasks that are queued or running"""
+        return list(self.__latest_tasks)
+
+    def shutdown(self) -> None:
+        """Drop every task, and wait for those already running"""
+        for key in list(self.__latest_tasks):
+            self.cancel(key)
+        self.__thread_pool.wait_for_done()
+        if self.__process_pool is not None:
+            self.__process_pool.shutdown(cancel_futures=True)
+            self.__process_pool = None
+
+    def submit(
+            self, key: object, function: callable, *args,
+            callback: callable = None, error_callback: callable = None,
+            process: bool = False, **kwargs) -> None:
+        """Run function(*args, **kwargs) off the GUI thread
+
+        :param key: Slot the task belongs to, like 'open-image'. Any
+            previous task with the same key becomes stale
+        :param function: Function to run. It must not touch widgets, and
+            when process is True it must be picklable and importable by a
+            spawned interpreter
+        :param callback: Called in the GUI thread with the result
+        :param error_callback: Called in the GUI thread with the exception
+        :param process: Run in a process pool instead of a thread pool
+        """
+        was_busy = bool(self.__latest_tasks)
+        self.__drop_task(key)
+        task_id = next(self.__task_ids)
+        self.__latest_tasks[key] = task_id
+        self.__callbacks[task_id] = key, callback, error_callback
+
+        if process:
+            if self.__process_pool is None:
+                # Spawned, a forked Qt process with running threads is not
+                # safe to use
+                self.__process_pool = concurrent.futures.ProcessPoolExecutor(
+                    mp_context=multiprocessing.get_context('spawn'))
+            future = self.__process_pool.submit(function, *args, **kwargs)
+            self.__tasks[task_id] = future
+            future.add_done_callback(
+                lambda x: self.__on_future_done(task_id, x))
+        else:
+            task = _QTask(
+                task_id, function, args, kwargs,
+                self.__signals.done_signal)
+            self.__tasks[task_id] = task
+            self.__thread_pool.start(task)
+
+        if not was_busy:
+            self.busy_signal.emit(True)
+
+    def thread_pool(self) -> QtCore.QThreadPool:
+        """..."""
+        return self.__thread_pool
+
+    def __drop_task(self, key: object) -> bool:
+        task_id = self.__latest_tasks.pop(key, None)
+        if task_id is None:
+            return False
+
+        task = self.__tasks.get(task_id)
+        if isinstance(task, concurrent.futures.Future):
+            task.cancel()
+        elif task is not None and self.__thread_pool.try_take(task):
+            del self.__tasks[task_id]
+        self.__callbacks.pop(task_id, None)
+        return True
+
+    def __on_future_done(
+            self, task_id: int, future: concurrent.futures.Future) -> None:
+        # Executor thread, or the GUI thread when already done
+        if future.cancelled():
+            self.__signals.done_signal.emit(task_id, None, None)
+        elif future.exception() is not None:
+            self.__signals.done_signal.emit(
+                task_id, None, future.exception())
+        else:
+            self.__signals.done_signal.emit(task_id, future.result(), None)
+
+    def __on_task_done(
+            self, task_id: int, result: object, error: Exception) -> None:
+        self.__tasks.pop(task_id, None)
+        callbacks = self.__callbacks.pop(task_id, None)
+        if callbacks is None:
+            return
+
+        key, callback, error_callback = callbacks
+        if self.__latest_tasks.get(key) != task_id:
+            return
+        del self.__latest_tasks[key]
+
+        with _stall_watchdog.running(f'task callback {key!r}'):
+            if error is None:
+                self.task_finished_signal.emit(key, result)
+                if callback is not None:
+                    callback(result)
+            else:
+                self.task_failed_signal.emit(key, error)
+                if error_callback is not None:
+                    error_callback(error)
+
+        if not self.__latest_tasks:
+            self.busy_signal.emit(False)
+
+    def __str__(self) -> str:
+        return 'QTaskRunner()'
+
+    def __repr__(self) -> str:
+        return 'QTaskRunner(QtCore.QObject)'
+
+
+class QAsyncSlot(object):
+    """Connects an async def function to a signal
+
+    Every emission starts the coroutine as a task on the running asyncio
+    event loop, see QAsyncioApplication. Only as many signal arguments as
+    the function accepts are passed on.
+
+        window.panel_opened_signal.connect(QAsyncSlot(self.on_opened))
+    """
+
+    def __init__(self, function: callable, name: str = None) -> None:
+        """Class constructor
+
+        :param function: Coroutine function, like an async def method
+        :param name: Name in log messages, the function name by default
+        """
+        if not inspect.iscoroutinefunction(function):
+            raise TypeError(f'{function!r} is not a coroutine function')
+
+        self.__function = function
+        self.__argument_count = _positional_argument_count(function)
+        self.__name = name or getattr(
+            function, '__qualname__', repr(function))
+        self.__tasks = set()
+
+    def __call__(self, *args) -> 'asyncio.Task':
+        import asyncio
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise RuntimeError(
+                f'{self.__name}: async slots need the event loop of a '
+                'running QAsyncioApplication') from None
+
+        task = loop.create_task(
+            self.__function(*args[:self.__argument_count]))
+        self.__tasks.add(task)
+        task.add_done_callback(self.__on_task_done)
+        return task
+
+    def cancel(self) -> None:
+        """Cancel the tasks of this slot that are still running"""
+        for task in list(self.__tasks):
+            task.cancel()
+
+    def tasks(self) -> set:
+        """Tasks of this slot that are still running"""
+        return set(self.__tasks)
+
+    def __on_task_done(self, task: 'asyncio.Task') -> None:
+        self.__tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logging.error(
+                'Exception in async slot %s', self.__name,
+                exc_info=task.exception())
+
+    def __str__(self) -> str:
+        return f'QAsyncSlot({self.__name})'
+
+    def __repr__(self) -> str:
+        return f'QAsyncSlot({self.__function!r})'
+
+
+class QAsyncioApplication(QtWidgets.QApplication):
+    """QApplication whose event loop is also an asyncio event loop
+
+    Built on PySide6.QtAsyncio: tasks and QAsyncSlot handlers run in the
+    GUI thread between Qt events, and blocking file work is awaited with
+    asyncio.to_thread(). QtAsyncio does not implement sockets and
+    subprocesses yet, use QTaskRunner or QProcess for those.
+
+        application = QAsyncioApplication(sys.argv)
+        sys.exit(application.exec())
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Only asyncio applications pay for importing asyncio
+        import asyncio
+        from PySide6 import QtAsyncio
+
+        self.__is_running = False
+        self.__exit_code = 0
+        asyncio.set_event_loop_policy(
+            QtAsyncio.QAsyncioEventLoopPolicy(self))
+
+    def event_loop(self) -> 'asyncio.AbstractEventLoop':
+        """..."""
+        import asyncio
+
+        return asyncio.get_event_loop_policy().get_event_loop()
+
+    def exec(self) -> int:
+        """Run the event loop until exit(), and return the exit code"""
+        if self.__is_running:
+            # Called back by the asyncio event loop to run Qt's
+            self.__exit_code = super().exec()
+            return self.__exit_code
+
+        self.__is_running = True
+        try:
+            self.event_loop().run_forever()
+        finally:
+            self.__is_running = False
+        return self.__exit_code
+
+    def __str__(self) -> str:
+        return 'QAsyncioApplication()'
+
+    def __repr__(self) -> str:
+        return 'QAsyncioApplication(QtWidgets.QApplication)'
+
+
+class QPixmapLRUCache(object):
+    """Pixmaps by key, dropping the least recently used over a memory limit
+
+    The limit is in bytes of pixel data. Pixmaps larger than the whole
+    limit are not kept.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """Class constructor
+
+        :param max_bytes: Memory the pixmaps may use
+        """
+        self.__max_bytes = max_bytes
+        self.__size_bytes = 0
+        self.__pixmaps = collections.OrderedDict()
+
+    @staticmethod
+    def cost(pixmap: QtGui.QPixmap) -> int:
+        """Bytes of pixel data of pixmap"""
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def clear(self) -> None:
+        """..."""
+        self.__pixmaps.clear()
+        self.__size_bytes = 0
+
+    def get(self, key: object) -> QtGui.QPixmap:
+        """Pixmap of key, or None. It becomes the most recently used"""
+        pixmap = self.__pixmaps.get(key)
+        if pixmap is not None:
+            self.__pixmaps.move_to_end(key)
+        return pixmap
+
+    def insert(self, key: object, pixmap: QtGui.QPixmap) -> None:
+        """..."""
+        self.remove(key)
+        cost = self.cost(pixmap)
+        if cost > self.__max_bytes:
+            return
+
+        self.__pixmaps[key] = pixmap
+        self.__size_bytes += cost
+        self.__evict()
+
+    def max_bytes(self) -> int:
+        """..."""
+        return self.__max_bytes
+
+    def remove(self, key: object) -> None:
+        """..."""
+        pixmap = self.__pixmaps.pop(key, None)
+        if pixmap is not None:
+            self.__size_bytes -= self.cost(pixmap)
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        """..."""
+        self.__max_bytes = max_bytes
+        self.__evict()
+
+    def size_bytes(self) -> int:
+        """Bytes used by the cached pixmaps"""
+        return self.__size_bytes
+
+    def __evict(self) -> None:
+        while self.__size_bytes > self.__max_bytes:
+            _, pixmap = self.__pixmaps.popitem(last=False)
+            self.__size_bytes -= self.cost(pixmap)
+
+    def __len__(self) -> int:
+        return len(self.__pixmaps)
+
+    def __str__(self) -> str:
+        return 'QPixmapLRUCache()'
+
+    def __repr__(self) -> str:
+        return f'QPixmapLRUCache({self.__max_bytes})'
+
+
+_pixmap_cache = QPixmapLRUCache()
+
+
+class QIconRegistry(object):
+    """Process wide cache of icons and of their rasterized pixmaps
+
+    Icons are looked up once by name: a file or resource path, a file
+    named after the icon in a search path, or a theme icon. Pixmaps are
+    rasterized once per size and device pixel ratio and shared by every
+    window.
+    """
+    icon_extensions = ('.svg', '.png')
+
+    def __init__(self) -> None:
+        self.__icons = {}
+        self.__pixmaps = {}
+        self.__search_paths = []
+
+    def add_resource(self, path: str, prefix: str) -> bool:
+        """Register a compiled Qt resource and search icons under prefix
+
+        :param path: File made with pyside6-rcc --binary
+        :param prefix: Resource prefix of the icons, like ':/MPX'
+        """
+        if not QtCore.QResource.register_resource(path):
+            return False
+        self.add_search_path(prefix)
+        return True
+
+    def add_search_path(self, path: str) -> None:
+        """Directory or resource prefix searched for icon files
+
+        The paths added last are searched first, before the icon theme.
+        """
+        if path in self.__search_paths:
+            self.__search_paths.remove(path)
+        self.__search_paths.insert(0, path)
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget the icons and pixmaps, for example after a theme change"""
+        self.__icons.clear()
+        self.__pixmaps.clear()
+
+    def icon(self, name: str) -> QtGui.QIcon:
+        """..."""
+        icon = self.__icons.get(name)
+        if icon is None:
+            icon = self.__find_icon(name)
+            self.__icons[name] = icon
+        return icon
+
+    def pixmap(self, name: str, size: int, ratio: float = 1.0
+               ) -> QtGui.QPixmap:
+        """Icon rasterized at size logical pixels and device pixel ratio"""
+        key = name, size, ratio
+        pixmap = self.__pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self.icon(name).pixmap(QtCore.QSize(size, size), ratio)
+            self.__pixmaps[key] = pixmap
+        return pixmap
+
+    def prewarm(
+            self, names: list, sizes: tuple = (16, 22, 32),
+            ratio: float = None) -> None:
+        """Look up and rasterize icons ahead of time, at startup
+
+        :param names: Icon names
+        :param sizes: Sizes in logical pixels
+        :param ratio: Device pixel ratio, the primary screen one by default
+        """
+        if ratio is None:
+            screen = QtGui.QGuiApplication.primary_screen()
+            ratio = screen.device_pixel_ratio() if screen else 1.0
+
+        for name in names:
+            for size in sizes:
+                self.pixmap(name, size, ratio)
+
+    def search_paths(self) -> list:
+        """..."""
+        return list(self.__search_paths)
+
+    def __find_icon(self, name: str) -> QtGui.QIcon:
+        if name.startswith(':') or os.path.isabs(name):
+            return QtGui.QIcon(name)
+
+        for path in self.__search_paths:
+            for extension in self.icon_extensions:
+                file_name = f'{path}/{name}{extension}'
+                if QtCore.QFile.exists(file_name):
+                    return QtGui.QIcon(file_name)
+        return QtGui.QIcon.from_theme(name)
+
+    def __str__(self) -> str:
+        return 'QIconRegistry()'
+
+    def __repr__(self) -> str:
+        return 'QIconRegistry()'
+
+
+# Bundled icons, from the compiled resource when configure.sh made it
+_icon_registry = QIconRegistry()
+_icon_registry.add_search_path(SRC_DIR)
+_icon_registry.add_resource(os.path.join(SRC_DIR, 'icons.rcc'), ':/MPX')
+
+
+class QStyleSheetWatcher(QtCore.QObject):
+    """A style sheet file, reloaded when it changes on disk
+
+    The file is watched with watchdog when it is installed, or with a
+    QFileSystemWatcher otherwise. The several writes of one save are
+    merged into a single reload, and style_sheet_changed_signal only
+    reports the selectors whose rules changed.
+    """
+    style_sheet_changed_signal = QtCore.Signal(object)
+    reload_delay = 50
+
+    def __init__(self, path: str, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__path = os.path.abspath(path)
+        with open(self.__path, encoding='utf-8') as file:
+            self.__style_sheet = file.read()
+
+        self.__reload_timer = QtCore.QTimer(self)
+        self.__reload_timer.set_single_shot(True)
+        self.__reload_timer.set_interval(self.reload_delay)
+        self.__reload_timer.timeout.connect(self.reload)
+
+        self.__observer = None
+        self.__file_watcher = None
+        self.__watch()
+
+    def path(self) -> str:
+        """..."""
+        return self.__path
+
+    def reload(self) -> frozenset:
+        """Read the file again and return the selectors that changed"""
+        try:
+            with open(self.__path, encoding='utf-8') as file:
+                style_sheet = file.read()
+        except OSError as error:
+            # Replaced by an editor, the next change reloads it
+            logging.warning('Style sheet not reloaded: %s', error)
+            return frozenset()
+
+        if style_sheet == self.__style_sheet:
+            return frozenset()
+        selectors = _style_sheet_compiler.diff(
+            self.__style_sheet, style_sheet)
+        self.__style_sheet = style_sheet
+        if selectors:
+            with _stall_watchdog.running('style_sheet_changed_signal'):
+                self.style_sheet_changed_signal.emit(selectors)
+        return selectors
+
+    def rules(self) -> tuple:
+        """Rule table of the sheet as (selector, declarations) pairs"""
+        return _style_sheet_compiler.rules(self.__style_sheet)
+
+    def stop(self) -> None:
+        """Stop watching the file"""
+        if self.__observer is not None:
+            self.__observer.stop()
+            self.__observer.join()
+            self.__observer = None
+        if self.__file_watcher is not None:
+            self.__file_watcher.delete_later()
+            self.__file_watcher = None
+        self.__reload_timer.stop()
+
+    def style_sheet(self) -> str:
+        """..."""
+        return self.__style_sheet
+
+    def __on_file_changed(self, path: str) -> None:
+        # Saving through a new file drops it from the watcher
+        if (self.__path not in self.__file_watcher.files() and
+                os.path.exists(self.__path)):
+            self.__file_watcher.add_path(self.__path)
+        self.__reload_timer.start()
+
+    def __watch(self) -> None:
+        # The directory is watched too, editors often replace the file
+        directory = os.path.dirname(self.__path)
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            self.__file_watcher = QtCore.QFileSystemWatcher(
+                [self.__path, directory], self)
+            self.__file_watcher.fileChanged.connect(self.__on_file_changed)
+            self.__file_watcher.directoryChanged.connect(
+                self.__on_file_changed)
+            return
+
+        path, reload_timer = self.__path, self.__reload_timer
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event) -> None:
+                # Called on the observer thread
+                if path in (event.src_path, getattr(event, 'dest_path', '')):
+                    QtCore.QMetaObject.invoke_method(
+                        reload_timer, 'start', QtCore.Qt.QueuedConnection)
+
+        self.__observer = Observer()
+        self.__observer.daemon = True
+        self.__observer.schedule(Handler(), directory)
+        self.__observer.start()
+
+    def __str__(self) -> str:
+        return f'QStyleSheetWatcher({self.__path})'
+
+    def __repr__(self) -> str:
+        return 'QStyleSheetWatcher(QtCore.QObject)'
+
+
+class _QStyleSheetWatchers(object):
+    """Watchers shared by the windows that follow the same file
+
+    A watcher is created for the first window that acquires its path, and
+    stopped, its observer thread joined, when the last one releases it or
+    is destroyed.
+    """
+
+    def __init__(self) -> None:
+        self.__watchers = {}
+        self.__owners = {}
+
+    def acquire(self, path: str, owner: QtCore.QObject
+                ) -> QStyleSheetWatcher:
+        """Watcher of path, held by owner until it releases it"""
+        path = os.path.abspath(path)
+        if path not in self.__watchers:
+            self.__watchers[path] = QStyleSheetWatcher(path)
+            self.__owners[path] = {}
+        key = id(owner)
+        if key not in self.__owners[path]:
+            self.__owners[path][key] = owner.destroyed.connect(
+                lambda: self.__release(path, key))
+        return self.__watchers[path]
+
+    def release(self, path: str, owner: QtCore.QObject) -> None:
+        """Drop the hold of owner on path, the last one stops the watcher"""
+        path = os.path.abspath(path)
+        connection = self.__owners.get(path, {}).get(id(owner))
+        if connection is not None:
+            QtCore.QObject.disconnect(connection)
+            self.__release(path, id(owner))
+
+    def watcher(self, path: str) -> QStyleSheetWatcher:
+        """Watcher of path, or None if no window follows it"""
+        return self.__watchers.get(os.path.abspath(path))
+
+    def __release(self, path: str, key: int) -> None:
+        owners = self.__owners.get(path)
+        if owners is None or owners.pop(key, None) is None or owners:
+            return
+        del self.__owners[path]
+        watcher = self.__watchers.pop(path)
+        watcher.stop()
+        watcher.delete_later()
+
+
+_style_sheet_watchers = _QStyleSheetWatchers()
+
+
+class _QChildPolishFilter(QtCore.QObject):
+    """Event filter passing the widgets polished in a widget to a callback"""
+
+    def __init__(self, callback: callable, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__callback = callback
+
+    def event_filter(self, watched: QtCore.QObject, event: QtCore.QEvent
+                     ) -> bool:
+        if (event.type() == QtCore.QEvent.ChildPolished and
+                event.child().is_widget_type()):
+            self.__callback(event.child())
+        return super().event_filter(watched, event)
+
+
+class QImageLoader(QtCore.QObject):
+    """Decodes images on worker threads into a shared pixmap cache
+
+    Images are read with QImageReader, scaled while reading to the size
+    they are shown at. Pixmaps are cached by path, size and device pixel
+    ratio.
+    """
+    image_failed_signal = QtCore.Signal(object, object)
+    image_loaded_signal = QtCore.Signal(object, object)
+
+    def __init__(
+            self, cache: QPixmapLRUCache = None, *args, **kwargs) -> None:
+        """Class constructor
+
+        :param cache: Pixmap cache, the process wide one by default
+        """
+        super().__init__(*args, **kwargs)
+        self.__cache = cache if cache is not None else _pixmap_cache
+        self.__task_runner = QTaskRunner(self)
+
+    def cache(self) -> QPixmapLRUCache:
+        """..."""
+        return self.__cache
+
+    def load(
+            self, path: str, size: QtCore.QSize = None, ratio: float = 1.0,
+            slot: object = 'image') -> QtGui.QPixmap:
+        """Cached pixmap of path, or None while it is decoded
+
+        image_loaded_signal is emitted with the path and the pixmap once
+        decoded. A later load for the same slot makes this one stale.
+
+        :param path: Image file
+        :param size: Size to fit the image in, None for its own size
+        :param ratio: Device pixel ratio it is shown at
+        :param slot: Load requests that replace each other
+        """
+        key = self.__cache_key(path, size, ratio)
+        pixmap = self.__cache.get(key)
+        if pixmap is not None or self.__task_runner.is_pending(
+                ('prefetch', key)):
+            self.__task_runner.cancel(slot)
+        else:
+            self.__submit(slot, key, path, size, ratio)
+        return pixmap
+
+    def prefetch(
+            self, paths: list, size: QtCore.QSize = None,
+            ratio: float = 1.0) -> None:
+        """Decode paths into the cache ahead of time"""
+        for path in paths:
+            key = self.__cache_key(path, size, ratio)
+            if (self.__cache.get(key) is None and
+                    not self.__task_runner.is_pending(('prefetch', key))):
+                self.__submit(('prefetch', key), key, path, size, ratio)
+
+    def task_runner(self) -> QTaskRunner:
+        """..."""
+        return self.__task_runner
+
+    @staticmethod
+    def __cache_key(path: str, size: QtCore.QSize, ratio: float) -> tuple:
+        if size is None:
+            return path, None, None, ratio
+        return path, size.width(), size.height(), ratio
+
+    def __on_failed(self, key: tuple, error: Exception) -> None:
+        logging.warning('Could not load image: %s', error)
+        self.image_failed_signal.emit(key[0], error)
+
+    def __on_loaded(self, key: tuple, image: QtGui.QImage) -> None:
+        pixmap = QtGui.QPixmap.from_image(image)
+        self.__cache.insert(key, pixmap)
+        self.image_loaded_signal.emit(key[0], pixmap)
+
+    def __submit(
+            self, slot: object, key: tuple, path: str, size: QtCore.QSize,
+            ratio: float) -> None:
+        self.__task_runner.submit(
+            slot, _read_image, path, size, ratio,
+            callback=lambda x: self.__on_loaded(key, x),
+            error_callback=lambda x: self.__on_failed(key, x))
+
+    def __str__(self) -> str:
+        return 'QImageLoader()'
+
+    def __repr__(self) -> str:
+        return 'QImageLoader(QtCore.QObject)'
+
+
+class QImageView(QtWidgets.QWidget):
+    """Shows one image of a list, decoded off the GUI thread
+
+    The images next to the current one are prefetched, so that stepping
+    through the list, for example from the panel navigation, shows them
+    from the cache. Without a fixed image size, images are decoded at the
+    size of the view once it stops being resized.
+    """
+    current_index_changed_signal = QtCore.Signal(object)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__paths = []
+        self.__current_index = -1
+        self.__pixmap = QtGui.QPixmap()
+        self.__image_size = None
+        self.__prefetch_distance = 1
+
+        self.__image_loader = QImageLoader(parent=self)
+        self.__image_loader.image_loaded_signal.connect(
+            self.__on_image_loaded)
+
+        self.__resize_timer = QtCore.QTimer(self)
+        self.__resize_timer.set_single_shot(True)
+        self.__resize_timer.set_interval(100)
+        self.__resize_timer.timeout.connect(self.__load_current_image)
+
+    def current_index(self) -> int:
+        """..."""
+        return self.__current_index
+
+    def current_path(self) -> str:
+        """..."""
+        if 0 <= self.__current_index < len(self.__paths):
+            return self.__paths[self.__current_index]
+        return None
+
+    def image_loader(self) -> QImageLoader:
+        """..."""
+        return self.__image_loader
+
+    def image_size(self) -> QtCore.QSize:
+        """..."""
+        return self.__image_size
+
+    def paint_event(self, event: QtGui.QPaintEvent) -> None:
+        if self.__pixmap.is_null():
+            return
+
+        # Scaled down on the fly only while a better fit is decoded
+        size = self.__pixmap.device_independent_size().to_size()
+        if size.width() > self.width() or size.height() > self.height():
+            size = size.scaled(self.size(), QtCore.Qt.KeepAspectRatio)
+        rect = QtCore.QRect(QtCore.QPoint(), size)
+        rect.move_center(self.rect().center())
+        painter = QtGui.QPainter(self)
+        painter.draw_pixmap(rect, self.__pixmap)
+
+    def paths(self) -> list:
+        """..."""
+        return list(self.__paths)
+
+    def prefetch_distance(self) -> int:
+        """..."""
+        return self.__prefetch_distance
+
+    def resize_event(self, event: QtGui.QResizeEvent) -> None:
+        if self.__image_size is None and self.current_path() is not None:
+            self.__resize_timer.start()
+
+    def set_current_index(self, index: int) -> None:
+        """..."""
+        if index == self.__current_index or not (
+                0 <= index < len(self.__paths)):
+            return
+
+        self.__current_index = index
+        self.__load_current_image()
+        self.current_index_changed_signal.emit(index)
+
+    def set_image(self, path: str) -> None:
+        """Show a single image"""
+        self.set_paths([path])
+
+    def set_image_size(self, size: QtCore.QSize) -> None:
+        """Size to fit images in, None for the size of the view"""
+        self.__image_size = size
+        self.__load_current_image()
+
+    def set_paths(self, paths: list, current_index: int = 0) -> None:
+        """..."""
+        self.__paths = list(paths)
+        self.__current_index = -1
+        self.__pixmap = QtGui.QPixmap()
+        self.set_current_index(current_index)
+        self.update()
+
+    def set_prefetch_distance(self, distance: int) -> None:
+        """Images on each side of the current one decoded ahead"""
+        self.__prefetch_distance = max(0, distance)
+
+    def size_hint(self) -> QtCore.QSize:
+        if self.__image_size is not None:
+            return self.__image_size
+        return QtCore.QSize(256, 256)
+
+    def __load_current_image(self) -> None:
+        path = self.current_path()
+        if path is None:
+            return
+
+        size = self.__image_size or self.size()
+        ratio = self.device_pixel_ratio_f()
+        pixmap = self.__image_loader.load(path, size, ratio)
+        if pixmap is not None:
+            self.__pixmap = pixmap
+            self.update()
+
+        index = self.__current_index
+        distance = self.__prefetch_distance
+        self.__image_loader.prefetch(
+            [self.__paths[x] for x in range(
+                max(0, index - distance),
+                min(len(self.__paths), index + distance + 1))
+             if x != index], size, ratio)
+
+    def __on_image_loaded(self, path: str, pixmap: QtGui.QPixmap) -> None:
+        if path == self.current_path():
+            self.__pixmap = pixmap
+            self.update()
+
+    def __str__(self) -> str:
+        return 'QImageView()'
+
+    def __repr__(self) -> str:
+        return 'QImageView(QtWidgets.QWidget)'
+
+
+class _QIconOnlyItemDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints the rows of a view without their text, for a panel rail
+
+    The text is shown as the tool tip of the row instead.
+    """
+
+    def help_event(
+            self, event: QtGui.QHelpEvent, view: QtWidgets.QAbstractItemView,
+            option: QtWidgets.QStyleOptionViewItem,
+            index: QtCore.QModelIndex) -> bool:
+        if event.type() == QtCore.QEvent.ToolTip and index.is_valid():
+            QtWidgets.QToolTip.show_text(
+                event.global_pos(), str(index.data()), view)
+            return True
+        return super().help_event(event, view, option, index)
 
-    def __init__(self, widget: QtWidgets.QWidget, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        # Param
-        self.__panel_widget = widget
-        self.__panel_widget_box = self.__panel_widget.parent().layout()
-        self.__toplevel = self.__panel_widget.parent().window()
+    def init_style_option(
+            self, option: QtWidgets.QStyleOptionViewItem,
+            index: QtCore.QModelIndex) -> None:
+        super().init_style_option(option, index)
+        option.text = ''
+        option.features &= ~QtWidgets.QStyleOptionViewItem.HasDisplay
 
-        # Settings
-        self.set_attribute(QtCore.Qt.WA_TranslucentBackground)
-        self.set_window_flags(
-            QtCore.Qt.FramelessWindowHint | QtCore.Qt.Popup | QtCore.Qt.Dialog)
 
-        self.set_style_sheet(self.__toplevel.style_sheet())
+class QNavigationPanel(QtWidgets.QWidget):
+    """Model/view navigation for the side panel
+
+    Rows are painted by the view's delegate, so no widget is created per
+    entry and only the visible rows cost anything to draw. A filter entry,
+    toggled by the panel header bar search button, filters the rows as
+    the user types.
+    """
+    item_activated_signal = QtCore.Signal(object)
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Class constructor
 
+        Initialize class attributes
+        """
+        super().__init__(*args, **kwargs)
         # Main layout
         self.__main_box = QtWidgets.QVBoxLayout()
-        self.__main_box.set_contents_margins(6, 6, 6, 6)
-        self.__main_box.set_spacing(0)
+        self.__main_box.set_contents_margins(0, 0, 0, 0)
+        self.__main_box.set_spacing(6)
         self.set_layout(self.__main_box)
 
-        self.__main_frame = QtWidgets.QWidget()
-        self.__main_frame.set_contents_margins(0, 0, 0, 0)
-        self.__main_box.add_widget(self.__main_frame)
+        # Filter
+        self.__filter_entry = QtWidgets.QLineEdit()
+        self.__filter_entry.set_clear_button_enabled(True)
+        self.__filter_entry.set_visible(False)
+        self.__main_box.add_widget(self.__filter_entry)
+
+        self.__filter_timer = QtCore.QTimer(self)
+        self.__filter_timer.set_single_shot(True)
+        self.__filter_timer.set_interval(120)
+        self.__filter_timer.timeout.connect(
+            lambda: self.set_filter_text(self.__filter_entry.text()))
+        self.__filter_entry.textChanged.connect(self.__filter_timer.start)
+        self.__filter_text = ''
+
+        self.__proxy_model = QtCore.QSortFilterProxyModel(self)
+        self.__proxy_model.set_filter_case_sensitivity(
+            QtCore.Qt.CaseInsensitive)
+        self.__proxy_model.set_recursive_filtering_enabled(True)
+        self.__string_model = None
+
+        # View
+        self.__view = QtWidgets.QTreeView()
+        self.__view.set_header_hidden(True)
+        self.__view.set_uniform_row_heights(True)
+        self.__view.set_frame_shape(QtWidgets.QFrame.NoFrame)
+        self.__view.set_edit_triggers(
+            QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.__view.viewport().set_auto_fill_background(False)
+        self.__view.set_model(self.__proxy_model)
+        self.__view.activated.connect(self.__on_activated)
+        self.__main_box.add_widget(self.__view)
+        self.__item_delegate = self.__view.item_delegate()
+        self.__icon_only_item_delegate = None
+
+    def filter_entry(self) -> QtWidgets.QLineEdit:
+        """..."""
+        return self.__filter_entry
 
-        self.__horizontal_frame_box = QtWidgets.QHBoxLayout()
-        self.__horizontal_frame_box.set_contents_margins(0, 0, 0, 0)
-        self.__horizontal_frame_box.set_spacing(0)
-        self.__main_frame.set_layout(self.__horizontal_frame_box)
+    def is_icons_only(self) -> bool:
+        """..."""
+        return self.__icon_only_item_delegate is not None
 
-        # Panel background
-        self.__panel_background = QtWidgets.QWidget()
-        self.__horizontal_frame_box.add_widget(self.__panel_background)
+    def model(self) -> QtCore.QAbstractItemModel:
+        """..."""
+        return self.__proxy_model.source_model()
+
+    def set_filter_text(self, text: str) -> None:
+        """Show only the rows, and the parents of rows, that contain text"""
+        self.__filter_timer.stop()
+        # The proxy pattern is escaped, compare with the fixed string
+        if text != self.__filter_text:
+            self.__filter_text = text
+            self.__proxy_model.set_filter_fixed_string(text)
+
+    def set_filter_visible(self, visible: bool) -> None:
+        """Show the filter entry, or hide it and clear the filter"""
+        self.__filter_entry.set_visible(visible)
+        if visible:
+            self.__filter_entry.set_focus()
+        else:
+            self.__filter_entry.clear()
+            self.set_filter_text('')
 
-        self.__panel_background_box = QtWidgets.QVBoxLayout()
-        self.__panel_background_box.set_contents_margins(0, 0, 0, 0)
-        self.__panel_background.set_layout(self.__panel_background_box)
+    def set_icons_only(self, icons_only: bool) -> None:
+        """Paint the rows with their icon only, the text as tool tip
 
-        # Panel
-        self.__panel = QtWidgets.QWidget()
-        self.__panel.set_contents_margins(0, 0, 0, 0)
-        self.__panel_background_box.add_widget(self.__panel)
+        Used by the window while the panel is a rail. The filter entry is
+        hidden, there is no room to type in it.
+        """
+        if icons_only == self.is_icons_only():
+            return
+        if icons_only:
+            self.set_filter_visible(False)
+            self.__icon_only_item_delegate = _QIconOnlyItemDelegate(self)
+            self.__view.set_item_delegate(self.__icon_only_item_delegate)
+        else:
+            self.__view.set_item_delegate(self.__item_delegate)
+            self.__icon_only_item_delegate.delete_later()
+            self.__icon_only_item_delegate = None
 
-        self.__panel_box = QtWidgets.QVBoxLayout()
-        self.__panel_box.set_contents_margins(0, 0, 0, 0)
-        self.__panel_box.set_alignment(QtCore.Qt.AlignTop)
-        self.__panel.set_layout(self.__panel_box)
+    def set_items(self, items: list) -> None:
+        """Use a flat list of strings as the model
 
-        # Panel shadow
-        self.__shadow_effect = QtWidgets.QGraphicsDropShadowEffect(self)
-        self.__shadow_effect.set_blur_radius(50)
-        self.__shadow_effect.set_offset(QtCore.QPointF(0.0, 0.0))
-        self.__shadow_effect.set_color(QtGui.QColor(10, 10, 10, 100))
-        self.__panel_background.set_graphics_effect(self.__shadow_effect)
+        The string list model is created once and refilled by later calls.
+        """
+        if self.__string_model is None:
+            self.__string_model = QtCore.QStringListModel(self)
+        self.__string_model.set_string_list(items)
+        if self.model() is not self.__string_model:
+            self.set_model(self.__string_model)
+
+    def set_model(self, model: QtCore.QAbstractItemModel) -> None:
+        """Model with the navigation entries, flat or as a tree"""
+        self.__proxy_model.set_source_model(model)
+        flat = not any(
+            model.row_count(model.index(row, 0))
+            for row in range(min(model.row_count(), 100)))
+        self.__view.set_root_is_decorated(not flat)
+
+    def view(self) -> QtWidgets.QTreeView:
+        """..."""
+        return self.__view
 
-        class CloseArea(QtWidgets.QWidget):
-            def __init__(self, parent_win) -> None:
-                super().__init__()
-                self.__parent = parent_win
+    def __on_activated(self, index: QtCore.QModelIndex) -> None:
+        self.item_activated_signal.emit(
+            self.__proxy_model.map_to_source(index))
 
-            def mouse_press_event(self, ev: QtGui.QMouseEvent) -> None:
-                if ev.button() == QtCore.Qt.LeftButton and self.under_mouse():
-                    self.__parent.close_panel()
+    def __str__(self) -> str:
+        return 'QNavigationPanel()'
 
-        self.__close_area = CloseArea(self)
-        self.__horizontal_frame_box.add_widget(self.__close_area)
-        self.__context_menu = None
+    def __repr__(self) -> str:
+        return 'QNavigationPanel(QtWidgets.QWidget)'
 
-    def close_panel(self) -> None:
-        self.__panel_box.remove_widget(self.__panel_widget)
-        self.__panel_widget_box.add_widget(self.__panel_widget)
-        self.panel_closed_signal.emit('panel-closed-signal')
-        self.close()
 
-    def context_menu_event(self, event):
-        if not self.__context_menu:
-            self.__context_menu = self.__toplevel.quick_context_menu()
+class QPageStack(QtWidgets.QWidget):
+    """Pages built on their first visit and kept in a bounded LRU
 
-        if self.__context_menu:
-            self.__context_menu.exec(event.global_pos())
+    Each page is registered with a factory and built the first time it is
+    shown. At most max_live_pages() pages are kept alive; the least
+    recently shown one is destroyed when a new one is built. A page keeps
+    its state across eviction by implementing save_page_state(), which
+    returns any object, and restore_page_state(state), which gets it back
+    when the page is built again.
+    """
+    current_page_changed_signal = QtCore.Signal(object)
+    page_created_signal = QtCore.Signal(object)
+    page_evicted_signal = QtCore.Signal(object)
 
-    def main_layout(self) -> QtWidgets.QLayout:
-        return self.__panel_box
-    
-    def move_event(self, event: QtGui.QMoveEvent) -> None:
-        logging.info(event)
-        self.__toplevel.move(self.x(), self.y())
-        self.resize(self.__toplevel.width(), self.__toplevel.height())
+    def __init__(self, max_live_pages: int = 5, *args, **kwargs) -> None:
+        """Class constructor
 
-    def open_panel(self) -> None:
-        self.__panel_widget_box.remove_widget(self.__panel_widget)
-        self.__panel_box.add_widget(self.__panel_widget)
+        :param max_live_pages: Pages kept alive, the current one included
+        """
+        super().__init__(*args, **kwargs)
+        self.__max_live_pages = max(1, max_live_pages)
+        self.__factories = {}
+        self.__pages = collections.OrderedDict()
+        self.__states = {}
+        self.__current_page = None
 
-        self.__toplevel.set_left_control_buttons_visible(False)
-        self.__panel_widget.set_style_sheet(self.style_sheet())
-        self.show()
+        self.__stack = QtWidgets.QStackedLayout()
+        self.__stack.set_contents_margins(0, 0, 0, 0)
+        self.set_layout(self.__stack)
 
-    def panel(self) -> QtWidgets.QWidget:
-        return self.__panel
+    def add_page(self, name: object, factory: callable) -> None:
+        """Register a page
 
-    def panel_background(self) -> QtWidgets.QWidget:
-        return self.__panel_background
+        :param name: Page name
+        :param factory: Callable returning the page widget
+        """
+        self.remove_page(name)
+        self.__factories[name] = factory
 
-    def set_fixed_width(self, width: int) -> None:
-        self.__panel.set_fixed_width(width)
-        self.__panel_background.set_fixed_width(width)
+    def current_page(self) -> object:
+        """Name of the page shown"""
+        return self.__current_page
+
+    def current_widget(self) -> QtWidgets.QWidget:
+        """..."""
+        return self.__pages.get(self.__current_page)
+
+    def live_pages(self) -> list:
+        """Names of the pages alive, least recently shown first"""
+        return list(self.__pages)
+
+    def max_live_pages(self) -> int:
+        """..."""
+        return self.__max_live_pages
+
+    def page(self, name: object) -> QtWidgets.QWidget:
+        """Widget of the page, or None when it is not alive"""
+        return self.__pages.get(name)
+
+    def page_names(self) -> list:
+        """..."""
+        return list(self.__factories)
+
+    def remove_page(self, name: object) -> None:
+        """..."""
+        if name not in self.__factories:
+            return
+
+        del self.__factories[name]
+        self.__states.pop(name, None)
+        if name in self.__pages:
+            self.__destroy_page(name, save_state=False)
+        if name == self.__current_page:
+            self.__current_page = None
+            self.current_page_changed_signal.emit(None)
+
+    def set_current_page(self, name: object) -> None:
+        """Show a page, building it if it is not alive"""
+        if name not in self.__factories:
+            raise KeyError(f'Unknown page: {name!r}')
+        if name == self.__current_page:
+            return
+
+        page = self.__pages.get(name)
+        if page is None:
+            page = self.__factories[name]()
+            if name in self.__states and hasattr(
+                    page, 'restore_page_state'):
+                page.restore_page_state(self.__states.pop(name))
+            self.__stack.add_widget(page)
+            self.__pages[name] = page
+            self.page_created_signal.emit(name)
+        else:
+            self.__pages.move_to_end(name)
+
+        self.__current_page = name
+        self.__stack.set_current_widget(page)
+        self.__evict()
+        self.current_page_changed_signal.emit(name)
+
+    def set_max_live_pages(self, count: int) -> None:
+        """..."""
+        self.__max_live_pages = max(1, count)
+        self.__evict()
+
+    def __destroy_page(self, name: object, save_state: bool) -> None:
+        page = self.__pages.pop(name)
+        if save_state and hasattr(page, 'save_page_state'):
+            self.__states[name] = page.save_page_state()
+        self.__stack.remove_widget(page)
+        page.hide()
+        page.delete_later()
+        self.page_evicted_signal.emit(name)
+
+    def __evict(self) -> None:
+        # The current page is the most recently used, so never evicted
+        while len(self.__pages) > self.__max_live_pages:
+            self.__destroy_page(next(iter(self.__pages)), save_state=True)
 
     def __str__(self) -> str:
-        return '_QOverlaySidePanel()'
+        return 'QPageStack()'
 
     def __repr__(self) -> str:
-        return '_QOverlaySidePanel(QtWidgets.QWidget)'
+        return f'QPageStack({self.__max_live_pages})'
+
+
+class QWindowStateCache(object):
+    """Saved window states, kept together in one small JSON file
+
+    The file is read once, on first use, and replaced atomically on every
+    save(). Windows find their state by key, see
+    QSidePanelApplicationWindow.set_state_key().
+    """
+    file_name = 'mpx-window-state.json'
+
+    def __init__(self, path: str = None) -> None:
+        """Class constructor
+
+        :param path: JSON file, in the application cache directory by
+            default
+        """
+        self.__path = path
+        self.__states = None
+
+    def clear(self) -> None:
+        """Forget every state and remove the file"""
+        self.__states = {}
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path())
+
+    def path(self) -> str:
+        """..."""
+        if self.__path is None:
+            self.__path = os.path.join(
+                QtCore.QStandardPaths.writable_location(
+                    QtCore.QStandardPaths.CacheLocation), self.file_name)
+        return self.__path
+
+    def save(self, key: str, state: dict) -> bool:
+        """Store the state under key, returns False if it was not written"""
+        states = self.__read()
+        if states.get(key) == state:
+            return True
+        states[key] = state
+
+        path = self.path()
+        temporary_path = f'{path}.{os.getpid()}'
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temporary_path, 'w', encoding='utf-8') as file:
+                json.dump(states, file, separators=(',', ':'))
+            os.replace(temporary_path, path)
+        except OSError as error:
+            logging.warning('Window state not saved: %s', error)
+            return False
+        return True
+
+    def set_path(self, path: str) -> None:
+        """..."""
+        self.__path = path
+        self.__states = None
+
+    def state(self, key: str) -> dict:
+        """State stored under key, or None"""
+        return self.__read().get(key)
+
+    def __read(self) -> dict:
+        if self.__states is None:
+            self.__states = {}
+            try:
+                with open(self.path(), encoding='utf-8') as file:
+                    states = json.load(file)
+            except FileNotFoundError:
+                return self.__states
+            except (OSError, ValueError) as error:
+                logging.warning('Window state cache not read: %s', error)
+                return self.__states
+            if isinstance(states, dict):
+                self.__states = states
+        return self.__states
+
+    def __str__(self) -> str:
+        return f'QWindowStateCache({self.__path})'
+
+    def __repr__(self) -> str:
+        return 'QWindowStateCache(object)'
+
+
+_window_state_cache = QWindowStateCache()
+
+
+class QQuickContextMenu(QtWidgetsX.QQuickContextMenu):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__target = None
+        self.__shortcuts = {}
+        self.__shortcut_widgets = {}
+
+    def add_action(self, text: str, receiver: callable, *args, **kwargs):
+        """...
+
+        receiver can also be an async def function, see QAsyncSlot.
+        """
+        name = f'QQuickContextMenu action {text!r}'
+        if inspect.iscoroutinefunction(receiver):
+            receiver = QAsyncSlot(receiver, name)
+        receiver = _stall_watchdog.tracked(name, receiver)
+        if kwargs.get('shortcut') is None:
+            return super().add_action(text, receiver, *args, **kwargs)
+
+        # The widget of the action is the new one whose parent was there
+        widgets = self.find_children(QtWidgets.QWidget)
+        result = super().add_action(text, receiver, *args, **kwargs)
+        added = [x for x in self.find_children(QtWidgets.QWidget)
+                 if x not in widgets]
+        shortcut = QtGui.QKeySequence(kwargs['shortcut']).to_string()
+        self.__shortcuts[shortcut] = (text, receiver)
+        self.__shortcut_widgets[shortcut] = next(
+            (x for x in added if x.parent_widget() not in added), None)
+        return result
+
+    def add_target_action(
+            self, text: str, receiver: callable, *args, **kwargs):
+        """Add an action whose receiver is called with target()
+
+        The target is set by every exec(), so that one menu can serve many
+        widgets, see QContextMenuRegistry. receiver can also be an async
+        def function.
+        """
+        if inspect.iscoroutinefunction(receiver):
+            receiver = QAsyncSlot(
+                receiver, f'QQuickContextMenu action {text!r}')
+
+        def target_receiver() -> object:
+            return receiver(self.__target)
+        return self.add_action(text, target_receiver, *args, **kwargs)
+
+    def exec(self, pos: QtCore.QPoint, target: object = None,
+             *args, **kwargs):
+        """...
+
+        :param target: Passed to the receivers of add_target_action()
+        """
+        self.__target = target
+        return super().exec(pos, *args, **kwargs)
+
+    def is_shortcut_enabled(self, shortcut: QtGui.QKeySequence) -> bool:
+        """Whether the action of the shortcut is enabled and not hidden"""
+        key = QtGui.QKeySequence(shortcut).to_string()
+        if key not in self.__shortcuts:
+            return False
+        widget = self.__shortcut_widgets.get(key)
+        return widget is None or (
+            widget.is_enabled() and widget.is_visible_to(self))
+
+    def set_target(self, target: object) -> None:
+        """..."""
+        self.__target = target
+
+    def shortcuts(self) -> dict:
+        """Actions with a shortcut, as {shortcut: (text, receiver)}"""
+        return dict(self.__shortcuts)
+
+    def target(self) -> object:
+        """..."""
+        return self.__target
+
+
+class QContextMenuRegistry(object):
+    """Process wide QQuickContextMenu instances, shared by name
+
+    Every menu is built once by its builder. Registered menus are built
+    and polished off-screen one per event loop pass, when the application
+    is idle, so that the first exec() only has to show them. Receivers
+    added with add_target_action() are called with the target of the
+    exec(). The shortcuts of all the built menus are indexed, so
+    trigger_shortcut() finds an action in constant time. Keys only reach
+    it from the widgets given to install_shortcut_handler(), or when the
+    caller passes them on itself.
+
+        registry.register('row', lambda menu: menu.add_target_action(
+            'Delete', delete_row, shortcut=QKeySequence('Del')))
+        registry.exec('row', event.global_pos(), row)
+        registry.install_shortcut_handler(row)
+    """
+
+    def __init__(self) -> None:
+        self.__builders = {}
+        self.__menus = {}
+        self.__pending = []
+        self.__shortcuts = {}
+        self.__prebuild_timer = None
+        self.__shortcut_handlers = {}
+
+    def exec(self, name: str, pos: QtCore.QPoint, target: object = None):
+        """Show the menu registered as name at pos, for target"""
+        return self.menu(name).exec(pos, target)
+
+    def install_shortcut_handler(
+            self, widget: QtWidgets.QWidget, target: object = None) -> None:
+        """Trigger the menu shortcuts from the key presses of widget
+
+        The key presses that match the shortcut of an enabled action are
+        consumed, and the action is called for target, widget by
+        default. The widget needs the keyboard focus to get them.
+        """
+        self.remove_shortcut_handler(widget)
+        handler = _QContextMenuShortcutHandler(
+            self, widget if target is None else target, widget)
+        widget.install_event_filter(handler)
+        key = id(widget)
+        self.__shortcut_handlers[key] = handler
+        widget.destroyed.connect(
+            lambda: self.__shortcut_handlers.pop(key, None))
+
+    def is_built(self, name: str) -> bool:
+        """..."""
+        return name in self.__menus
+
+    def menu(self, name: str) -> QQuickContextMenu:
+        """Menu registered as name, built now if it was not yet
+
+        Raises KeyError if no menu is registered as name.
+        """
+        if name not in self.__menus:
+            self.__build(name)
+        return self.__menus[name]
+
+    def names(self) -> list:
+        """..."""
+        return list(self.__builders)
+
+    def register(
+            self, name: str, builder: callable, prebuild: bool = True
+            ) -> None:
+        """Register the menu builder under name, replacing any other
+
+        :param builder: Called once with a new QQuickContextMenu, to add
+            its actions
+        :param prebuild: Build it when the application is idle, instead
+            of on first use
+        """
+        self.unregister(name)
+        self.__builders[name] = builder
+        if not prebuild:
+            return
+        self.__pending.append(name)
+        if self.__prebuild_timer is None:
+            self.__prebuild_timer = QtCore.QTimer()
+            self.__prebuild_timer.timeout.connect(self.__prebuild)
+        self.__prebuild_timer.start(0)
+
+    def remove_shortcut_handler(self, widget: QtWidgets.QWidget) -> None:
+        """Stop triggering the menu shortcuts from the keys of widget"""
+        handler = self.__shortcut_handlers.pop(id(widget), None)
+        if handler is not None:
+            widget.remove_event_filter(handler)
+            handler.delete_later()
+
+    def shortcut_action(self, shortcut: QtGui.QKeySequence) -> tuple:
+        """(menu name, action text) of the shortcut, or None"""
+        self.__build_pending()
+        action = self.__shortcuts.get(QtGui.QKeySequence(shortcut).to_string())
+        return None if action is None else action[:2]
+
+    def trigger_shortcut(
+            self, shortcut: QtGui.QKeySequence, target: object = None
+            ) -> bool:
+        """Call the action of the shortcut for target
+
+        Menus still waiting to be prebuilt are built first. Returns False
+        when no registered menu has the shortcut, or when its action is
+        disabled or hidden.
+        """
+        self.__build_pending()
+        action = self.__shortcuts.get(QtGui.QKeySequence(shortcut).to_string())
+        if action is None:
+            return False
+        name, _, receiver = action
+        if not self.__menus[name].is_shortcut_enabled(shortcut):
+            return False
+        self.__menus[name].set_target(target)
+        receiver()
+        return True
+
+    def unregister(self, name: str) -> None:
+        """Forget the menu registered as name, and delete it"""
+        self.__builders.pop(name, None)
+        if name in self.__pending:
+            self.__pending.remove(name)
+        menu = self.__menus.pop(name, None)
+        if menu is not None:
+            menu.delete_later()
+            # Shortcuts it replaced are back to their menus
+            self.__shortcuts = {}
+            for menu_name, built_menu in self.__menus.items():
+                self.__index_shortcuts(menu_name, built_menu)
+
+    def __build(self, name: str) -> None:
+        menu = QQuickContextMenu()
+        with _stall_watchdog.running(f'QContextMenuRegistry menu {name!r}'):
+            self.__builders[name](menu)
+        menu.ensure_polished()
+        menu.adjust_size()
+        menu.create_win_id()
+
+        if name in self.__pending:
+            self.__pending.remove(name)
+        self.__menus[name] = menu
+        self.__index_shortcuts(name, menu, warn=True)
+
+    def __build_pending(self) -> None:
+        while self.__pending:
+            self.__build(self.__pending[0])
+
+    def __index_shortcuts(
+            self, name: str, menu: QQuickContextMenu, warn: bool = False
+            ) -> None:
+        # Menus built later win the shortcuts they share
+        for shortcut, (text, receiver) in menu.shortcuts().items():
+            if warn and shortcut in self.__shortcuts:
+                logging.warning(
+                    'Shortcut %s of the %r menu replaces the one of %r',
+                    shortcut, name, self.__shortcuts[shortcut][0])
+            self.__shortcuts[shortcut] = (name, text, receiver)
+
+    def __prebuild(self) -> None:
+        # One menu per event loop pass, so that input is not held up
+        if self.__pending:
+            self.__build(self.__pending[0])
+        if not self.__pending:
+            self.__prebuild_timer.stop()
+
+    def __str__(self) -> str:
+        return f'QContextMenuRegistry({len(self.__builders)})'
+
+    def __repr__(self) -> str:
+        return 'QContextMenuRegistry(object)'
+
+
+class _QContextMenuShortcutHandler(QtCore.QObject):
+    """Event filter passing the key presses of a widget to a registry"""
+
+    def __init__(
+            self, registry: QContextMenuRegistry, target: object,
+            *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.__registry = registry
+        self.__target = target
+
+    def event_filter(self, watched: QtCore.QObject, event: QtCore.QEvent
+                     ) -> bool:
+        if event.type() == QtCore.QEvent.KeyPress and event.key() not in (
+                QtCore.Qt.Key_Control, QtCore.Qt.Key_Shift,
+                QtCore.Qt.Key_Alt, QtCore.Qt.Key_Meta):
+            return self.__registry.trigger_shortcut(
+                QtGui.QKeySequence(event.key_combination()), self.__target)
+        return super().event_filter(watched, event)
+
+
+_context_menu_registry = QContextMenuRegistry()
 
 
 class QSidePanelApplicationWindow(QtWidgetsX.QApplicationWindow):
     """Window with side panel"""
     adaptive_mode_signal = QtCore.Signal(object)
+    layout_state_signal = QtCore.Signal(object, object)
     move_event_signal = QtCore.Signal(object)
     panel_opened_signal = QtCore.Signal(object)
     panel_closed_signal = QtCore.Signal(object)
     wide_mode_signal = QtCore.Signal(object)
+    __instrumentation = None
 
     def __init__(self, *args, **kwargs) -> None:
         """Class constructor
@@ -153,10 +2593,70 @@ class QSidePanelApplicationWindow(QtWidgetsX.QApplicationWindow):
         self.__panel_width = 250
         self.__panel_color_default = (0, 0, 0, 0.05)
         self.__panel_color = self.__panel_color_default
-        self.__horizontal_and_vertical_flip_width = 650
+        self.__is_panel_palette_mode_enabled = False
+        self.__is_panel_cached_shadow_enabled = True
+        self.__panel_animation_duration = 180
+        self.__panel_animation_easing_curve = QtCore.QEasingCurve(
+            QtCore.QEasingCurve.OutCubic)
+        self.__horizontal_and_vertical_flip_hysteresis = 8
         self.__is_vertical = False
+        self.__breakpoints = (
+            QBreakpoint('compact', 0, 'overlay'), QBreakpoint('wide', 650))
+        self.__breakpoint_widths = [
+            x.minimum_width for x in self.__breakpoints]
+        self.__layout_state = self.__breakpoints[-1]
+        self.__layout_index = len(self.__breakpoints) - 1
         self.__application_style_sheet = self.__parse_application_style()
 
+        # Resize coalescing: bursts of resize events are merged into a
+        # single layout pass per frame (~16ms)
+        self.__is_resize_coalescing_enabled = True
+        self.__merged_resize_events = 0
+        self.__resize_timer = QtCore.QTimer(self)
+        self.__resize_timer.set_single_shot(True)
+        self.__resize_timer.set_interval(16)
+        self.__resize_timer.timeout.connect(self.__apply_resize)
+        self.__is_applying_resize = False
+
+        # Move coalescing: a drag emits move_event_signal once per frame,
+        # with the position reached and the one the drag started from
+        self.__is_move_coalescing_enabled = True
+        self.__merged_move_events = 0
+        self.__move_old_pos = None
+        self.__is_emitting_move = False
+        self.__move_timer = QtCore.QTimer(self)
+        self.__move_timer.set_single_shot(True)
+        self.__move_timer.set_interval(16)
+        self.__move_timer.timeout.connect(self.__emit_move_event)
+
+        self.__panel_navigation = None
+        self.__panel_navigation_button = None
+        self.__page_stack = None
+        self.__page_model = None
+        self.__updates_suspended = 0
+        self.__is_panel_icons_only = False
+        self.__instrumentation_hud = None
+        self.__task_runner = None
+        self.__task_busy_indicator = None
+        self.__style_sheet_watcher = None
+        # Selectors of the widget sheets set since the window sheet
+        self.__window_style_sheet = ''
+        self.__restyled_selectors = frozenset()
+        self.__style_ids = itertools.count(1)
+        self.__child_polish_filter = _QChildPolishFilter(
+            self.__restyle_new_widget, self)
+        self.__state_key = None
+        self.__is_panel_open_restored = False
+
+        # The overlay panel is built the first time it is needed and torn
+        # down after an idle period in wide mode
+        self.__panel_overlay = None
+        self.__panel_overlay_idle_timer = QtCore.QTimer(self)
+        self.__panel_overlay_idle_timer.set_single_shot(True)
+        self.__panel_overlay_idle_timer.set_interval(60000)
+        self.__panel_overlay_idle_timer.timeout.connect(
+            self.__destroy_panel_overlay)
+
         # Settings
         self.set_window_title('MPX Application Window')
         self.set_minimum_width(self.__minimum_width)
@@ -164,8 +2664,7 @@ class QSidePanelApplicationWindow(QtWidgetsX.QApplicationWindow):
         self.resize(self.__initial_width(), 500)
 
         # Icon
-        icon_path = os.path.join(SRC_DIR, 'icon.svg')
-        self.__app_icon = QtGui.QIcon(QtGui.QPixmap(icon_path))
+        self.__app_icon = _icon_registry.icon('icon')
         self.set_window_icon(self.__app_icon)
 
         # Main layout
@@ -175,7 +2674,7 @@ class QSidePanelApplicationWindow(QtWidgetsX.QApplicationWindow):
         self.central_widget().set_layout(self.__main_box)
 
         # Side view
-        self.__widget_for_panel_width = QtWidgets.QWidget()
+        self.__widget_for_panel_width = _QPanelFrame()
         self.__widget_for_panel_width.set_fixed_width(self.__panel_width)
         self.__main_box.add_widget(self.__widget_for_panel_width, 9)
 
@@ -185,6 +2684,7 @@ class QSidePanelApplicationWindow(QtWidgetsX.QApplicationWindow):
         self.__widget_for_panel_width.set_layout(self.__panel_main_box)
 
         self.__panel_sender = QtWidgets.QWidget()
+        self.__panel_sender.install_event_filter(self)
         self.__panel_main_box.add_widget(self.__panel_sender)
 
         self.__panel_internal_box = QtWidgets.QVBoxLayout()
@@ -206,7 +2706,7 @@ class QSidePanelApplicationWindow(QtWidgetsX.QApplicationWindow):
         self.__panel_close_button.set_visible(False)
         self.__panel_close_button.clicked.connect(self.close_panel)
         self.__panel_close_button.set_icon(
-            QtGui.QIcon.from_theme('arrow-left'))
+            _icon_registry.icon('arrow-left'))
         self.__header_bar_box.add_widget(self.__panel_close_button)
 
         # Side panel layou 4 user
@@ -216,11 +2716,6 @@ class QSidePanelApplicationWindow(QtWidgetsX.QApplicationWindow):
             self.__border_size, 0, self.__border_size, self.__border_size)
         self.__panel_internal_box.add_layout(self.__panel_for_user)
 
-        self.__panel_overlay = _QOverlaySidePanel(self.__panel_sender)
-        self.__panel_overlay.panel_closed_signal.connect(
-            self.__panel_was_closed_signal)
-        self.__panel_overlay.set_fixed_width(self.__panel_width)
-
         self.__set_panel_background_color()
         self.__set_panel_color()
 
@@ -235,8 +2730,8 @@ class QSidePanelApplicationWindow(QtWidgetsX.QApplicationWindow):
 
         self.__open_panel_button = QtWidgets.QToolButton()
         self.__open_panel_button.set_icon(
-            QtGui.QIcon.from_theme('page-2sides'))  # sidebar-collapse
-        self.__open_panel_button.clicked.connect(self.__on_open_panel_button)
+            _icon_registry.icon('page-2sides'))  # sidebar-collapse
+        self.__open_panel_button.clicked.connect(self.open_panel)
         self.__frame_view_header_bar.add_widget_to_left(
             self.__open_panel_button)
         self.__open_panel_button.set_visible(False)
@@ -246,32 +2741,211 @@ class QSidePanelApplicationWindow(QtWidgetsX.QApplicationWindow):
             self.__border_size, 0, self.__border_size, self.__border_size)
         self.__frame_view_top_box.add_layout(self.__frame_view_box, 9)
 
+        # Adaptive layout: every breakpoint is compiled to the values of
+        # these setters, and transitions only call the ones that change
+        self.__layout_setters = {
+            'panel-visible': self.__widget_for_panel_width.set_visible,
+            'panel-width': self.__widget_for_panel_width.set_fixed_width,
+            'frame-left-buttons': (
+                self.__frame_view_header_bar
+                .set_left_control_buttons_visible),
+            'open-button': self.__open_panel_button.set_visible,
+            'move-area': self.__panel_header_bar.set_move_area_as_enable,
+            'close-button': self.__panel_close_button.set_visible,
+            'icons-only': self.__set_panel_icons_only}
+        self.__compile_layout_states()
+        self.__layout_values = self.__layout_states[self.__layout_index]
+
         # Signals
         self.resize_event_signal.connect(self.__resize_event)
         self.set_style_signal.connect(lambda _: self.set_panel_color())
         self.reset_style_signal.connect(self.__reset_style)
 
+    def add_page(
+            self, name: object, factory: callable, title: str = None
+            ) -> None:
+        """Add a page to the frame view, with an entry in the panel
+
+        The page is built by factory when its entry is activated, and
+        cached as described in QPageStack.
+
+        :param name: Page name
+        :param factory: Callable returning the page widget
+        :param title: Panel entry text, the name by default
+        """
+        if self.__page_model is None:
+            self.__page_model = QtGui.QStandardItemModel(self)
+            self.panel_navigation().set_model(self.__page_model)
+            self.__panel_navigation.item_activated_signal.connect(
+                lambda x: self.set_current_page(x.data(QtCore.Qt.UserRole)))
+
+        if name in self.page_stack().page_names():
+            self.remove_page(name)
+        item = QtGui.QStandardItem(title or str(name))
+        item.set_data(name, QtCore.Qt.UserRole)
+        self.__page_model.append_row(item)
+        self.__page_stack.add_page(name, factory)
+
+    def breakpoints(self) -> tuple:
+        """..."""
+        return self.__breakpoints
+
+    def build_contents(self) -> None:
+        """Fill the panel and frame view, and connect the MPX signals
+
+        Does nothing by default. Subclasses that build contents of their
+        own override it and call it at the end of their __init__.
+        reset_contents() calls it again after clearing the window, so a
+        window recycled by a QWindowPool matches a new one.
+        """
+
+    def close_event(self, event: QtGui.QCloseEvent) -> None:
+        """..."""
+        super().close_event(event)
+        if self.__state_key is not None and event.is_accepted():
+            _window_state_cache.save(self.__state_key, self.save_state())
+
     def close_panel(self) -> None:
         """..."""
-        self.__panel_overlay.close_panel()
+        if self.__panel_overlay is not None:
+            self.__panel_overlay.close_panel()
+
+    def context_menu_registry(self) -> QContextMenuRegistry:
+        """Process wide prebuilt context menus, shared by every window"""
+        return _context_menu_registry
+
+    def event(self, event: QtCore.QEvent) -> bool:
+        """..."""
+        # Instrumentation is off unless enabled, at the cost of this test
+        if self.__instrumentation is None:
+            return super().event(event)
+        return self.__instrumentation.time_event(
+            'window', event, super().event)
+
+    def event_filter(self, watched: QtCore.QObject, event: QtCore.QEvent
+                     ) -> bool:
+        """..."""
+        if (watched is self.__panel_sender and
+                event.type() == QtCore.QEvent.ChildPolished and
+                self.__is_panel_icons_only and
+                event.child().is_widget_type()):
+            # Added to the rail, shown icon only from its first paint
+            self.__set_widget_icons_only(event.child(), True)
+        return super().event_filter(watched, event)
 
     def frame_view_layout(self) -> QtWidgets.QVBoxLayout:
         """..."""
         return self.__frame_view_box
 
+    def horizontal_and_vertical_flip_hysteresis(self) -> int:
+        """..."""
+        return self.__horizontal_and_vertical_flip_hysteresis
+
     def horizontal_and_vertical_flip_width(self) -> int:
+        """Minimum width of the first breakpoint that docks the panel"""
+        return next((x.minimum_width for x in self.__breakpoints
+                     if x.panel_mode != 'overlay'), 0)
+
+    def icon_registry(self) -> QIconRegistry:
+        """Process wide icon cache, shared by every window"""
+        return _icon_registry
+
+    def instrumentation(self) -> QEventInstrumentation:
+        """Event timings of the window and overlay, None when disabled"""
+        return self.__instrumentation
+
+    def layout_state(self) -> QBreakpoint:
         """..."""
-        return self.__horizontal_and_vertical_flip_width
+        return self.__layout_state
+
+    def merged_move_events(self) -> int:
+        """Number of move events merged into an already scheduled signal"""
+        return self.__merged_move_events
+
+    def merged_resize_events(self) -> int:
+        """Number of resize events merged into an already scheduled pass"""
+        return self.__merged_resize_events
 
     def move_event(self, event: QtGui.QMoveEvent) -> None:
         """..."""
-        self.move_event_signal.emit(event)
-        self.__panel_overlay.move(self.x(), self.y())
+        # A slot that moves the window again is answered on the next frame
+        if self.__is_move_coalescing_enabled or self.__is_emitting_move:
+            if self.__move_timer.is_active():
+                self.__merged_move_events += 1
+            else:
+                self.__move_old_pos = event.old_pos()
+                self.__move_timer.start()
+            return
+        self.__is_emitting_move = True
+        try:
+            with _stall_watchdog.running('move_event_signal'):
+                self.move_event_signal.emit(event)
+        finally:
+            self.__is_emitting_move = False
+
+    def open_panel(self) -> None:
+        """Open the side panel over the window in adaptive mode"""
+        if not self.__is_vertical or self.__is_panel_open:
+            return
+
+        self.__build_panel_overlay().open_panel()
+        with _stall_watchdog.running('panel_opened_signal'):
+            self.panel_opened_signal.emit('panel-opened-signal')
+        self.__is_panel_open = True
+
+    def page_stack(self) -> QPageStack:
+        """Pages of the frame view, added to it on first use"""
+        if self.__page_stack is None:
+            self.__page_stack = QPageStack()
+            self.__frame_view_box.add_widget(self.__page_stack, 9)
+        return self.__page_stack
+
+    def panel_animation_duration(self) -> int:
+        """..."""
+        return self.__panel_animation_duration
+
+    def panel_animation_frame_times(self) -> list:
+        """Milliseconds between the frames of the last panel animation"""
+        if self.__panel_overlay is None:
+            return []
+        return self.__panel_overlay.animation_frame_times()
 
     def panel_color(self) -> tuple:
         """..."""
         return self.__panel_color
 
+    def panel_navigation(self) -> QNavigationPanel:
+        """Virtualized navigation list, added to the panel on first use
+
+        A search button is added to the panel header bar to toggle its
+        filter entry.
+        """
+        if self.__panel_navigation is None:
+            self.__panel_navigation = QNavigationPanel()
+            self.__panel_navigation.set_icons_only(
+                self.__is_panel_icons_only)
+            self.__panel_for_user.add_widget(self.__panel_navigation, 9)
+
+            self.__panel_navigation_button = QtWidgets.QToolButton()
+            self.__panel_navigation_button.set_checkable(True)
+            self.__panel_navigation_button.set_icon(
+                _icon_registry.icon('search'))
+            self.__panel_navigation_button.toggled.connect(
+                self.__panel_navigation.set_filter_visible)
+            self.__panel_navigation_button.set_visible(
+                not self.__is_panel_icons_only)
+            self.__panel_header_bar.add_widget_to_right(
+                self.__panel_navigation_button)
+        return self.__panel_navigation
+
+    def panel_overlay_idle_timeout(self) -> int:
+        """..."""
+        return self.__panel_overlay_idle_timer.interval()
+
+    def panel_palette_mode_enabled(self) -> bool:
+        """..."""
+        return self.__is_panel_palette_mode_enabled
+
     def panel_header_bar(self) -> QtWidgetsX.QHeaderBar:
         """..."""
         return self.__panel_header_bar
@@ -280,11 +2954,164 @@ class QSidePanelApplicationWindow(QtWidgetsX.QApplicationWindow):
         """..."""
         return self.__panel_for_user
 
+    def remove_page(self, name: object) -> None:
+        """..."""
+        if self.__page_stack is None:
+            return
+
+        self.__page_stack.remove_page(name)
+        for row in range(self.__page_model.row_count()):
+            if self.__page_model.item(row).data(QtCore.Qt.UserRole) == name:
+                self.__page_model.remove_row(row)
+                break
+
+    def reset_contents(self) -> None:
+        """Bring the window back to how it was built, to reuse it
+
+        The panel is closed, the panel and frame view contents and the
+        navigation panel are deleted, the titles are reset, pending tasks
+        are cancelled, the state key is dropped and the MPX signals are
+        disconnected. Widgets added to the header bars are kept. Then
+        build_contents() builds the contents of the subclass again.
+        """
+        self.__close_panel_immediately()
+        with self.updates_suspended():
+            self.__clear_layout(self.__panel_for_user)
+            self.__clear_layout(self.__frame_view_box)
+        if self.__panel_navigation_button is not None:
+            self.__panel_navigation_button.hide()
+            self.__panel_navigation_button.delete_later()
+        self.__panel_navigation = None
+        self.__panel_navigation_button = None
+        self.__page_stack = None
+        if self.__page_model is not None:
+            self.__page_model.delete_later()
+            self.__page_model = None
+
+        self.set_window_title('MPX Application Window')
+        self.set_header_bar_title('')
+        self.__state_key = None
+        if self.__task_runner is not None:
+            for key in self.__task_runner.pending_keys():
+                self.__task_runner.cancel(key)
+
+        with warnings.catch_warnings():
+            # Disconnecting a signal without receivers warns
+            warnings.simplefilter('ignore', RuntimeWarning)
+            for signal in (
+                    self.adaptive_mode_signal, self.layout_state_signal,
+                    self.move_event_signal, self.panel_opened_signal,
+                    self.panel_closed_signal, self.wide_mode_signal):
+                try:
+                    signal.disconnect()
+                except RuntimeError:
+                    pass
+        self.build_contents()
+
+    def restore_state(self, state: dict) -> bool:
+        """Restore a state made by save_state()
+
+        Restored before the first show, the window is built in its final
+        layout state, so that showing it takes a single layout pass and a
+        restored open panel is open in the first frame. A saved position
+        that is on no screen is ignored. Returns False, changing nothing,
+        when the state cannot be used.
+        """
+        names = [breakpoint.name for breakpoint in self.__breakpoints]
+        try:
+            x, y, width, height = (int(value) for value in state['geometry'])
+            index = names.index(state['mode'])
+            panel_width = int(state['panel_width'])
+            panel_color = tuple(state['panel_color'])
+            is_maximized = bool(state['maximized'])
+            is_panel_open = bool(state['panel_open'])
+        except (KeyError, TypeError, ValueError):
+            return False
+        if len(panel_color) != 4:
+            return False
+
+        if panel_width != self.__panel_width:
+            self.set_panel_fixed_width(panel_width)
+        if panel_color != self.__panel_color:
+            self.set_panel_color(panel_color)
+        self.resize(width, height)
+        if QtGui.QGuiApplication.screen_at(
+                QtCore.QRect(x, y, width, height).center()) is not None:
+            self.move(x, y)
+
+        # The saved state wins inside the hysteresis band, where both
+        # states are valid for the width
+        width = self.width()
+        hysteresis = self.__horizontal_and_vertical_flip_hysteresis
+        if not (self.__breakpoint_index(width - hysteresis) <= index <=
+                self.__breakpoint_index(width + hysteresis)):
+            index = self.__breakpoint_index(width)
+        if index != self.__layout_index:
+            self.__apply_layout_index(index)
+
+        if is_maximized:
+            self.set_window_state(
+                self.window_state() | QtCore.Qt.WindowMaximized)
+        self.__is_panel_open_restored = (
+            is_panel_open and self.__is_vertical and not is_maximized)
+        if self.__is_panel_open_restored and self.is_visible():
+            self.__open_restored_panel()
+        return True
+
+    def run_task(self, key: object, function: callable, *args, **kwargs
+                 ) -> None:
+        """Run function off the GUI thread, see QTaskRunner.submit()
+
+            window.run_task(
+                'open-image', QImage, path, callback=self.show_image)
+        """
+        self.task_runner().submit(key, function, *args, **kwargs)
+
+    def save_state(self) -> dict:
+        """Geometry, layout state and panel state, for restore_state()"""
+        position, size = self.pos(), self.size()
+        if self.is_maximized() or self.is_full_screen():
+            geometry = self.normal_geometry()
+            if geometry.is_valid():
+                position, size = geometry.top_left(), geometry.size()
+        return {
+            'geometry': [
+                position.x(), position.y(), size.width(), size.height()],
+            'maximized': self.is_maximized(),
+            'mode': self.__layout_state.name,
+            'panel_width': self.__panel_width,
+            'panel_color': list(self.__panel_color),
+            'panel_open': self.__is_panel_open}
+
+    def set_breakpoints(self, breakpoints: list) -> None:
+        """Replace the breakpoint table
+
+        The table is sorted by minimum width. The first breakpoint also
+        applies below its minimum width.
+
+        :param breakpoints: List of QBreakpoint
+        """
+        if not breakpoints:
+            raise ValueError('At least one breakpoint is required')
+
+        self.__breakpoints = tuple(
+            sorted(breakpoints, key=lambda x: x.minimum_width))
+        self.__breakpoint_widths = [
+            x.minimum_width for x in self.__breakpoints]
+        self.__compile_layout_states()
+        self.__layout_index = None
+        self.__update_layout_state()
+
     def set_close_window_button_visible(self, visible: bool) -> None:
         """..."""
         self.__panel_header_bar.set_close_window_button_visible(visible)
         self.__frame_view_header_bar.set_close_window_button_visible(visible)
 
+    def set_current_page(self, name: object) -> None:
+        """Show a page added with add_page(), closing the adaptive panel"""
+        self.page_stack().set_current_page(name)
+        self.close_panel()
+
     def set_header_bar_icon(self, icon: QtGui.QIcon) -> None:
         """..."""
         self.set_window_icon(icon)
@@ -295,9 +3122,50 @@ class QSidePanelApplicationWindow(QtWidgetsX.QApplicationWindow):
         """..."""
         self.__frame_view_header_bar.set_text(text)
 
-    def set_horizontal_and_vertical_flip_width(self, width: int) -> None:
+    def resize_coalescing_enabled(self) -> bool:
         """..."""
-        self.__horizontal_and_vertical_flip_width = width
+        return self.__is_resize_coalescing_enabled
+
+    def set_horizontal_and_vertical_flip_hysteresis(self, width: int) -> None:
+        """Pixels around each breakpoint where the current state is kept"""
+        self.__horizontal_and_vertical_flip_hysteresis = max(0, width)
+
+    def set_horizontal_and_vertical_flip_width(self, width: int) -> None:
+        """Use a compact (overlay) and a wide breakpoint split at width"""
+        self.set_breakpoints([
+            QBreakpoint('compact', 0, 'overlay'), QBreakpoint('wide', width)])
+
+    def set_instrumentation_enabled(self, enabled: bool) -> None:
+        """Count and time resize, move, polish and paint events
+
+        The window and the overlay panel are instrumented. Disabling it
+        drops the statistics and hides the debug HUD.
+        """
+        if enabled == (self.__instrumentation is not None):
+            return
+
+        self.__instrumentation = QEventInstrumentation() if enabled else None
+        if self.__panel_overlay is not None:
+            self.__panel_overlay.set_instrumentation(self.__instrumentation)
+        if self.__instrumentation_hud is not None:
+            self.__instrumentation_hud.set_instrumentation(
+                self.__instrumentation)
+            if not enabled:
+                self.__instrumentation_hud.hide()
+
+    def set_instrumentation_hud_visible(self, visible: bool) -> None:
+        """Show the event timings over the window, for debugging
+
+        Showing the HUD enables the instrumentation.
+        """
+        if visible:
+            self.set_instrumentation_enabled(True)
+            if self.__instrumentation_hud is None:
+                self.__instrumentation_hud = _QInstrumentationHud(
+                    self.__instrumentation, self)
+            self.__instrumentation_hud.show()
+        elif self.__instrumentation_hud is not None:
+            self.__instrumentation_hud.hide()
 
     def set_left_control_buttons_visible(self, visible: bool) -> None:
         """..."""
@@ -322,116 +3190,633 @@ class QSidePanelApplicationWindow(QtWidgetsX.QApplicationWindow):
         self.__set_panel_background_color()
         self.__set_panel_color()
 
+    def set_panel_animation_duration(self, msecs: int) -> None:
+        """Duration of the panel slide animation, 0 disables it"""
+        self.__panel_animation_duration = msecs
+        if self.__panel_overlay is not None:
+            self.__panel_overlay.set_animation_duration(msecs)
+
+    def set_panel_animation_easing_curve(
+            self, easing: QtCore.QEasingCurve) -> None:
+        """..."""
+        self.__panel_animation_easing_curve = QtCore.QEasingCurve(easing)
+        if self.__panel_overlay is not None:
+            self.__panel_overlay.set_animation_easing_curve(easing)
+
+    def set_panel_cached_shadow_enabled(self, enabled: bool) -> None:
+        """Draw the overlay panel shadow from a pre-rendered pixmap
+
+        Enabled by default. When disabled, the panel uses the slower
+        QGraphicsDropShadowEffect.
+        """
+        self.__is_panel_cached_shadow_enabled = enabled
+        if self.__panel_overlay is not None:
+            self.__panel_overlay.set_cached_shadow_enabled(enabled)
+
+    def set_panel_overlay_idle_timeout(self, msecs: int) -> None:
+        """Time in wide mode after which the unused overlay is destroyed
+
+        The overlay is rebuilt on demand. 0 keeps it alive once built.
+        """
+        self.__panel_overlay_idle_timer.set_interval(msecs)
+        if msecs <= 0:
+            self.__panel_overlay_idle_timer.stop()
+
+    def set_panel_palette_mode_enabled(self, enabled: bool) -> None:
+        """Theme the panel through QPalette instead of style sheets
+
+        Panel colour, background and radii are painted from the palette.
+        Rules a palette cannot express still use a style sheet.
+        """
+        self.__is_panel_palette_mode_enabled = enabled
+        self.__set_panel_background_color()
+        self.__set_panel_color()
+
     def set_panel_fixed_width(self, width: int) -> None:
         """..."""
         self.__panel_width = width
-        self.__widget_for_panel_width.set_fixed_width(self.__panel_width)
-        self.__panel_overlay.set_fixed_width(self.__panel_width)
+        self.__compile_layout_states()
+        if self.__layout_index is not None:
+            self.__apply_layout_values(
+                self.__layout_states[self.__layout_index])
+        if self.__panel_overlay is not None:
+            self.__panel_overlay.set_fixed_width(self.__panel_width)
+
+    def set_move_coalescing_enabled(self, enabled: bool) -> None:
+        """Emit move_event_signal at most once per frame
+
+        When disabled, every move event is emitted immediately.
+        """
+        self.__is_move_coalescing_enabled = enabled
+        if not enabled and self.__move_timer.is_active():
+            self.__move_timer.stop()
+            self.__emit_move_event()
+
+    def set_resize_coalescing_enabled(self, enabled: bool) -> None:
+        """Merge resize bursts into one layout pass per frame
+
+        When disabled, every resize event is handled immediately.
+        """
+        self.__is_resize_coalescing_enabled = enabled
+        if not enabled and self.__resize_timer.is_active():
+            self.__resize_timer.stop()
+            self.__apply_resize()
 
     def set_right_control_buttons_visible(self, visible: bool) -> None:
         """..."""
         self.__panel_header_bar.set_right_control_buttons_visible(visible)
 
+    def set_state_key(self, key: str) -> bool:
+        """Restore the state cached under key, and cache it there on close
+
+        Meant to be called before the first show, see restore_state().
+        Returns True if a state was restored.
+
+        :param key: Name of the window in the process wide
+            QWindowStateCache, or None to stop caching its state
+        """
+        self.__state_key = key
+        if key is None:
+            return False
+        state = _window_state_cache.state(key)
+        return state is not None and self.restore_state(state)
+
+    def set_style_sheet_file(self, path: str) -> None:
+        """Style the window from a QSS file, reloaded when it changes
+
+        The whole file becomes the window style sheet through
+        set_style_sheet(), so QApplicationWindow rules also theme the side
+        panel. A save that changes no rule, like an edited comment, is not
+        applied. A save that only changes widget rules restyles just the
+        widgets those rules match, existing or added later, each from a
+        sheet of the file rules that can select it, as setting the window
+        sheet again would re-polish every widget of the window. The window
+        sheet is set again when a QApplicationWindow rule changes, when a
+        rule or a property is removed, or when the rules match most of the
+        window. Widgets that have a style sheet of their own keep it, and
+        the panel colour is kept.
+
+        :param path: QSS file, shared by the windows that use it, or None
+            to stop following it and reset the style
+        """
+        previous_style_sheet = ''
+        if self.__style_sheet_watcher is not None:
+            watcher = self.__style_sheet_watcher
+            previous_style_sheet = watcher.style_sheet()
+            watcher.style_sheet_changed_signal.disconnect(
+                self.__apply_watched_style)
+            self.__style_sheet_watcher = None
+            _style_sheet_watchers.release(watcher.path(), self)
+
+        style_sheet = ''
+        if path is not None:
+            self.__style_sheet_watcher = _style_sheet_watchers.acquire(
+                path, self)
+            self.__style_sheet_watcher.style_sheet_changed_signal.connect(
+                self.__apply_watched_style)
+            style_sheet = self.__style_sheet_watcher.style_sheet()
+
+        if _style_sheet_compiler.diff(previous_style_sheet, style_sheet):
+            self.__apply_watched_style()
+
+    def set_task_busy_indicator_visible(self, visible: bool) -> None:
+        """Show a busy indicator in the header bar while tasks run"""
+        if not visible:
+            if self.__task_busy_indicator is not None:
+                self.__task_busy_indicator.delete_later()
+                self.__task_busy_indicator = None
+            return
+
+        if self.__task_busy_indicator is None:
+            self.__task_busy_indicator = QtWidgets.QProgressBar()
+            self.__task_busy_indicator.set_range(0, 0)
+            self.__task_busy_indicator.set_text_visible(False)
+            self.__task_busy_indicator.set_fixed_size(48, 6)
+            self.__frame_view_header_bar.add_widget_to_right(
+                self.__task_busy_indicator)
+        self.__update_task_busy_indicator(
+            self.__task_runner is not None and self.__task_runner.is_busy())
+
+    def show_event(self, event: QtGui.QShowEvent) -> None:
+        """..."""
+        super().show_event(event)
+        if self.__is_panel_open_restored:
+            self.__open_restored_panel()
+
+    def stall_watchdog(self) -> QStallWatchdog:
+        """Process wide event loop stall watchdog, started with start()
+
+        Stalls are recorded with the window signal, or the quick context
+        menu action, that was running.
+        """
+        return _stall_watchdog
+
+    def state_cache(self) -> QWindowStateCache:
+        """Process wide cache of the window states, see set_state_key()"""
+        return _window_state_cache
+
+    def state_key(self) -> str:
+        """..."""
+        return self.__state_key
+
+    def style_sheet_file(self) -> str:
+        """Path of the followed QSS file, or None"""
+        if self.__style_sheet_watcher is None:
+            return None
+        return self.__style_sheet_watcher.path()
+
+    def task_runner(self) -> QTaskRunner:
+        """Runner of the window tasks, created on first use"""
+        if self.__task_runner is None:
+            self.__task_runner = QTaskRunner(self)
+            self.__task_runner.busy_signal.connect(
+                self.__update_task_busy_indicator)
+        return self.__task_runner
+
+    @contextlib.contextmanager
+    def updates_suspended(self):
+        """Context manager to populate the panel and frame view in bulk
+
+        Painting and layout activation of the panel, overlay and frame view
+        are turned off inside the block, and everything queued is laid out
+        in one pass on exit. Blocks can be nested, only the outermost one
+        applies the changes.
+
+            with window.updates_suspended():
+                for name in names:
+                    window.panel_layout().add_widget(QPushButton(name))
+        """
+        layouts = [self.__main_box, self.__panel_main_box,
+                   self.__panel_internal_box]
+        if self.__panel_overlay is not None:
+            layouts.append(self.__panel_overlay.layout())
+
+        self.__updates_suspended += 1
+        if self.__updates_suspended == 1:
+            self.set_updates_enabled(False)
+            for layout in layouts:
+                layout.set_enabled(False)
+        try:
+            yield self
+        finally:
+            self.__updates_suspended -= 1
+            if self.__updates_suspended == 0:
+                for layout in layouts:
+                    layout.set_enabled(True)
+                    layout.activate()
+                self.set_updates_enabled(True)
+
     def __parse_application_style(self) -> str:
         """..."""
-        return '; '.join(
-            [x.replace('#QApplicationWindow', '').replace('{', '').strip()
-             for x in self.style_sheet().split('}')
-             if 'QApplicationWindow' in x][-1].split(';'))
+        return _style_sheet_compiler.declarations(
+            self.style_sheet(), 'QApplicationWindow')
 
     def __set_panel_background_color(self) -> None:
         """..."""
+        if self.__panel_overlay is None:
+            return
+
+        if self.__set_panel_palette_style(
+                self.__panel_overlay.panel_background(),
+                f'{self.__application_style_sheet}'
+                'border: 0px; '
+                'border-top-right-radius: 0;'
+                'border-bottom-right-radius: 0'):
+            return
+
+        style_sheet = _style_sheet_compiler.compile(
+            ('panel-background', self.__application_style_sheet),
+            lambda: (
+                '#__overlaypanelbackgroundstyle {'
+                f'{self.__application_style_sheet}'
+                'border: 0px; '
+                'border-top-right-radius: 0;'
+                'border-bottom-right-radius: 0}'))
+
         self.__panel_overlay.panel_background().set_object_name(
             '__overlaypanelbackgroundstyle')
-        self.__panel_overlay.panel_background().set_style_sheet(
-            '#__overlaypanelbackgroundstyle {'
-            f'{self.__application_style_sheet}'
-            'border: 0px; '
-            'border-top-right-radius: 0;'
-            'border-bottom-right-radius: 0}')
+        _style_sheet_compiler.apply(
+            self.__panel_overlay.panel_background(), style_sheet)
 
     def __set_panel_color(self) -> None:
         """..."""
-        panel_style = (
-            f'{self.__application_style_sheet}'
-            'background-color: rgba('
-            f'{self.__panel_color[0]}, {self.__panel_color[1]}, '
-            f'{self.__panel_color[2]}, {self.__panel_color[3]});'
-            'border: 0px; '
-            'border-top-right-radius: 0;'
-            'border-bottom-right-radius: 0;'
-            'padding: 0px;')
+        key = (self.__application_style_sheet, self.__panel_color)
+        panel_style = _style_sheet_compiler.compile(
+            ('panel',) + key,
+            lambda: (
+                f'{self.__application_style_sheet}'
+                'background-color: rgba('
+                f'{self.__panel_color[0]}, {self.__panel_color[1]}, '
+                f'{self.__panel_color[2]}, {self.__panel_color[3]});'
+                'border: 0px; '
+                'border-top-right-radius: 0;'
+                'border-bottom-right-radius: 0;'
+                'padding: 0px;'))
 
         self.__widget_for_panel_width.set_object_name('__panelwidthstyle')
-        self.__widget_for_panel_width.set_style_sheet(
-            '#__panelwidthstyle {' + panel_style + 'margin: 1px 0px 1px 1px;}')
-
-        self.__panel_overlay.panel().set_object_name('__paneloverlaystyle')
-        self.__panel_overlay.panel().set_style_sheet(
-            self.style_sheet() + '#__paneloverlaystyle {' + panel_style + '}')
-
-        # self.__panel_sender.set_style_sheet(self.style_sheet())
+        if not self.__set_panel_palette_style(
+                self.__widget_for_panel_width,
+                panel_style + 'margin: 1px 0px 1px 1px;'):
+            _style_sheet_compiler.apply(
+                self.__widget_for_panel_width,
+                '#__panelwidthstyle {' + panel_style +
+                'margin: 1px 0px 1px 1px;}')
+
+    def __apply_watched_style(self, selectors: frozenset = None) -> None:
+        # Setting the window sheet re-polishes every widget of the window,
+        # so the widgets the changed rules match are restyled instead
+        style_sheet = ''
+        if self.__style_sheet_watcher is not None:
+            style_sheet = self.__style_sheet_watcher.style_sheet()
+        widget_rules = None
+        if selectors:
+            widget_rules = self.__watched_widget_rules(selectors, style_sheet)
+        if widget_rules is None:
+            self.__set_watched_window_style(style_sheet)
+            return
+
+        if not self.__restyled_selectors:
+            for widget in [self, *self.find_children(QtWidgets.QWidget)]:
+                self.__watch_new_widget(widget)
+        self.__restyled_selectors |= selectors
+        for widget, rules in widget_rules:
+            self.__restyle_widget(widget, rules)
+
+    def __is_restylable(self, widget: QtWidgets.QWidget) -> bool:
+        # Panels are themed by the window, other sheets are the user's
+        return not isinstance(widget, _QPanelFrame) and (
+            not widget.style_sheet() or
+            widget.property('mpx_style_id') is not None)
+
+    def __restyle_new_widget(self, widget: QtWidgets.QWidget) -> None:
+        # Added after a save, the window sheet has the rules of before it
+        if not self.__restyled_selectors or self.__style_sheet_watcher is None:
+            return
+        style_sheet = self.__style_sheet_watcher.style_sheet()
+        for widget in [widget, *widget.find_children(QtWidgets.QWidget)]:
+            if widget.property('mpx_style_watched'):
+                continue
+            self.__watch_new_widget(widget)
+            if not self.__is_restylable(widget) or not any(
+                    _style_sheet_compiler.matches(widget, x)
+                    for x in self.__restyled_selectors):
+                continue
+            rules = self.__widget_rules(widget, style_sheet)
+            if rules is None:
+                self.__set_watched_window_style(style_sheet)
+                return
+            self.__restyle_widget(widget, rules)
+
+    def __restyle_widget(self, widget: QtWidgets.QWidget, rules: list
+                         ) -> None:
+        # The rules are narrowed to the widget, its children keep the ones
+        # of the window sheet
+        style_id = widget.property('mpx_style_id')
+        if style_id is None:
+            style_id = next(self.__style_ids)
+            widget.set_property('mpx_style_id', style_id)
+        attribute = f'[mpx_style_id="{style_id}"]'
+        _style_sheet_compiler.apply(widget, ''.join(
+            f'{_style_sheet_compiler.scope(x, attribute)} {{{y}}}'
+            for x, y in rules))
+
+    def __set_watched_window_style(self, style_sheet: str) -> None:
+        # The widget sheets of earlier saves are in the new window sheet
+        for widget in self.find_children(QtWidgets.QWidget):
+            if widget.property('mpx_style_watched'):
+                widget.remove_event_filter(self.__child_polish_filter)
+                widget.set_property('mpx_style_watched', None)
+            if widget.property('mpx_style_id') is not None:
+                widget.set_property('mpx_style_id', None)
+                widget.set_style_sheet('')
+        self.remove_event_filter(self.__child_polish_filter)
+        self.set_property('mpx_style_watched', None)
+        self.__restyled_selectors = frozenset()
+        self.__window_style_sheet = style_sheet
+
+        # Both reset the panel colour to the default
+        panel_color = self.__panel_color
+        if style_sheet.strip():
+            self.set_style_sheet(style_sheet)
+        else:
+            self.reset_style()
+        self.set_panel_color(panel_color)
+
+    def __watch_new_widget(self, widget: QtWidgets.QWidget) -> None:
+        widget.install_event_filter(self.__child_polish_filter)
+        widget.set_property('mpx_style_watched', True)
+
+    def __watched_widget_rules(
+            self, selectors: frozenset, style_sheet: str) -> list:
+        # (widget, rules) pairs of the widgets the selectors match, or None
+        # when the window sheet has to be set: a widget sheet cannot remove
+        # what the window sheet declares, nor be cheaper for most widgets
+        if any('QApplicationWindow' in x for x in selectors):
+            return None
+        old = _style_sheet_compiler.properties(self.__window_style_sheet)
+        new = _style_sheet_compiler.properties(style_sheet)
+        if any(not old[x] <= new.get(x, set())
+               for x in self.__restyled_selectors | selectors if x in old):
+            return None
+
+        widgets = self.find_children(QtWidgets.QWidget)
+        widget_rules = []
+        for widget in widgets:
+            if not self.__is_restylable(widget) or not any(
+                    _style_sheet_compiler.matches(widget, x)
+                    for x in selectors):
+                continue
+            rules = self.__widget_rules(widget, style_sheet)
+            if rules is None:
+                return None
+            widget_rules.append((widget, rules))
+        if len(widget_rules) * 2 > len(widgets):
+            return None
+        return widget_rules
+
+    @staticmethod
+    def __widget_rules(widget: QtWidgets.QWidget, style_sheet: str) -> list:
+        # Every rule that can select the widget, so that their specificity
+        # still decides between them, or None if one depends on the window
+        rules = [x for x in _style_sheet_compiler.rules(style_sheet)
+                 if _style_sheet_compiler.matches(widget, x[0])]
+        if any('QApplicationWindow' in x for x, _ in rules):
+            return None
+        return rules
+
+    def __set_panel_palette_style(
+            self, widget: _QPanelFrame, declarations: str) -> bool:
+        # Palette mode, if enabled and the rule can be drawn without a sheet
+        style = None
+        if self.__is_panel_palette_mode_enabled:
+            style = _style_sheet_compiler.palette_style(declarations)
+        widget.set_palette_style(style)
+        return style is not None
+
+    def __close_panel_immediately(self) -> None:
+        if self.__panel_overlay is not None:
+            self.__panel_overlay.close_panel(animated=False)
+
+    def __build_panel_overlay(self) -> _QOverlaySidePanel:
+        if self.__panel_overlay is None:
+            self.__panel_overlay = _QOverlaySidePanel(
+                self.__widget_for_panel_width)
+            self.__panel_overlay.panel_closed_signal.connect(
+                self.__panel_was_closed_signal)
+            self.__panel_overlay.set_fixed_width(self.__panel_width)
+            self.__panel_overlay.set_cached_shadow_enabled(
+                self.__is_panel_cached_shadow_enabled)
+            self.__panel_overlay.set_animation_duration(
+                self.__panel_animation_duration)
+            self.__panel_overlay.set_animation_easing_curve(
+                self.__panel_animation_easing_curve)
+            self.__panel_overlay.set_instrumentation(self.__instrumentation)
+            self.__set_panel_background_color()
+        return self.__panel_overlay
+
+    def __destroy_panel_overlay(self) -> None:
+        if (self.__is_vertical or self.__panel_overlay is None or
+                self.__panel_overlay.is_visible()):
+            return
+
+        self.__panel_overlay.delete_later()
+        self.__panel_overlay = None
 
     def __initial_width(self) -> int:
         if self.screen().size().width() < self.__panel_width < 500:
             return self.__minimum_width
         return 750
 
-    def __on_open_panel_button(self) -> None:
-        self.__panel_overlay.open_panel()
-        self.panel_opened_signal.emit('panel-opened-signal')
-        self.__is_panel_open = True
+    def __open_restored_panel(self) -> None:
+        # Open in the first frame, without the slide
+        self.__is_panel_open_restored = False
+        panel_overlay = self.__build_panel_overlay()
+        panel_overlay.set_animation_duration(0)
+        self.open_panel()
+        panel_overlay.set_animation_duration(self.__panel_animation_duration)
 
     def __panel_was_closed_signal(self, event: QtCore.Signal) -> None:
         if self.__is_panel_open:
-            self.panel_closed_signal.emit(event)
+            with _stall_watchdog.running('panel_closed_signal'):
+                self.panel_closed_signal.emit(event)
             self.__is_panel_open = False
 
-    def __switch_vertical_and_horizontal_window(self) -> None:
-        # Vertical
-        if (not self.__is_vertical and self.size().width() <
-                self.__horizontal_and_vertical_flip_width):
-            self.__is_vertical = True
-            self.__switch_to_vertical()
-            self.adaptive_mode_signal.emit('adaptive-mode-signal')
-
-        # Horizontal
-        elif (self.__is_vertical and self.size().width() >
-              self.__horizontal_and_vertical_flip_width):
-            self.__is_vertical = False
-            self.__switch_to_horizontal()
-            self.wide_mode_signal.emit('wide-mode-signal')
-
-    def __switch_to_vertical(self) -> None:
-        self.__widget_for_panel_width.set_visible(False)
-        self.__frame_view_header_bar.set_left_control_buttons_visible(True)
-        self.__open_panel_button.set_visible(True)
-        self.__panel_header_bar.set_move_area_as_enable(False)
-        self.__panel_close_button.set_visible(True)
-
-    def __switch_to_horizontal(self) -> None:
-        self.__widget_for_panel_width.set_visible(True)
-        self.__frame_view_header_bar.set_left_control_buttons_visible(False)
-        self.__open_panel_button.set_visible(False)
-        self.__panel_header_bar.set_move_area_as_enable(True)
-        self.__panel_close_button.set_visible(False)
+    def __apply_layout_values(self, values: dict) -> None:
+        # One update-suspended pass over the setters that change. Updates
+        # stay off on exit inside an updates_suspended() block.
+        updates_enabled = self.updates_enabled()
+        self.set_updates_enabled(False)
+        try:
+            for key, value in values.items():
+                if self.__layout_values.get(key) != value:
+                    self.__layout_setters[key](value)
+        finally:
+            self.set_updates_enabled(updates_enabled)
+        self.__layout_values = values
+
+    def __set_panel_icons_only(self, icons_only: bool) -> None:
+        # A rail is too narrow for text, navigation entries and buttons
+        # show their icon and keep the text as tool tip
+        self.__is_panel_icons_only = icons_only
+        if self.__panel_navigation is not None:
+            self.__panel_navigation.set_icons_only(icons_only)
+        if self.__panel_navigation_button is not None:
+            self.__panel_navigation_button.set_visible(not icons_only)
+            if icons_only:
+                self.__panel_navigation_button.set_checked(False)
+        self.__set_widget_icons_only(self.__panel_sender, icons_only)
+
+    def __set_widget_icons_only(
+            self, widget: QtWidgets.QWidget, icons_only: bool) -> None:
+        # Buttons without an icon keep their text
+        buttons = widget.find_children(QtWidgets.QAbstractButton)
+        if isinstance(widget, QtWidgets.QAbstractButton):
+            buttons.append(widget)
+        for button in buttons:
+            text = button.property('mpx_rail_text')
+            if icons_only and text is None:
+                if not button.text() or button.icon().is_null():
+                    continue
+                button.set_property('mpx_rail_text', button.text())
+                if not button.tool_tip():
+                    button.set_tool_tip(button.text())
+                    button.set_property('mpx_rail_tool_tip', True)
+                button.set_text('')
+            elif not icons_only and text is not None:
+                button.set_text(text)
+                if button.property('mpx_rail_tool_tip'):
+                    button.set_tool_tip('')
+                button.set_property('mpx_rail_text', None)
+                button.set_property('mpx_rail_tool_tip', None)
+
+    def __breakpoint_index(self, width: int) -> int:
+        return max(0, bisect.bisect_right(self.__breakpoint_widths, width) - 1)
+
+    def __compile_layout_states(self) -> None:
+        self.__layout_states = []
+        for breakpoint in self.__breakpoints:
+            overlay = breakpoint.panel_mode == 'overlay'
+            self.__layout_states.append({
+                'panel-visible': not overlay,
+                'panel-width': breakpoint.panel_width or self.__panel_width,
+                'frame-left-buttons': breakpoint.panel_mode != 'docked',
+                'open-button': overlay,
+                'move-area': breakpoint.panel_mode == 'docked',
+                'close-button': overlay,
+                'icons-only': breakpoint.panel_mode == 'rail'})
+
+    def __update_layout_state(self) -> None:
+        # Hysteresis keeps the current state while the width moves inside
+        # the band around a breakpoint
+        width = self.size().width()
+        hysteresis = self.__horizontal_and_vertical_flip_hysteresis
+        index = self.__breakpoint_index(width)
+        current = self.__layout_index
+        if current is not None:
+            if index > current:
+                index = max(current, self.__breakpoint_index(
+                    width - hysteresis))
+            elif index < current:
+                index = min(current, self.__breakpoint_index(
+                    width + hysteresis))
+            if index == current:
+                return
+
+        self.__apply_layout_index(index)
+
+    def __apply_layout_index(self, index: int) -> None:
+        old_state = self.__layout_state
+        state = self.__breakpoints[index]
+        was_vertical = self.__is_vertical
+        self.__is_vertical = state.panel_mode == 'overlay'
+        self.__layout_index = index
+        self.__layout_state = state
+
+        if self.__is_vertical:
+            self.__panel_overlay_idle_timer.stop()
+            self.__build_panel_overlay()
+        else:
+            self.__close_panel_immediately()
+        self.__apply_layout_values(self.__layout_states[index])
+
+        if (not self.__is_vertical and self.__panel_overlay is not None and
+                self.__panel_overlay_idle_timer.interval() > 0):
+            self.__panel_overlay_idle_timer.start()
+
+        if state is not old_state:
+            with _stall_watchdog.running('layout_state_signal'):
+                self.layout_state_signal.emit(old_state, state)
+        if self.__is_vertical and not was_vertical:
+            with _stall_watchdog.running('adaptive_mode_signal'):
+                self.adaptive_mode_signal.emit('adaptive-mode-signal')
+        elif was_vertical and not self.__is_vertical:
+            with _stall_watchdog.running('wide_mode_signal'):
+                self.wide_mode_signal.emit('wide-mode-signal')
+
+    def __update_task_busy_indicator(self, busy: bool) -> None:
+        if self.__task_busy_indicator is not None:
+            self.__task_busy_indicator.set_visible(busy)
 
     def __visibility_of_window_control_buttons(self) -> None:
         if self.is_maximized():
             if self.platform_settings().gui_env.use_global_menu():
                 self.__panel_header_bar.set_left_control_buttons_visible(False)
-            self.__panel_overlay.close_panel()
+            self.__close_panel_immediately()
         elif self.is_full_screen():
             self.__panel_header_bar.set_left_control_buttons_visible(False)
-            self.__panel_overlay.close_panel()
+            self.__close_panel_immediately()
         else:
-            self.__panel_header_bar.set_left_control_buttons_visible(True)
+            self.__panel_header_bar.set_left_control_buttons_visible(
+                self.__layout_state.panel_mode != 'rail')
 
     def __resize_event(self, event: QtGui.QResizeEvent) -> None:
-        logging.info(event)
-        self.__switch_vertical_and_horizontal_window()
-        self.__visibility_of_window_control_buttons()
-        self.__panel_overlay.resize(self.width(), self.height())
+        # Before the first show the final mode is applied right away
+        if not self.__is_resize_coalescing_enabled or not self.is_visible():
+            self.__apply_resize()
+        elif self.__resize_timer.is_active():
+            self.__merged_resize_events += 1
+        else:
+            self.__resize_timer.start()
+
+    def __apply_resize(self) -> None:
+        # Geometry flows one way, window -> overlay -> panel. A slot that
+        # resizes the window from inside the pass gets the next frame.
+        if self.__is_applying_resize:
+            self.__resize_timer.start()
+            return
+        self.__is_applying_resize = True
+        try:
+            self.__update_layout_state()
+            self.__visibility_of_window_control_buttons()
+
+            # The overlay is resized when it is opened
+            if (self.__panel_overlay is not None and
+                    self.__panel_overlay.is_visible()):
+                self.__panel_overlay.resize(self.central_widget().size())
+        finally:
+            self.__is_applying_resize = False
+
+    def __emit_move_event(self) -> None:
+        if self.__move_old_pos is None:
+            return
+        event = QtGui.QMoveEvent(self.pos(), self.__move_old_pos)
+        self.__move_old_pos = None
+        self.__is_emitting_move = True
+        try:
+            with _stall_watchdog.running('move_event_signal'):
+                self.move_event_signal.emit(event)
+        finally:
+            self.__is_emitting_move = False
+
+    def __clear_layout(self, layout: QtWidgets.QLayout) -> None:
+        while layout.count():
+            item = layout.take_at(0)
+            if item.widget() is not None:
+                item.widget().hide()
+                item.widget().delete_later()
+            elif item.layout() is not None:
+                self.__clear_layout(item.layout())
+                item.layout().delete_later()
 
     def __reset_style(self, event) -> None:
         logging.info(event)
@@ -444,6 +3829,134 @@ class QSidePanelApplicationWindow(QtWidgetsX.QApplicationWindow):
         return 'QSidePanelApplicationWindow(QtWidgetsX.QApplicationWindow)'
 
 
-class QQuickContextMenu(QtWidgetsX.QQuickContextMenu):
-    def __init__(self, *args, **kwargs) -> None:
+class QWindowPool(QtCore.QObject):
+    """Keeps pre-built windows warm, and recycles closed ones
+
+    acquire() hands out a warm window when there is one (a hit), or builds
+    one (a miss). The pool is refilled one window per event loop pass,
+    starting refill_delay ms after the last acquire() so that the new
+    window paints first. Closed windows from the pool are reset with
+    reset_contents() and kept for the next acquire(), up to the pool size.
+    Window classes that build contents of their own do so in
+    build_contents(), which the reset runs again.
+
+        pool = QWindowPool(DocumentWindow, size=3)
+        window = pool.acquire()
+        window.set_header_bar_title(path)
+        window.show()
+    """
+    refill_delay = 250
+
+    def __init__(
+            self, window_factory: callable = None, size: int = 2,
+            *args, **kwargs) -> None:
+        """Class constructor
+
+        :param window_factory: Callable returning a new window, like a
+            QSidePanelApplicationWindow subclass
+        :param size: Number of windows kept warm
+        """
         super().__init__(*args, **kwargs)
+        self.__window_factory = window_factory or QSidePanelApplicationWindow
+        self.__size = max(0, size)
+        self.__windows = []
+        self.__hits = 0
+        self.__misses = 0
+        self.__recycled = 0
+
+        self.__fill_timer = QtCore.QTimer(self)
+        self.__fill_timer.timeout.connect(self.__fill)
+        self.__fill_timer.start(0)
+
+    def acquire(self) -> QSidePanelApplicationWindow:
+        """A window ready to be filled and shown"""
+        # Warm windows deleted by someone else are dropped
+        self.__windows = [x for x in self.__windows if shiboken6.isValid(x)]
+        if self.__windows:
+            self.__hits += 1
+            window = self.__windows.pop()
+        else:
+            self.__misses += 1
+            window = self.__build_window()
+        self.__fill_timer.start(self.refill_delay)
+        return window
+
+    def clear(self) -> None:
+        """Delete the warm windows"""
+        while self.__windows:
+            self.__windows.pop().delete_later()
+
+    def event_filter(self, watched: QtCore.QObject, event: QtCore.QEvent
+                     ) -> bool:
+        # Recycled once the close is through, if it was not ignored
+        if event.type() == QtCore.QEvent.Close:
+            QtCore.QTimer.single_shot(0, lambda: self.__recycle(watched))
+        return False
+
+    def release(self, window: QSidePanelApplicationWindow) -> None:
+        """Give a window back, it is reset and kept if there is room"""
+        if window.is_visible():
+            window.hide()
+        self.__recycle(window)
+
+    def set_size(self, size: int) -> None:
+        """..."""
+        self.__size = max(0, size)
+        while len(self.__windows) > self.__size:
+            self.__windows.pop().delete_later()
+        self.__fill_timer.start(0)
+
+    def size(self) -> int:
+        """..."""
+        return self.__size
+
+    def stats(self) -> dict:
+        """Pool statistics
+
+        Windows handed out warm ('hits'), built on demand ('misses'),
+        reused after being closed ('recycled') and ready now ('warm').
+        """
+        return {'hits': self.__hits, 'misses': self.__misses,
+                'recycled': self.__recycled, 'warm': len(self.__windows)}
+
+    def __build_window(self) -> QSidePanelApplicationWindow:
+        window = self.__window_factory()
+        window.set_attribute(QtCore.Qt.WA_DeleteOnClose, False)
+        window.install_event_filter(self)
+        return window
+
+    def __fill(self) -> None:
+        if len(self.__windows) >= self.__size:
+            self.__fill_timer.stop()
+            return
+
+        # Polished, laid out and with its native window, so that showing
+        # it is cheap
+        window = self.__build_window()
+        window.ensure_polished()
+        if window.layout() is not None:
+            window.layout().activate()
+        window.create_win_id()
+        self.__windows.append(window)
+        self.__fill_timer.start(0)
+
+    def __recycle(self, window: QSidePanelApplicationWindow) -> None:
+        # Deleted by the application after its close, there is nothing to
+        # keep
+        if (not shiboken6.isValid(window) or window.is_visible() or
+                window in self.__windows):
+            return
+
+        if len(self.__windows) < self.__size:
+            window.reset_contents()
+            self.__windows.append(window)
+            self.__recycled += 1
+        else:
+            window.remove_event_filter(self)
+            window.delete_later()
+
+    def __str__(self) -> str:
+        return 'QWindowPool()'
+
+    def __repr__(self) -> str:
+        return f'QWindowPool({self.__window_factory!r}, {self.__size})'
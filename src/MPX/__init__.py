@@ -0,0 +1,43 @@
+"""Meta PySide eXtras
+
+Importing MPX is cheap: Qt, PySideX and the widgets are imported the
+first time one of the classes is used, so a launcher can read the
+version, or look for a class in __all__, without loading them.
+
+    import MPX
+
+    window = MPX.QSidePanelApplicationWindow()
+"""
+import importlib
+
+__version__ = '0.1.0'
+__all__ = [
+    'QAsyncSlot',
+    'QAsyncioApplication',
+    'QBreakpoint',
+    'QContextMenuRegistry',
+    'QEventInstrumentation',
+    'QIconRegistry',
+    'QImageLoader',
+    'QImageView',
+    'QNavigationPanel',
+    'QPageStack',
+    'QPixmapLRUCache',
+    'QQuickContextMenu',
+    'QSidePanelApplicationWindow',
+    'QStallWatchdog',
+    'QStyleSheetWatcher',
+    'QTaskRunner',
+    'QWindowPool',
+    'QWindowStateCache']
+
+
+def __getattr__(name: str) -> object:
+    if name in __all__:
+        module = importlib.import_module('.QtWidgetsMPX', __name__)
+        return getattr(module, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,975 @@
+#!/usr/bin/env python3
+"""Headless benchmarks for MPX windows
+
+Runs on the offscreen Qt platform and writes the results as JSON:
+
+    python src/benchmark.py --output results.json
+    python src/benchmark.py --baseline results.json --threshold 0.2
+
+Every metric is "lower is better". With --baseline, metrics that got
+slower than the threshold allows are reported as regressions and the
+exit code is 1.
+"""
+import argparse
+import asyncio
+import collections
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import PySide6
+from PySide6 import QtCore, QtGui, QtWidgets
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(SRC_DIR)
+
+from MPX import QtWidgetsMPX
+from __feature__ import snake_case
+
+BENCHMARKS = collections.OrderedDict()
+SLOW_BENCHMARKS = set()
+
+THEME_STYLE_SHEET = (
+    'QApplicationWindow {'
+    '  background-color: rgba(44, 44, 50, 0.9);'
+    '  border: 1px solid #283690;'
+    '  border-radius: 10px;}'
+    'QToolButton {'
+    '  padding: 2px;'
+    '  border: 0px;'
+    '  border-radius: 3px;'
+    '  background-color: rgba(100, 100, 100, 0.2);}'
+    'QPushButton {'
+    '  border: 1px solid rgba(100, 100, 100, 0.3);}')
+
+
+# Run in a fresh interpreter, prints its timings as JSON
+STARTUP_SCRIPT = '''
+import json
+import time
+
+start = time.perf_counter()
+import MPX
+imported = time.perf_counter()
+window_class = MPX.QSidePanelApplicationWindow
+widgets_imported = time.perf_counter()
+
+from PySide6 import QtCore, QtWidgets
+from __feature__ import snake_case
+
+application = QtWidgets.QApplication([])
+window = window_class()
+constructed = time.perf_counter()
+shown = []
+
+
+class FirstPaint(QtCore.QObject):
+    def event_filter(self, watched, event):
+        if (not shown and event.type() == QtCore.QEvent.Paint and
+                isinstance(watched, QtWidgets.QWidget) and
+                watched.window() is window):
+            shown.append(time.perf_counter())
+            QtCore.QTimer.single_shot(0, application.quit)
+        return False
+
+
+first_paint = FirstPaint()
+application.install_event_filter(first_paint)
+QtCore.QTimer.single_shot(5000, application.quit)
+window.show()
+application.exec()
+
+print(json.dumps({
+    'startup_import_mpx_ms': (imported - start) * 1000,
+    'startup_import_widgets_ms': (widgets_imported - imported) * 1000,
+    'startup_window_constructed_ms': (
+        constructed - widgets_imported) * 1000,
+    'startup_first_window_shown_ms': (
+        (shown[0] if shown else float('inf')) - start) * 1000}))
+'''
+
+# Run in a fresh interpreter, so that memory freed by earlier benchmarks
+# is not counted. Prints the metrics of pages_benchmark() as JSON.
+PAGES_SCRIPT = '''
+import json
+import sys
+
+from PySide6 import QtWidgets
+
+import benchmark
+
+application = QtWidgets.QApplication(sys.argv[:1])
+print(json.dumps(benchmark.pages_benchmark(int(sys.argv[1]))))
+'''
+
+
+def benchmark(slow: bool = False) -> callable:
+    """Register a benchmark function returning {metric: value}
+
+    :param slow: Only run it with --full
+    """
+    def register(function: callable) -> callable:
+        BENCHMARKS[function.__name__] = function
+        if slow:
+            SLOW_BENCHMARKS.add(function.__name__)
+        return function
+    return register
+
+
+def _rss() -> int:
+    # Resident set size in KiB
+    if os.path.exists('/proc/self/statm'):
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') // 1024
+    if resource:
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss // 1024 if sys.platform == 'darwin' else rss
+    return 0
+
+
+def _run_script(script: str, *args, options: list = ()
+                ) -> subprocess.CompletedProcess:
+    # Run a script in a fresh interpreter that can import MPX
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(
+        [SRC_DIR] + [x for x in [os.environ.get('PYTHONPATH')] if x])
+    return subprocess.run(
+        [sys.executable, *options, '-c', script, *args], env=environment,
+        capture_output=True, text=True, check=True)
+
+
+def _wait(msecs: int) -> None:
+    # Run the event loop, so that timers and animations advance
+    loop = QtCore.QEventLoop()
+    QtCore.QTimer.single_shot(msecs, loop.quit)
+    loop.exec()
+
+
+def _window(width: int = None) -> QtWidgetsMPX.QSidePanelApplicationWindow:
+    # A shown window, settled at width
+    window = QtWidgetsMPX.QSidePanelApplicationWindow()
+    if width is not None:
+        window.resize(width, 500)
+    window.show()
+    _wait(30)
+    return window
+
+
+def _close(window: QtWidgetsMPX.QSidePanelApplicationWindow) -> None:
+    window.close()
+    window.delete_later()
+    QtWidgets.QApplication.process_events()
+
+
+def event_latency_benchmark(load: str, msecs: int = 500) -> list:
+    """Lateness in ms of 5ms timer shots while reading files
+
+    :param load: 'idle', 'asyncio' for 32 concurrent tasks reading with
+        asyncio.to_thread(), or 'blocking' for batches of the same 32
+        reads in the GUI thread
+    """
+    with tempfile.NamedTemporaryFile() as data:
+        data.write(os.urandom(1024 * 1024))
+        data.flush()
+
+        def read() -> int:
+            with open(data.name, 'rb') as source:
+                return len(source.read())
+
+        async def read_forever() -> None:
+            while True:
+                await asyncio.to_thread(read)
+
+        tasks = []
+        blocking_timer = QtCore.QTimer()
+        if load == 'asyncio':
+            loop = asyncio.get_running_loop()
+            tasks = [loop.create_task(read_forever()) for _ in range(32)]
+        elif load == 'blocking':
+            blocking_timer.timeout.connect(
+                lambda: [read() for _ in range(32)])
+            blocking_timer.start(0)
+
+        # Each shot is due 5ms after the previous one was handled
+        lateness = []
+        due = [time.perf_counter() + 0.005]
+        timer = QtCore.QTimer()
+        timer.set_single_shot(True)
+        timer.set_timer_type(QtCore.Qt.PreciseTimer)
+
+        def shot() -> None:
+            now = time.perf_counter()
+            lateness.append(max(0.0, (now - due[0]) * 1000))
+            due[0] = now + 0.005
+            timer.start(5)
+
+        timer.timeout.connect(shot)
+        timer.start(5)
+        _wait(msecs)
+        timer.stop()
+        blocking_timer.stop()
+        for task in tasks:
+            task.cancel()
+        _wait(20)
+    return sorted(lateness)
+
+
+def startup_benchmark(import_time: bool = False) -> tuple:
+    """Startup timings of a fresh interpreter, and its -X importtime log
+
+    Times are from the start of the script, after the interpreter itself
+    started: importing MPX, importing the widgets through it, creating
+    the application and a window, and the window first painted.
+    """
+    options = ['-X', 'importtime'] if import_time else []
+    process = _run_script(STARTUP_SCRIPT, options=options)
+    return json.loads(process.stdout.splitlines()[-1]), process.stderr
+
+
+def pages_benchmark(max_live_pages: int) -> dict:
+    """Visiting 100 pages of 50 widgets with max_live_pages in the LRU
+
+    Memory is the RSS growth over the visits, in KiB, and the number of
+    widgets alive at the end. Deferred deletes are flushed after each
+    visit so that evicted pages are freed. Run it in a fresh process
+    through PAGES_SCRIPT for memory numbers that can be compared.
+    """
+    def page() -> QtWidgets.QWidget:
+        widget = QtWidgets.QWidget()
+        form = QtWidgets.QFormLayout(widget)
+        for i in range(25):
+            form.add_row(QtWidgets.QLabel(f'Field {i}'),
+                         QtWidgets.QLineEdit(f'Value {i}'))
+        return widget
+
+    window = _window()
+    stack = window.page_stack()
+    stack.set_max_live_pages(max_live_pages)
+    for i in range(100):
+        window.add_page(i, page)
+
+    rss = _rss()
+    start = time.perf_counter()
+    for i in range(100):
+        window.set_current_page(i)
+        QtCore.QCoreApplication.send_posted_events(
+            None, QtCore.QEvent.DeferredDelete)
+        QtWidgets.QApplication.process_events()
+    first_visit = (time.perf_counter() - start) / 100
+    grown = _rss() - rss
+    widgets = len(stack.find_children(QtWidgets.QWidget))
+
+    start = time.perf_counter()
+    for i in range(95, 100):
+        window.set_current_page(i)
+        QtWidgets.QApplication.process_events()
+    revisit = (time.perf_counter() - start) / 5
+    _close(window)
+
+    return {'first_visit_ms': first_visit * 1000,
+            'revisit_ms': revisit * 1000,
+            'rss_kib': grown,
+            'live_widgets': widgets}
+
+
+def panel_animation_benchmark(duration: int = 300) -> dict:
+    """Frame times in ms of the panel open and close animations
+
+    :param duration: Animation duration in milliseconds
+    """
+    window = QtWidgetsMPX.QSidePanelApplicationWindow()
+    window.resize(window.horizontal_and_vertical_flip_width() - 100, 500)
+    window.set_panel_animation_duration(duration)
+    for i in range(100):
+        window.panel_layout().add_widget(QtWidgets.QPushButton(f'Item {i}'))
+    window.show()
+    _wait(50)
+
+    frame_times = {}
+    for name, action in (('open', window.open_panel),
+                         ('close', window.close_panel)):
+        action()
+        _wait(duration + 100)
+        frame_times[name] = window.panel_animation_frame_times()
+
+    _close(window)
+    return frame_times
+
+
+def panel_color_benchmark(palette_mode: bool, repeat: int = 1000) -> float:
+    """Seconds spent on repeated set_panel_color calls
+
+    :param palette_mode: Theme the panel through QPalette
+    :param repeat: Number of colour changes
+    """
+    window = _window()
+    window.set_panel_palette_mode_enabled(palette_mode)
+
+    start = time.perf_counter()
+    for i in range(repeat):
+        window.set_panel_color((i % 256, 54, 95, 0.5))
+        QtWidgets.QApplication.process_events()
+    elapsed = time.perf_counter() - start
+
+    _close(window)
+    return elapsed
+
+
+def widget_insertion_benchmark(count: int, suspended: bool) -> float:
+    """Seconds to fill the panel and frame view of a shown window
+
+    Events are processed every 100 insertions, like a loader that keeps
+    the window responsive.
+
+    :param count: Number of widgets, half in the panel and half in the
+        frame view
+    :param suspended: Insert inside window.updates_suspended()
+    """
+    window = _window()
+
+    start = time.perf_counter()
+    with (window.updates_suspended() if suspended
+          else contextlib.nullcontext()):
+        for i in range(count):
+            layout = (window.panel_layout() if i % 2
+                      else window.frame_view_layout())
+            layout.add_widget(QtWidgets.QLabel(f'Item {i}'))
+            if i % 100 == 99:
+                QtWidgets.QApplication.process_events()
+    QtWidgets.QApplication.process_events()
+    elapsed = time.perf_counter() - start
+
+    _close(window)
+    return elapsed
+
+
+def window_construction_benchmark(repeat: int = 50) -> tuple:
+    """Milliseconds per window and RSS growth in KiB
+
+    The windows are shown wide and never enter adaptive mode.
+
+    :param repeat: Number of windows to build
+    """
+    rss = _rss()
+    windows = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        window = QtWidgetsMPX.QSidePanelApplicationWindow()
+        window.show()
+        windows.append(window)
+    QtWidgets.QApplication.process_events()
+    elapsed = time.perf_counter() - start
+    rss = _rss() - rss
+
+    for window in windows:
+        _close(window)
+    return elapsed * 1000 / repeat, rss
+
+
+@benchmark()
+def window_construction() -> dict:
+    """Building and showing a window"""
+    msecs, rss = window_construction_benchmark()
+    return {'window_construction_ms': msecs,
+            'window_construction_rss_kib': rss}
+
+
+@benchmark()
+def resize_storm() -> dict:
+    """Drag-resizing back and forth across the flip width"""
+    window = _window()
+    flip_width = window.horizontal_and_vertical_flip_width()
+    widths = list(range(flip_width + 200, flip_width - 200, -2))
+
+    start = time.perf_counter()
+    for width in widths + widths[::-1]:
+        window.resize(width, 500)
+        QtWidgets.QApplication.process_events()
+    elapsed = time.perf_counter() - start
+
+    _close(window)
+    return {'resize_storm_ms': elapsed * 1000}
+
+
+@benchmark()
+def window_drag() -> dict:
+    """A 1000-step drag with the overlay open, moves signalled per frame"""
+    results = {}
+    for coalesced in (False, True):
+        window = _window(400)
+        window.set_move_coalescing_enabled(coalesced)
+        window.set_instrumentation_enabled(True)
+        window.open_panel()
+        QtWidgets.QApplication.process_events()
+        window.instrumentation().reset()
+        signals = []
+        window.move_event_signal.connect(signals.append)
+
+        origin = window.pos()
+        start = time.perf_counter()
+        for step in range(1000):
+            window.move(origin.x() + step % 200, origin.y() + step // 200)
+            QtWidgets.QApplication.process_events()
+        # Let the last coalesced signal out
+        QtCore.QThread.msleep(20)
+        QtWidgets.QApplication.process_events()
+        elapsed = time.perf_counter() - start
+
+        stats = window.instrumentation().stats()
+        overlay = stats.get('overlay', {})
+        moves = stats.get('window', {}).get('move', {}).get('count', 0)
+        state = 'coalesced' if coalesced else 'direct'
+        results[f'window_drag_{state}_ms'] = elapsed * 1000
+        results[f'window_drag_{state}_move_events'] = moves
+        results[f'window_drag_{state}_move_signals'] = len(signals)
+        results[f'window_drag_{state}_overlay_events'] = sum(
+            overlay.get(kind, {}).get('count', 0)
+            for kind in ('move', 'resize', 'layout'))
+        window.set_instrumentation_enabled(False)
+        _close(window)
+    return results
+
+
+@benchmark()
+def instrumentation_overhead() -> dict:
+    """The resize storm with event instrumentation off and on"""
+    results = {}
+    for enabled in (False, True):
+        window = _window()
+        window.set_instrumentation_enabled(enabled)
+        flip_width = window.horizontal_and_vertical_flip_width()
+        widths = list(range(flip_width + 200, flip_width - 200, -2))
+
+        start = time.perf_counter()
+        for width in widths + widths[::-1]:
+            window.resize(width, 500)
+            QtWidgets.QApplication.process_events()
+        elapsed = time.perf_counter() - start
+
+        _close(window)
+        state = 'on' if enabled else 'off'
+        results[f'instrumentation_{state}_resize_storm_ms'] = elapsed * 1000
+    return results
+
+
+@benchmark()
+def event_latency() -> dict:
+    """Timer lateness with file reads in asyncio tasks or the GUI thread"""
+    results = {}
+    for load in ('idle', 'asyncio', 'blocking'):
+        lateness = event_latency_benchmark(load)
+        if not lateness:
+            # No timer shot fired, there is no lateness to report
+            continue
+        results[f'event_latency_{load}_p50_ms'] = lateness[
+            len(lateness) // 2]
+        results[f'event_latency_{load}_p99_ms'] = lateness[
+            int(len(lateness) * 0.99)]
+    return results
+
+
+@benchmark()
+def icon_pixmap() -> dict:
+    """32px pixmaps of the window icon, loaded per use or from the registry"""
+    path = os.path.join(SRC_DIR, 'MPX', 'icon.svg')
+    registry = QtWidgetsMPX.QIconRegistry()
+    repeat = 500
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        QtGui.QIcon(path).pixmap(QtCore.QSize(32, 32), 1.0)
+    direct = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        registry.pixmap(path, 32, 1.0)
+    cached = time.perf_counter() - start
+
+    return {'icon_pixmap_direct_ms': direct * 1000 / repeat,
+            'icon_pixmap_registry_ms': cached * 1000 / repeat}
+
+
+@benchmark()
+def image_view() -> dict:
+    """Stepping through large JPEGs, decoded in the GUI thread or QImageView
+
+    The GUI thread metric decodes at full size and scales, as a QLabel
+    would need; QImageView shows images that were prefetched while the
+    previous one was on screen.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for i in range(10):
+            image = QtGui.QImage(3000, 2000, QtGui.QImage.Format_RGB32)
+            image.fill(QtGui.QColor(i * 25, 120, 200))
+            paths.append(os.path.join(directory, f'{i}.jpg'))
+            image.save(paths[-1], quality=90)
+
+        size = QtCore.QSize(400, 300)
+        start = time.perf_counter()
+        for path in paths:
+            QtGui.QPixmap.from_image(QtGui.QImageReader(path).read().scaled(
+                size, QtCore.Qt.KeepAspectRatio,
+                QtCore.Qt.SmoothTransformation))
+        gui_thread = (time.perf_counter() - start) / len(paths)
+
+        window = _window()
+        QtWidgetsMPX._pixmap_cache.clear()
+        view = QtWidgetsMPX.QImageView()
+        view.set_image_size(size)
+        window.frame_view_layout().add_widget(view)
+        view.set_paths(paths)
+        _wait(200)
+
+        steps = []
+        for i in range(1, len(paths)):
+            start = time.perf_counter()
+            view.set_current_index(i)
+            QtWidgets.QApplication.process_events()
+            steps.append(time.perf_counter() - start)
+            _wait(100)
+        _close(window)
+
+    return {'image_gui_thread_decode_ms': gui_thread * 1000,
+            'image_view_step_ms': sum(steps) * 1000 / len(steps)}
+
+
+@benchmark()
+def overlay_open_close() -> dict:
+    """Opening and closing the adaptive panel, without animation"""
+    window = _window(400)
+    window.set_panel_animation_duration(0)
+    for i in range(100):
+        window.panel_layout().add_widget(QtWidgets.QPushButton(f'Item {i}'))
+    window.open_panel()
+    window.close_panel()
+
+    repeat = 100
+    start = time.perf_counter()
+    for _ in range(repeat):
+        window.open_panel()
+        QtWidgets.QApplication.process_events()
+        window.close_panel()
+        QtWidgets.QApplication.process_events()
+    elapsed = time.perf_counter() - start
+
+    _close(window)
+    return {'overlay_open_close_ms': elapsed * 1000 / repeat}
+
+
+@benchmark()
+def pages() -> dict:
+    """Visiting 100 pages of 50 widgets, all kept alive or 5 in an LRU
+
+    Each configuration runs in a fresh process, see pages_benchmark().
+    """
+    results = {}
+    for max_live_pages in (5, 100):
+        process = _run_script(PAGES_SCRIPT, str(max_live_pages))
+        metrics = json.loads(process.stdout.splitlines()[-1])
+        results.update({
+            f'pages_lru{max_live_pages}_{x}': y for x, y in metrics.items()})
+    return results
+
+
+@benchmark()
+def panel_animation() -> dict:
+    """Frame times of the panel slide animation"""
+    results = {}
+    for name, frame_times in panel_animation_benchmark().items():
+        frame_times = frame_times or [0]
+        results[f'panel_{name}_animation_mean_frame_ms'] = (
+            sum(frame_times) / len(frame_times))
+        results[f'panel_{name}_animation_worst_frame_ms'] = max(frame_times)
+    return results
+
+
+@benchmark()
+def panel_color() -> dict:
+    """1,000 set_panel_color calls in both theming modes"""
+    return {
+        f'panel_color_{name}_ms': panel_color_benchmark(palette_mode) * 1000
+        for name, palette_mode in (
+            ('style_sheet', False), ('palette', True))}
+
+
+@benchmark()
+def startup() -> dict:
+    """Cold start of a fresh interpreter up to the first window paint"""
+    return startup_benchmark()[0]
+
+
+@benchmark()
+def startup_restore() -> dict:
+    """Opening a window in its last state, restored after or before show"""
+    state = {
+        'geometry': [0, 0, 500, 420], 'maximized': False, 'mode': 'compact',
+        'panel_width': 250, 'panel_color': [79, 54, 95, 0.5],
+        'panel_open': True}
+
+    class FrameCounter(QtCore.QObject):
+        def event_filter(self, watched, event):
+            if event.type() == QtCore.QEvent.UpdateRequest:
+                self.frames += 1
+            return False
+
+    results = {}
+    repeat = 20
+    for when in ('after', 'before'):
+        counter = FrameCounter()
+        counter.frames = 0
+        elapsed = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            window = QtWidgetsMPX.QSidePanelApplicationWindow()
+            window.install_event_filter(counter)
+            window.set_resize_coalescing_enabled(False)
+            if when == 'before':
+                window.restore_state(state)
+            window.show()
+            if when == 'after':
+                QtWidgets.QApplication.process_events()
+                window.restore_state(state)
+            QtWidgets.QApplication.process_events()
+            elapsed += time.perf_counter() - start
+            _close(window)
+        results[f'startup_restore_{when}_show_ms'] = elapsed * 1000 / repeat
+        results[f'startup_restore_{when}_show_frames'] = (
+            counter.frames / repeat)
+    return results
+
+
+@benchmark()
+def theme_switch() -> dict:
+    """Switching between a custom and the default style"""
+    window = _window()
+    repeat = 50
+    start = time.perf_counter()
+    for _ in range(repeat):
+        window.set_style_sheet(THEME_STYLE_SHEET)
+        window.set_panel_color((79, 54, 95, 0.5))
+        QtWidgets.QApplication.process_events()
+        window.reset_style()
+        QtWidgets.QApplication.process_events()
+    elapsed = time.perf_counter() - start
+
+    _close(window)
+    return {'theme_switch_ms': elapsed * 1000 / repeat}
+
+
+@benchmark()
+def theme_reload() -> dict:
+    """Editing one rule of a theme, re-set by hand or reloaded from a file"""
+    edits = [THEME_STYLE_SHEET.replace('0.3)', f'0.{x})') for x in (4, 3)]
+    repeat = 50
+
+    window = _window()
+    for _ in range(20):
+        window.frame_view_layout().add_widget(QtWidgets.QLabel('Label'))
+    start = time.perf_counter()
+    for index in range(repeat):
+        window.set_style_sheet(edits[index % 2])
+        QtWidgets.QApplication.process_events()
+    whole = time.perf_counter() - start
+    _close(window)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'theme.qss')
+        with open(path, 'w') as file:
+            file.write(THEME_STYLE_SHEET)
+        window = _window()
+        for _ in range(20):
+            window.frame_view_layout().add_widget(QtWidgets.QLabel('Label'))
+        window.set_style_sheet_file(path)
+        watcher = QtWidgetsMPX._style_sheet_watchers.watcher(path)
+
+        start = time.perf_counter()
+        for index in range(repeat):
+            with open(path, 'w') as file:
+                file.write(edits[index % 2])
+            watcher.reload()
+            QtWidgets.QApplication.process_events()
+        reloaded = time.perf_counter() - start
+
+        window.set_style_sheet_file(None)
+        _close(window)
+
+    return {'theme_reload_whole_ms': whole * 1000 / repeat,
+            'theme_reload_file_ms': reloaded * 1000 / repeat}
+
+
+@benchmark()
+def context_menu() -> dict:
+    """Showing and closing a QQuickContextMenu"""
+    window = _window()
+    menu = QtWidgetsMPX.QQuickContextMenu(window)
+    for name in ('Copy', 'Paste', 'Delete', 'Save'):
+        menu.add_action(name, lambda: None)
+
+    repeat = 50
+    start = time.perf_counter()
+    for _ in range(repeat):
+        # Closed from the event loop, in case exec() blocks
+        QtCore.QTimer.single_shot(0, menu.close)
+        menu.exec(window.map_to_global(QtCore.QPoint(100, 100)))
+        QtWidgets.QApplication.process_events()
+    elapsed = time.perf_counter() - start
+
+    _close(window)
+    return {'context_menu_ms': elapsed * 1000 / repeat}
+
+
+@benchmark()
+def context_menu_rows() -> dict:
+    """Context menus of 200 list rows, one menu per row or one shared"""
+    rows = 200
+    actions = (('Open', 'Return'), ('Copy', 'Ctrl+C'), ('Rename', 'F2'),
+               ('Delete', 'Del'))
+
+    def build(menu):
+        for text, shortcut in actions:
+            menu.add_target_action(
+                text, lambda row: None, shortcut=QtGui.QKeySequence(shortcut))
+
+    def first_open(menu, target):
+        start = time.perf_counter()
+        QtCore.QTimer.single_shot(0, menu.close)
+        menu.exec(QtCore.QPoint(100, 100), target)
+        QtWidgets.QApplication.process_events()
+        return (time.perf_counter() - start) * 1000
+
+    results = {}
+    rss = _rss()
+    start = time.perf_counter()
+    menus = []
+    for _ in range(rows):
+        menus.append(QtWidgetsMPX.QQuickContextMenu())
+        build(menus[-1])
+    results['context_menu_rows_per_row_build_ms'] = (
+        time.perf_counter() - start) * 1000
+    results['context_menu_rows_per_row_first_open_ms'] = first_open(
+        menus[rows // 2], rows // 2)
+    results['context_menu_rows_per_row_rss_kib'] = _rss() - rss
+    for menu in menus:
+        menu.delete_later()
+    QtWidgets.QApplication.process_events()
+
+    registry = QtWidgetsMPX.QContextMenuRegistry()
+    rss = _rss()
+    start = time.perf_counter()
+    # Built here rather than at idle time, to time it
+    registry.register('row', build, prebuild=False)
+    registry.menu('row')
+    results['context_menu_rows_shared_build_ms'] = (
+        time.perf_counter() - start) * 1000
+    results['context_menu_rows_shared_first_open_ms'] = first_open(
+        registry.menu('row'), rows // 2)
+    results['context_menu_rows_shared_rss_kib'] = _rss() - rss
+
+    start = time.perf_counter()
+    for row in range(rows):
+        registry.trigger_shortcut(actions[row % len(actions)][1], row)
+    results['context_menu_rows_shortcut_us'] = (
+        time.perf_counter() - start) * 1e6 / rows
+    registry.unregister('row')
+    return results
+
+
+@benchmark()
+def window_pool() -> dict:
+    """Opening a window built on demand, or handed out by a QWindowPool"""
+    repeat = 20
+    pool = QtWidgetsMPX.QWindowPool(size=repeat)
+    _wait(500)
+
+    built = pooled = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        window = QtWidgetsMPX.QSidePanelApplicationWindow()
+        window.show()
+        QtWidgets.QApplication.process_events()
+        built += time.perf_counter() - start
+        _close(window)
+
+        start = time.perf_counter()
+        window = pool.acquire()
+        window.show()
+        QtWidgets.QApplication.process_events()
+        pooled += time.perf_counter() - start
+        pool.release(window)
+
+    misses = pool.stats()['misses']
+    pool.clear()
+    pool.delete_later()
+    return {'window_open_built_ms': built * 1000 / repeat,
+            'window_open_pooled_ms': pooled * 1000 / repeat,
+            'window_pool_misses': misses}
+
+
+@benchmark()
+def widget_insertion() -> dict:
+    """Filling the panel and frame view with and without suspension"""
+    results = {}
+    for count in (100, 1000, 10000):
+        for name, suspended in (('direct', False), ('suspended', True)):
+            if count == 10000 and not suspended:
+                continue
+            results[f'insert_{count}_{name}_ms'] = widget_insertion_benchmark(
+                count, suspended) * 1000
+    return results
+
+
+@benchmark(slow=True)
+def widget_insertion_10000_direct() -> dict:
+    """Filling the panel and frame view with 10,000 widgets directly"""
+    return {'insert_10000_direct_ms': widget_insertion_benchmark(
+        10000, False) * 1000}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Names of the metrics that regressed against the baseline
+
+    :param results: Current {metric: value}
+    :param baseline: Saved {metric: value}
+    :param threshold: Allowed relative slowdown, 0.2 is 20%
+    """
+    regressions = []
+    for name, value in results.items():
+        old_value = baseline.get(name)
+        if old_value is None:
+            print(f'  {name}: {value:.2f} (new)', file=sys.stderr)
+            continue
+
+        change = (value - old_value) / old_value if old_value else 0.0
+        regressed = change > threshold
+        if regressed:
+            regressions.append(name)
+        print(f'  {name}: {old_value:.2f} -> {value:.2f} ({change:+.0%})'
+              f'{"  REGRESSION" if regressed else ""}', file=sys.stderr)
+    return regressions
+
+
+def run(names: list, repeat: int) -> dict:
+    """Run the benchmarks and keep the best value of each metric
+
+    :param names: Benchmark names
+    :param repeat: Runs per benchmark
+    """
+    results = {}
+    for name in names:
+        best = {}
+        for _ in range(repeat):
+            for metric, value in BENCHMARKS[name]().items():
+                best[metric] = min(value, best.get(metric, value))
+        print(f'{name}: ' + ', '.join(
+            f'{x}={y:.2f}' for x, y in best.items()), file=sys.stderr)
+        results.update(best)
+    return results
+
+
+def profile_startup() -> None:
+    """Print the startup timings and the slowest imports"""
+    timings, log = startup_benchmark(import_time=True)
+    for name, value in timings.items():
+        print(f'{name}: {value:.1f}', file=sys.stderr)
+
+    imports = []
+    for line in log.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            self_time, cumulative, name = line[12:].split('|')
+            if self_time.strip().isdigit():
+                imports.append(
+                    (int(self_time), int(cumulative), name.strip()))
+
+    print('\nSlowest imports (self / cumulative ms):', file=sys.stderr)
+    for self_time, cumulative, name in sorted(imports, reverse=True)[:15]:
+        print(f'  {self_time / 1000:8.1f} {cumulative / 1000:8.1f}  {name}',
+              file=sys.stderr)
+
+
+def main() -> None:
+    """Run the benchmarks, write JSON and compare against a baseline"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument(
+        '--output', help='Write the results as JSON to this file')
+    parser.add_argument(
+        '--baseline', help='JSON results of an earlier run to compare to')
+    parser.add_argument(
+        '--threshold', type=float, default=0.25,
+        help='Allowed relative slowdown before a metric is a regression')
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='Runs per benchmark, the best value is kept')
+    parser.add_argument(
+        '--only', nargs='+', choices=list(BENCHMARKS), metavar='NAME',
+        help='Run only these benchmarks: ' + ', '.join(BENCHMARKS))
+    parser.add_argument(
+        '--full', action='store_true', help='Also run the slow benchmarks')
+    parser.add_argument(
+        '--profile-startup', action='store_true',
+        help='Only print the startup timings and the slowest imports')
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        profile_startup()
+        return
+
+    # Benchmarks run inside the event loop, where asyncio tasks can run
+    application = QtWidgetsMPX.QAsyncioApplication(sys.argv[:1])
+    # Benchmarks close all their windows, which must not quit, or every
+    # later _wait() would return right away
+    application.set_quit_on_last_window_closed(False)
+    names = args.only or [
+        x for x in BENCHMARKS if args.full or x not in SLOW_BENCHMARKS]
+    results = {}
+    QtCore.QTimer.single_shot(0, lambda: (
+        results.update(run(names, max(1, args.repeat))),
+        application.quit()))
+    application.exec()
+
+    report = {
+        'metadata': {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pyside': PySide6.__version__,
+            'qt': QtCore.qVersion(),
+            'platform': QtGui.QGuiApplication.platform_name(),
+            'machine': platform.platform(),
+            'repeat': args.repeat},
+        'results': results}
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            print(f'Compared to {args.baseline}:', file=sys.stderr)
+            regressions = compare(
+                results, json.load(baseline)['results'], args.threshold)
+        if regressions:
+            print(f'{len(regressions)} regression(s): ' +
+                  ', '.join(regressions), file=sys.stderr)
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -45,7 +45,7 @@ class Window(QtWidgetsMPX.QSidePanelApplicationWindow):
 
         # Icon
         icon_path = os.path.join(SRC_DIR, 'icon.svg')
-        self.__app_icon = QtGui.QIcon(QtGui.QPixmap(icon_path))
+        self.__app_icon = self.icon_registry().icon(icon_path)
         self.set_window_icon(self.__app_icon)
         self.set_header_bar_icon(self.__app_icon)
 
@@ -55,7 +55,7 @@ class Window(QtWidgetsMPX.QSidePanelApplicationWindow):
 
         # Search
         self.tbutton = QtWidgets.QToolButton()
-        self.tbutton.set_icon(QtGui.QIcon.from_theme('search'))
+        self.tbutton.set_icon(self.icon_registry().icon('search'))
         self.panel_header_bar().add_widget_to_right(self.tbutton)
 
         for i in ['Download', 'Pictures', 'Documents', 'Videos', 'Music']:
@@ -65,21 +65,17 @@ class Window(QtWidgetsMPX.QSidePanelApplicationWindow):
 
         # Image
         self.image = QtWidgets.QLabel()
-        self.image.set_pixmap(
-            QtGui.QIcon.from_theme('folder-download-symbolic').pixmap(96, 96))
+        self.image.set_pixmap(self.icon_registry().pixmap(
+            'folder-download-symbolic', 96, self.device_pixel_ratio_f()))
         self.frame_view_layout().add_widget(self.image)
         self.frame_view_layout().set_alignment(QtCore.Qt.AlignCenter)
 
-        # Image context menu
-        self.image_qcontext = QtWidgetsMPX.QQuickContextMenu(self)
-        self.image_qcontext.add_action(
-            'Delete', lambda: self.__context_menu_cal('Delete'))
-        self.image_qcontext.add_action(
-            'Save', lambda: self.__context_menu_cal('Save'))
-
+        # Image context menu, registered once by the application
         self.image.set_context_menu_policy(QtGui.Qt.CustomContextMenu)
         self.image.customContextMenuRequested.connect(
             self.context_menu_for_image)
+        self.image.set_focus_policy(QtCore.Qt.ClickFocus)
+        self.context_menu_registry().install_shortcut_handler(self.image)
 
         # Style button
         self.set_style_button = QtWidgets.QPushButton('Set style')
@@ -99,11 +95,11 @@ class Window(QtWidgetsMPX.QSidePanelApplicationWindow):
         self.set_quick_context_menu(self.qcontext_menu)
         self.qcontext_menu.add_action(
             'Copy', lambda: self.__context_menu_cal('Copy'),
-            icon=QtGui.QIcon.from_theme('edit-copy'),
+            icon=self.icon_registry().icon('edit-copy'),
             shortcut=QtGui.QKeySequence('Ctrl+C'))
         self.qcontext_menu.add_action(
             'Paste', lambda: self.__context_menu_cal('Paste'),
-            icon=QtGui.QIcon.from_theme('edit-paste'),
+            icon=self.icon_registry().icon('edit-paste'),
             shortcut=QtGui.QKeySequence('Ctrl+V'))
 
         self.qcontext_menu.add_separator()
@@ -118,7 +114,13 @@ class Window(QtWidgetsMPX.QSidePanelApplicationWindow):
         self.qcontext_menu.exec(event.global_pos())
 
     def context_menu_for_image(self):
-        self.image_qcontext.exec(QtGui.QCursor.pos())
+        self.context_menu_registry().exec(
+            'image', QtGui.QCursor.pos(), self.image)
+
+    def on_image_action(self, image: QtWidgets.QLabel, text: str) -> None:
+        if text == 'Delete':
+            image.clear()
+        self.__context_menu_cal(text)
 
     def __context_menu_cal(self, text):
         self.context_menu_label.set_text(text)
@@ -155,11 +157,24 @@ class Window(QtWidgetsMPX.QSidePanelApplicationWindow):
             self.set_style_button.set_text('Set style')
 
     def on_btn(self) -> None:
-        self.image.set_pixmap(QtGui.QIcon.from_theme(
-            f'folder-{self.sender().text().lower()}-symbolic').pixmap(96, 96))
+        self.image.set_pixmap(self.icon_registry().pixmap(
+            f'folder-{self.sender().text().lower()}-symbolic', 96,
+            self.device_pixel_ratio_f()))
         self.close_panel()
 
 
+def build_image_context_menu(menu: QtWidgetsMPX.QQuickContextMenu) -> None:
+    """One prebuilt menu shared by the images of every window"""
+    # The receivers act on the image the menu was opened for
+    menu.add_target_action(
+        'Delete', lambda image: image.window().on_image_action(
+            image, 'Delete'),
+        shortcut=QtGui.QKeySequence(QtGui.QKeySequence.Delete))
+    menu.add_target_action(
+        'Save', lambda image: image.window().on_image_action(
+            image, 'Save'))
+
+
 class Application(object):
     """..."""
     def __init__(self, args: list) -> None:
@@ -169,8 +184,10 @@ class Application(object):
 
         :param args: List of command line arguments
         """
-        self.application = QtWidgets.QApplication(args)
+        self.application = QtWidgetsMPX.QAsyncioApplication(args)
         self.window = Window()
+        self.window.context_menu_registry().register(
+            'image', build_image_context_menu)
 
     def main(self) -> None:
         """Start the app"""
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""Headless layout verification of MPX windows
+
+Renders windows offscreen with grab() at widths around the horizontal and
+vertical flip width, for every theme and panel state, spread over a
+process pool. Each render is reduced to a perceptual hash and compared to
+the stored references:
+
+    python src/verify_layout.py --update
+    python src/verify_layout.py --images /tmp/layout
+
+A case whose hash is further than --distance bits from its reference is
+reported as a layout regression and the exit code is 1. Render times are
+reported for every case.
+"""
+import argparse
+import concurrent.futures
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import PySide6
+from PySide6 import QtCore, QtGui, QtWidgets
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(SRC_DIR)
+
+from MPX import QtWidgetsMPX
+from __feature__ import snake_case
+
+REFERENCES = os.path.join(SRC_DIR, 'layout_references.json')
+
+# Widths are offsets from the flip width, so that cases keep their name
+# when the breakpoints move
+OFFSETS = (-200, -60, -8, -1, 0, 1, 8, 60, 200)
+
+THEMES = {
+    'default': None,
+    'custom': (
+        'QApplicationWindow {'
+        '  background-color: rgba(44, 44, 50, 0.9);'
+        '  border: 1px solid #283690;'
+        '  border-radius: 10px;}'
+        'QToolButton {'
+        '  padding: 2px;'
+        '  border: 0px;'
+        '  border-radius: 3px;'
+        '  background-color: rgba(100, 100, 100, 0.2);}'
+        'QPushButton {'
+        '  border: 1px solid rgba(100, 100, 100, 0.3);}')}
+
+_application = None
+
+
+def cases(offsets: tuple, themes: list) -> list:
+    """Every case of the grid, named like 'flip-8-shrinking-custom-open'
+
+    Near the flip width the layout depends on the hysteresis, so every
+    width is reached both growing from the minimum width and shrinking
+    from a wide window. Where the panel is docked, 'open' renders the
+    same as 'closed'.
+    """
+    grid = []
+    for theme in themes:
+        for offset in offsets:
+            position = f'flip{offset:+d}' if offset else 'flip'
+            for approach in ('growing', 'shrinking'):
+                for panel in ('closed', 'open'):
+                    grid.append({
+                        'name': f'{position}-{approach}-{theme}-{panel}',
+                        'offset': offset,
+                        'approach': approach,
+                        'theme': theme,
+                        'panel': panel})
+    return grid
+
+
+def distance(hash_a: str, hash_b: str) -> int:
+    """Number of differing bits of two hex hashes"""
+    return bin(int(hash_a, 16) ^ int(hash_b, 16)).count('1')
+
+
+def perceptual_hash(image: QtGui.QImage, hash_size: int) -> str:
+    """Difference hash of the image as hex
+
+    The image is shrunk to (hash_size + 1) x hash_size grey pixels, and
+    every bit tells whether a pixel is brighter than its right neighbour.
+    Small rendering noise leaves it unchanged, moved or resized widgets
+    flip bits.
+    """
+    image = image.convert_to_format(QtGui.QImage.Format_Grayscale8).scaled(
+        hash_size + 1, hash_size, QtCore.Qt.IgnoreAspectRatio,
+        QtCore.Qt.SmoothTransformation)
+    bits = 0
+    for y in range(hash_size):
+        row = [image.pixel_color(x, y).value() for x in range(hash_size + 1)]
+        for left, right in zip(row, row[1:]):
+            bits = (bits << 1) | (left > right)
+    return f'{bits:0{hash_size * hash_size // 4}x}'
+
+
+def render(case: dict, themes: dict, height: int, hash_size: int,
+           images: str = None) -> dict:
+    """Render one case in this process, returns its hash and timings"""
+    window = QtWidgetsMPX.QSidePanelApplicationWindow()
+    window.set_resize_coalescing_enabled(False)
+    window.set_panel_animation_duration(0)
+    theme = themes[case['theme']]
+    if theme is not None and os.path.isfile(theme):
+        window.set_style_sheet_file(theme)
+    elif theme is not None:
+        window.set_style_sheet(theme)
+
+    # Representative contents, fixed so that the renders are comparable
+    window.set_header_bar_title('Layout')
+    for index in range(3):
+        window.panel_layout().add_widget(
+            QtWidgets.QPushButton(f'Button {index}'))
+        window.frame_view_layout().add_widget(
+            QtWidgets.QLabel(f'Label {index}'))
+
+    flip_width = window.horizontal_and_vertical_flip_width()
+    if case['approach'] == 'growing':
+        window.resize(window.minimum_width(), height)
+    else:
+        window.resize(flip_width + 400, height)
+    window.show()
+    QtWidgets.QApplication.process_events()
+
+    start = time.perf_counter()
+    window.resize(flip_width + case['offset'], height)
+    QtWidgets.QApplication.process_events()
+    if case['panel'] == 'open':
+        window.open_panel()
+        QtWidgets.QApplication.process_events()
+    laid_out = time.perf_counter()
+    image = window.grab().to_image()
+    grabbed = time.perf_counter()
+
+    if images:
+        image.save(os.path.join(images, f'{case["name"]}.png'))
+    result = {
+        'name': case['name'],
+        'width': window.width(),
+        'hash': perceptual_hash(image, hash_size),
+        'layout_ms': (laid_out - start) * 1000,
+        'grab_ms': (grabbed - laid_out) * 1000}
+
+    window.set_style_sheet_file(None)
+    window.close()
+    window.delete_later()
+    QtWidgets.QApplication.process_events()
+    return result
+
+
+def _start_worker() -> None:
+    # Every worker process renders with its own offscreen application
+    global _application
+    _application = QtWidgets.QApplication(sys.argv[:1])
+
+
+def run(grid: list, themes: dict, height: int, hash_size: int,
+        jobs: int, images: str = None) -> list:
+    """Render the cases over a pool of jobs processes, in grid order"""
+    # Spawned, a forked Qt process is not safe to use
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs, initializer=_start_worker,
+            mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = [
+            executor.submit(render, x, themes, height, hash_size, images)
+            for x in grid]
+        return [x.result() for x in futures]
+
+
+def compare(results: list, references: dict, max_distance: int) -> list:
+    """Print every case against its reference, return the regressions"""
+    regressions = []
+    for result in results:
+        reference = references.get(result['name'])
+        if reference is None:
+            status, bits = 'new', ''
+        else:
+            bits = distance(result['hash'], reference)
+            status = 'REGRESSION' if bits > max_distance else 'ok'
+            if bits > max_distance:
+                regressions.append(result['name'])
+        print(f'  {result["name"]:<36} {result["width"]:>5}px '
+              f'layout {result["layout_ms"]:7.2f}ms '
+              f'grab {result["grab_ms"]:6.2f}ms  {status} {bits}',
+              file=sys.stderr)
+    return regressions
+
+
+def main() -> None:
+    """Render the grid, compare to the references or store them"""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument(
+        '--references', default=REFERENCES,
+        help='JSON file of reference hashes')
+    parser.add_argument(
+        '--update', action='store_true',
+        help='Store this run as the references instead of comparing')
+    parser.add_argument(
+        '--output', help='Write the results as JSON to this file')
+    parser.add_argument(
+        '--images', help='Save every render as PNG in this directory')
+    parser.add_argument(
+        '--theme-file', nargs='+', default=[], metavar='QSS',
+        help='Also render with these style sheet files')
+    parser.add_argument(
+        '--offsets', nargs='+', type=int, default=OFFSETS,
+        help='Widths to render, as offsets from the flip width')
+    parser.add_argument(
+        '--height', type=int, default=500, help='Window height')
+    parser.add_argument(
+        '--jobs', type=int, default=os.cpu_count(),
+        help='Number of render processes')
+    parser.add_argument(
+        '--hash-size', type=int, default=16,
+        help='Hash side, the hash has hash-size squared bits')
+    parser.add_argument(
+        '--distance', type=int, default=8,
+        help='Differing hash bits allowed before a case is a regression')
+    args = parser.parse_args()
+
+    themes = dict(THEMES)
+    for path in args.theme_file:
+        themes[os.path.splitext(os.path.basename(path))[0]] = (
+            os.path.abspath(path))
+    if args.images:
+        os.makedirs(args.images, exist_ok=True)
+
+    grid = cases(tuple(args.offsets), list(themes))
+    start = time.perf_counter()
+    results = run(
+        grid, themes, args.height, args.hash_size, max(1, args.jobs),
+        args.images)
+    elapsed = time.perf_counter() - start
+    print(f'{len(results)} cases in {elapsed:.2f}s with {args.jobs} jobs',
+          file=sys.stderr)
+
+    report = {
+        'metadata': {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pyside': PySide6.__version__,
+            'qt': QtCore.qVersion(),
+            'machine': platform.platform(),
+            'hash_size': args.hash_size},
+        'results': results}
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+
+    if args.update:
+        with open(args.references, 'w') as references:
+            json.dump({
+                'hash_size': args.hash_size,
+                'cases': {x['name']: x['hash'] for x in results}},
+                references, indent=2)
+        print(f'References written to {args.references}', file=sys.stderr)
+        sys.exit(0)
+
+    references = {}
+    if os.path.exists(args.references):
+        with open(args.references) as file:
+            stored = json.load(file)
+        if stored['hash_size'] != args.hash_size:
+            sys.exit(f'{args.references} has hashes of size '
+                     f'{stored["hash_size"]}, rerun with --update')
+        references = stored['cases']
+    print(f'Compared to {args.references}:', file=sys.stderr)
+    regressions = compare(results, references, args.distance)
+    if regressions:
+        print(f'{len(regressions)} layout regression(s): ' +
+              ', '.join(regressions), file=sys.stderr)
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PySide6 import QtWidgets
+
+SRC_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.append(SRC_DIR)
+
+from MPX import QtWidgetsMPX
+from __feature__ import snake_case
+
+
+@pytest.fixture(scope='session')
+def application() -> QtWidgets.QApplication:
+    """One offscreen application for the whole run"""
+    return (QtWidgets.QApplication.instance() or
+            QtWidgets.QApplication(sys.argv[:1]))
+
+
+@pytest.fixture
+def window(application) -> QtWidgetsMPX.QSidePanelApplicationWindow:
+    """A shown window, closed and deleted after the test"""
+    window = QtWidgetsMPX.QSidePanelApplicationWindow()
+    window.set_resize_coalescing_enabled(False)
+    window.set_panel_animation_duration(0)
+    window.resize(1200, 500)
+    window.show()
+    application.process_events()
+    yield window
+    window.close()
+    window.delete_later()
+    application.process_events()
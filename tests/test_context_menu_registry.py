@@ -0,0 +1,44 @@
+from PySide6 import QtCore, QtGui, QtTest, QtWidgets
+
+from MPX import QtWidgetsMPX
+from __feature__ import snake_case
+
+
+def _registry(calls: list) -> QtWidgetsMPX.QContextMenuRegistry:
+    registry = QtWidgetsMPX.QContextMenuRegistry()
+    registry.register('row', lambda menu: menu.add_target_action(
+        'Delete', calls.append, shortcut=QtGui.QKeySequence('Ctrl+D')))
+    return registry
+
+
+def test_shortcut_calls_the_action_for_the_target(application):
+    calls = []
+    registry = _registry(calls)
+    assert registry.trigger_shortcut(QtGui.QKeySequence('Ctrl+D'), 'a')
+    assert registry.trigger_shortcut(QtGui.QKeySequence('Ctrl+D'), 'b')
+    assert calls == ['a', 'b']
+    assert not registry.trigger_shortcut(QtGui.QKeySequence('Ctrl+E'))
+
+
+def test_disabled_action_is_skipped(application):
+    calls = []
+    registry = _registry(calls)
+    registry.menu('row').set_enabled(False)
+    assert not registry.trigger_shortcut(QtGui.QKeySequence('Ctrl+D'), 'a')
+    assert calls == []
+
+
+def test_shortcut_handler_routes_key_presses(application):
+    calls = []
+    registry = _registry(calls)
+    widget = QtWidgets.QLineEdit()
+    registry.install_shortcut_handler(widget, 'row')
+
+    QtTest.QTest.key_click(widget, QtCore.Qt.Key_D, QtCore.Qt.ControlModifier)
+    QtTest.QTest.key_click(widget, QtCore.Qt.Key_X)
+    assert calls == ['row']
+    assert widget.text() == 'x'
+
+    registry.remove_shortcut_handler(widget)
+    QtTest.QTest.key_click(widget, QtCore.Qt.Key_D, QtCore.Qt.ControlModifier)
+    assert calls == ['row']
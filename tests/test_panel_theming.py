@@ -0,0 +1,31 @@
+import pytest
+
+from MPX import QtWidgetsMPX
+from __feature__ import snake_case
+
+
+def _panel_pixel(window, application):
+    # Inside the docked panel, below its header bar
+    application.process_events()
+    image = window.grab().to_image()
+    return image.pixel_color(60, window.height() - 40).get_rgb()
+
+
+@pytest.mark.parametrize('alpha', (1, 0.5, 128, 255))
+def test_palette_mode_paints_the_style_sheet_colour(
+        window, application, alpha):
+    window.set_panel_color((200, 0, 0, alpha))
+    style_sheet_pixel = _panel_pixel(window, application)
+    window.set_panel_palette_mode_enabled(True)
+    palette_pixel = _panel_pixel(window, application)
+    assert palette_pixel == style_sheet_pixel
+
+
+@pytest.mark.parametrize('value, alpha', (
+    ('rgba(1, 2, 3, 1)', 255),
+    ('rgba(1, 2, 3, 0.5)', 128),
+    ('rgba(1, 2, 3, 0)', 0),
+    ('rgba(1, 2, 3, 128)', 128)))
+def test_rgba_alpha_follows_qt(value, alpha):
+    color = QtWidgetsMPX._style_sheet_compiler.color(value)
+    assert color.alpha() == alpha
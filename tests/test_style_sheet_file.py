@@ -0,0 +1,125 @@
+from PySide6 import QtCore, QtWidgets
+
+from MPX import QtWidgetsMPX
+from __feature__ import snake_case
+
+STYLE_SHEET = 'QPushButton { border: 1px solid rgba(1, 2, 3, 0.3); }'
+
+
+def _watcher(path):
+    return QtWidgetsMPX._style_sheet_watchers.watcher(path)
+
+
+def test_windows_share_the_watcher_until_the_last_releases(
+        tmp_path, application):
+    path = tmp_path / 'theme.qss'
+    path.write_text(STYLE_SHEET)
+    windows = [QtWidgetsMPX.QSidePanelApplicationWindow() for _ in range(2)]
+    for window in windows:
+        window.set_style_sheet_file(str(path))
+    watcher = _watcher(str(path))
+    assert watcher is not None
+
+    windows[0].set_style_sheet_file(None)
+    assert _watcher(str(path)) is watcher
+    windows[1].set_style_sheet_file(None)
+    assert _watcher(str(path)) is None
+
+
+def test_destroyed_window_releases_the_watcher(tmp_path, application):
+    path = tmp_path / 'theme.qss'
+    path.write_text(STYLE_SHEET)
+    window = QtWidgetsMPX.QSidePanelApplicationWindow()
+    window.set_style_sheet_file(str(path))
+    window.delete_later()
+    application.send_posted_events(None, QtCore.QEvent.DeferredDelete)
+    assert _watcher(str(path)) is None
+
+
+class _StyleChanges(QtCore.QObject):
+    def __init__(self, application):
+        super().__init__()
+        self.widgets = []
+        application.install_event_filter(self)
+
+    def event_filter(self, watched, event):
+        if event.type() == QtCore.QEvent.StyleChange:
+            self.widgets.append(watched)
+        return False
+
+
+def _reload(path, style_sheet):
+    path.write_text(style_sheet)
+    return _watcher(str(path)).reload()
+
+
+def test_window_rule_reload_sets_the_window_style_sheet(tmp_path, window):
+    path = tmp_path / 'theme.qss'
+    path.write_text('QApplicationWindow { background: rgb(1, 2, 3); }')
+    window.set_style_sheet_file(str(path))
+    assert 'rgb(1, 2, 3)' in window.style_sheet()
+
+    assert _reload(path, 'QApplicationWindow { background: rgb(4, 5, 6); }'
+                   ) == {'QApplicationWindow'}
+    assert 'rgb(4, 5, 6)' in window.style_sheet()
+
+    window.set_style_sheet_file(None)
+    assert 'rgb(4, 5, 6)' not in window.style_sheet()
+
+
+def test_reload_keeps_the_panel_color(tmp_path, window):
+    path = tmp_path / 'theme.qss'
+    path.write_text('QApplicationWindow { background: rgb(1, 2, 3); }')
+    window.set_style_sheet_file(str(path))
+    window.set_panel_color((200, 0, 0, 0.5))
+
+    _reload(path, 'QApplicationWindow { background: rgb(4, 5, 6); }')
+    assert window.panel_color() == (200, 0, 0, 0.5)
+    _reload(path, 'QApplicationWindow { background: rgb(4, 5, 6); }'
+            + STYLE_SHEET)
+    assert window.panel_color() == (200, 0, 0, 0.5)
+
+
+def test_reload_restyles_only_the_widgets_it_matches(
+        tmp_path, application, window):
+    path = tmp_path / 'theme.qss'
+    path.write_text(STYLE_SHEET + 'QLabel { color: rgb(1, 2, 3); }')
+    window.set_style_sheet_file(str(path))
+    application.process_events()
+    style_sheet = window.style_sheet()
+
+    changes = _StyleChanges(application)
+    assert _reload(path, STYLE_SHEET.replace('0.3', '0.4') +
+                   'QLabel { color: rgb(1, 2, 3); }') == {'QPushButton'}
+    assert window.find_children(QtWidgets.QPushButton) == []
+    assert changes.widgets == []
+    assert window.style_sheet() == style_sheet
+
+    label = QtWidgets.QLabel('Label')
+    window.frame_view_layout().add_widget(label)
+    application.process_events()
+    assert _reload(path, STYLE_SHEET + 'QLabel { color: rgb(4, 5, 6); }'
+                   ) == {'QPushButton', 'QLabel'}
+    assert label.palette().color(label.foreground_role()).red() == 4
+    assert set(changes.widgets) <= {label, *window.find_children(
+        QtWidgets.QLabel)}
+    assert window.style_sheet() == style_sheet
+
+
+def test_widgets_added_after_a_reload_get_its_rules(
+        tmp_path, application, window):
+    path = tmp_path / 'theme.qss'
+    path.write_text('QLabel { color: rgb(1, 2, 3); }')
+    window.set_style_sheet_file(str(path))
+    _reload(path, 'QLabel { color: rgb(4, 5, 6); }')
+
+    frame = QtWidgets.QFrame()
+    label = QtWidgets.QLabel('Label', frame)
+    window.frame_view_layout().add_widget(frame)
+    application.process_events()
+    assert label.palette().color(label.foreground_role()).red() == 4
+
+    _reload(path, 'QApplicationWindow { background: rgb(1, 2, 3); }'
+            'QLabel { color: rgb(4, 5, 6); }')
+    assert label.style_sheet() == ''
+    assert label.palette().color(label.foreground_role()).red() == 4
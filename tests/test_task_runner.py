@@ -0,0 +1,25 @@
+import time
+
+from PySide6 import QtWidgets
+
+from MPX import QtWidgetsMPX
+from __feature__ import snake_case
+
+
+def has_application() -> bool:
+    # Run in the pool: a forked process would inherit the application
+    return QtWidgets.QApplication.instance() is not None
+
+
+def test_process_task_runs_in_a_spawned_process(application):
+    runner = QtWidgetsMPX.QTaskRunner()
+    results = []
+    runner.submit(
+        'spawned', has_application, callback=results.append, process=True)
+    deadline = time.perf_counter() + 60
+    while not results and time.perf_counter() < deadline:
+        application.process_events()
+        time.sleep(0.01)
+    runner.shutdown()
+
+    assert results == [False]
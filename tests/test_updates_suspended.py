@@ -0,0 +1,45 @@
+from PySide6 import QtWidgets
+
+from MPX import QtWidgetsMPX
+from __feature__ import snake_case
+
+
+def test_nested_blocks_resume_on_outermost_exit(window):
+    with window.updates_suspended():
+        with window.updates_suspended():
+            assert not window.updates_enabled()
+        assert not window.updates_enabled()
+    assert window.updates_enabled()
+
+
+def test_layout_state_change_keeps_updates_suspended(window, application):
+    window.set_breakpoints([
+        QtWidgetsMPX.QBreakpoint('compact', 0, 'overlay'),
+        QtWidgetsMPX.QBreakpoint('wide', 800)])
+    with window.updates_suspended():
+        window.resize(600, 500)
+        application.process_events()
+        assert window.layout_state().name == 'compact'
+        assert not window.updates_enabled()
+    assert window.updates_enabled()
+
+
+def test_updates_resume_after_exception(window):
+    try:
+        with window.updates_suspended():
+            with window.updates_suspended():
+                raise RuntimeError
+    except RuntimeError:
+        pass
+    assert window.updates_enabled()
+
+
+def test_contents_added_in_block_are_laid_out_on_exit(window, application):
+    with window.updates_suspended():
+        for index in range(20):
+            window.panel_layout().add_widget(
+                QtWidgets.QPushButton(f'Button {index}'))
+    application.process_events()
+    buttons = window.panel_layout().parent_widget().find_children(
+        QtWidgets.QPushButton)
+    assert all(x.is_visible() and x.height() > 0 for x in buttons)
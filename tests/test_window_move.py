@@ -0,0 +1,93 @@
+import time
+
+import pytest
+from PySide6 import QtCore
+
+from __feature__ import snake_case
+
+FRAME_MS = 16
+
+
+def _wait(application, ms: int) -> None:
+    deadline = time.perf_counter() + ms / 1000
+    while time.perf_counter() < deadline:
+        application.process_events()
+        QtCore.QThread.msleep(1)
+
+
+def _drag(window, application, steps: int = 1000) -> float:
+    # Returns the drag duration in ms, the last coalesced signal included
+    origin = window.pos()
+    start = time.perf_counter()
+    for step in range(steps):
+        window.move(origin.x() + step % 200, origin.y() + step // 200)
+        application.process_events()
+    _wait(application, FRAME_MS * 2)
+    return (time.perf_counter() - start) * 1000
+
+
+def _adaptive_window_with_open_panel(window, application):
+    window.resize(400, 500)
+    application.process_events()
+    assert window.layout_state().panel_mode == 'overlay'
+    opened = []
+    window.panel_opened_signal.connect(opened.append)
+    window.open_panel()
+    _wait(application, FRAME_MS * 2)
+    assert opened
+    return window
+
+
+def test_coalesced_drag_signals_at_most_once_per_frame(window, application):
+    window = _adaptive_window_with_open_panel(window, application)
+    window.set_move_coalescing_enabled(True)
+    times = []
+    window.move_event_signal.connect(
+        lambda _: times.append(time.perf_counter() * 1000))
+
+    elapsed = _drag(window, application)
+
+    assert times
+    assert len(times) <= elapsed / FRAME_MS + 1
+    # Coarse timers may fire up to 5% early
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert all(x >= FRAME_MS * 0.9 for x in gaps), gaps
+
+
+def test_drag_does_not_move_the_overlay(window, application):
+    window = _adaptive_window_with_open_panel(window, application)
+    window.set_move_coalescing_enabled(True)
+    window.set_instrumentation_enabled(True)
+    window.instrumentation().reset()
+
+    _drag(window, application)
+
+    overlay = window.instrumentation().stats().get('overlay', {})
+    assert not any(
+        overlay.get(x, {}).get('count', 0)
+        for x in ('move', 'resize', 'layout')), overlay
+    window.set_instrumentation_enabled(False)
+
+
+@pytest.mark.parametrize('coalesced', (False, True))
+def test_move_from_slot_is_answered_on_the_next_frame(
+        window, application, coalesced):
+    window = _adaptive_window_with_open_panel(window, application)
+    window.set_move_coalescing_enabled(coalesced)
+    depth = []
+    calls = []
+
+    def snap(event) -> None:
+        # Moves the window again from inside the signal, a few times
+        depth.append(None)
+        calls.append(len(depth))
+        if len(calls) < 5:
+            window.move(window.pos() + QtCore.QPoint(1, 0))
+        depth.pop()
+
+    window.move_event_signal.connect(snap)
+    window.move(window.pos() + QtCore.QPoint(1, 0))
+    _wait(application, FRAME_MS * 10)
+
+    assert calls == [1] * len(calls)
+    assert 1 <= len(calls) <= 5
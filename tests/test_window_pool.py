@@ -0,0 +1,68 @@
+import sys
+import time
+
+import shiboken6
+from PySide6 import QtCore, QtWidgets
+
+from MPX import QtWidgetsMPX
+from __feature__ import snake_case
+
+
+class DocumentWindow(QtWidgetsMPX.QSidePanelApplicationWindow):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.wide_modes = []
+        self.build_contents()
+
+    def build_contents(self) -> None:
+        self.set_header_bar_title('Document')
+        self.frame_view_layout().add_widget(QtWidgets.QLabel('Contents'))
+        self.wide_mode_signal.connect(self.wide_modes.append)
+
+
+def _labels(window) -> list:
+    return [x.text() for x in window.find_children(QtWidgets.QLabel)
+            if not x.is_hidden()]
+
+
+def _settle(application, ms: int = 30) -> None:
+    deadline = time.perf_counter() + ms / 1000
+    while time.perf_counter() < deadline:
+        # Deletions first, as when the window is closed inside exec()
+        application.send_posted_events(None, QtCore.QEvent.DeferredDelete)
+        application.process_events()
+        QtCore.QThread.msleep(1)
+
+
+def test_recycled_subclass_matches_a_new_window(application):
+    pool = QtWidgetsMPX.QWindowPool(DocumentWindow, size=1)
+    window = pool.acquire()
+    window.frame_view_layout().add_widget(QtWidgets.QLabel('Added'))
+    window.show()
+    window.close()
+    _settle(application)
+
+    assert pool.acquire() is window
+    assert pool.stats()['recycled'] == 1
+    assert _labels(window) == _labels(DocumentWindow())
+    window.wide_mode_signal.emit('wide-mode-signal')
+    assert window.wide_modes == ['wide-mode-signal']
+    pool.clear()
+
+
+def test_window_deleted_after_close_is_not_recycled(
+        application, monkeypatch):
+    errors = []
+    monkeypatch.setattr(
+        sys, 'excepthook', lambda *args: errors.append(args[1]))
+    pool = QtWidgetsMPX.QWindowPool(size=1)
+    window = pool.acquire()
+    window.show()
+    window.close()
+    window.delete_later()
+    _settle(application)
+
+    assert errors == []
+    assert pool.stats()['recycled'] == 0
+    assert shiboken6.isValid(pool.acquire())
+    pool.clear()